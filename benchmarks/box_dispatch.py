@@ -0,0 +1,69 @@
+"""Compares the event dispatch of Box with the former callback dictionary.
+
+Up to version 0.0.3, Box stored one callback function per event in a
+dictionary and called it directly. Now the events are regular Kivy
+events dispatched by dispatch(). The script times both paths for a
+press with no listener and with one listener, and the Kivy path with
+several listeners, which the dictionary did not support.
+
+Usage:
+    python benchmarks/box_dispatch.py [repetitions]
+"""
+
+import sys
+from timeit import repeat
+
+from kivy.base import EventLoop
+EventLoop.ensure_window()
+
+from cucoloris import Box
+
+REPETITIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+
+class DictBox:
+    """Replica of the dispatch path of Box up to version 0.0.3."""
+
+    def __init__(self):
+        self.callbacks = {'on_enter': None,
+                          'on_leave': None,
+                          'on_press': None,
+                          'on_release': None,
+                          'on_drag': None}
+
+    def press(self, touch):
+        if self.callbacks['on_press']:
+            self.callbacks['on_press'](touch)
+
+
+def measure(statement, namespace) -> float:
+    """Returns the best time per call in microseconds."""
+    times = repeat(statement, globals = namespace, number = REPETITIONS, repeat = 5)
+    return min(times) / REPETITIONS * 1e6
+
+
+def main():
+    touch       = object()
+    listener    = lambda *_: None
+    rows        = []
+
+    old = DictBox()
+    rows.append(('dictionary, no listener', measure('box.press(touch)', {'box': old, 'touch': touch})))
+    old.callbacks['on_press'] = listener
+    rows.append(('dictionary, 1 listener', measure('box.press(touch)', {'box': old, 'touch': touch})))
+
+    new = Box()
+    namespace = {'box': new, 'touch': touch}
+    rows.append(('dispatch, no listener', measure("box.dispatch('on_press', touch)", namespace)))
+    new.bind(on_press = listener)
+    rows.append(('dispatch, 1 listener', measure("box.dispatch('on_press', touch)", namespace)))
+    for _ in range(4):
+        new.bind(on_press = lambda *_: None)
+    rows.append(('dispatch, 5 listeners', measure("box.dispatch('on_press', touch)", namespace)))
+
+    for name, microseconds in rows:
+        print('{:<26} {:>7.3f} us per event'.format(name, microseconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Measures the frame time of 200 FormControls on screen.
+
+Each FormControl clips its text with a ScrollPane, which sits inside an
+outer ScrollArea filling the window. The controls are laid out in a grid
+of 10 by 20 that is only slightly taller than the window, so nearly all
+of them are on screen in every frame while the outer area is scrolled
+up and down. The script runs once for each clip_mode of the panes and
+reports the median and the maximum time per frame.
+
+Each frame ends with glFinish(), so the time includes the work of the
+GPU driver. The script prints the OpenGL renderer. With a software
+renderer like llvmpipe, or on a headless machine, all of the work runs
+on the CPU and the numbers are CPU-only. They then do not show the
+savings of the scissor test on a real GPU, especially a low-end one.
+
+Usage:
+    python benchmarks/formcontrol_clip.py [frames]
+"""
+
+import sys
+from time import perf_counter
+
+from kivy.base import EventLoop
+EventLoop.ensure_window()
+from kivy.core.window import Window
+from kivy.graphics.opengl import GL_RENDERER, glFinish, glGetString
+from kivy.uix.gridlayout import GridLayout
+
+from cucoloris import FormControl, ScrollArea
+
+FRAMES      = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+COLUMNS     = 10
+ROWS        = 20
+
+
+def measure(mode:str) -> list:
+    """Returns the frame times in seconds for the given clip_mode."""
+    outer       = ScrollArea(size_hint = (None, None))
+    outer.size  = Window.size
+    width       = Window.width // COLUMNS
+    height      = (Window.height + 40) // ROWS
+    grid        = GridLayout(cols = COLUMNS, size_hint = (None, None),
+                             size = (width * COLUMNS, height * ROWS))
+    controls    = []
+    for index in range(COLUMNS * ROWS):
+        control = FormControl(num_lines = 2, text = 'Control ' + str(index) + '\nSecond line')
+        control._scroll.clip_mode = mode
+        controls.append(control)
+        grid.add_widget(control)
+    outer.add_widget(grid)
+    Window.add_widget(outer)
+    for _ in range(5):
+        EventLoop.idle()
+    # The kv rule sizes a control by its font. Afterwards, it keeps the
+    # size set here.
+    for control in controls:
+        control.size = (width - 2, height - 2)
+    EventLoop.idle()
+
+    times = []
+    for frame in range(FRAMES):
+        outer.scroll_y = abs(1 - 2 * frame / (FRAMES - 1))
+        start = perf_counter()
+        EventLoop.idle()
+        glFinish()
+        times.append(perf_counter() - start)
+    Window.remove_widget(outer)
+    return sorted(times)
+
+
+def main():
+    print('renderer:', glGetString(GL_RENDERER).decode())
+    for mode in ('stencil', 'scissor', 'auto'):
+        times = measure(mode)
+        print('{:<8} median {:6.2f} ms, max {:6.2f} ms per frame'.format(
+            mode, times[len(times) // 2] * 1000, times[-1] * 1000))
+
+
+if __name__ == '__main__':
+    main()
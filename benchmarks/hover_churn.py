@@ -0,0 +1,70 @@
+"""Checks that hover tracking does not grow with widget churn.
+
+Creates and destroys Box widgets listening to 'on_enter' over many
+cycles. Each Box sits inside a container that is removed from the window
+but kept alive for a while, like a cached screen. The script reports the
+allocated memory and the number of tracked widgets after every tenth of
+the cycles and fails, if either keeps growing.
+
+Usage:
+    python benchmarks/hover_churn.py [cycles]
+"""
+
+import gc
+import sys
+import tracemalloc
+from collections import deque
+
+from kivy.base import EventLoop
+EventLoop.ensure_window()
+from kivy.core.window import Window
+from kivy.uix.widget import Widget
+
+from cucoloris import Box
+from cucoloris._hover import Hover
+
+CYCLES      = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+KEPT        = 100
+"""Number of removed containers kept alive at any time."""
+
+TOLERANCE   = 512 * 1024
+"""Allowed growth of the allocated memory in bytes after warming up."""
+
+
+def main():
+    root = Widget()
+    Window.add_widget(root)
+    kept = deque(maxlen = KEPT)
+    tracemalloc.start()
+    samples = []
+    for cycle in range(1, CYCLES + 1):
+        container = Widget()
+        box = Box(size = (50, 50))
+        box.bind(on_enter = lambda *_: None)
+        container.add_widget(box)
+        root.add_widget(container)
+        Window.mouse_pos = (cycle % 50, 25)
+        root.remove_widget(container)
+        kept.append(container)
+        Window.mouse_pos = (25, cycle % 50)
+        if cycle % 100 == 0:
+            # Runs the clock events the widgets scheduled.
+            EventLoop.idle()
+        if cycle % (CYCLES // 10) == 0:
+            gc.collect()
+            current, _ = tracemalloc.get_traced_memory()
+            samples.append(current)
+            print('cycle {:>7}: {:>9.1f} KiB allocated, {} tracked, {} dormant'.format(
+                cycle, current / 1024, len(Hover._widgets), len(Hover._dormant)))
+    Window.remove_widget(root)
+
+    growth = samples[-1] - samples[1]
+    print('growth after warm-up: {:.1f} KiB'.format(growth / 1024))
+    if growth > TOLERANCE or len(Hover._widgets) > 0 or len(Hover._dormant) > KEPT:
+        print('FAILED')
+        sys.exit(1)
+    print('OK')
+
+
+if __name__ == '__main__':
+    main()
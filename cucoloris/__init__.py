@@ -1,10 +1,19 @@
 from ._box import Box
+from ._box import DragInfo
+from ._boxbatch import BoxBatch
 from ._colorlabel import ColorLabel
 from ._scrollbar import ScrollBar
 from ._scrollarea import ScrollArea
+from ._scrollpane import ScrollPane
 from ._colorarea import ColorArea
+from ._transition import Transition
+from ._updatequeue import UpdateQueue
+from ._progressivebuilder import ProgressiveBuilder
+from ._template import Template
+from ._widgetpool import WidgetPool
 from .button import Btn
 from .markupinput import MarkupInput
 from .plaininput import PlainInput
 from .formcontrol import FormControl
+from .fileviewer import FileViewer
 from .background import *
\ No newline at end of file
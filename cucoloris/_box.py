@@ -4,26 +4,100 @@ This module defines a basic box with optional shadow. It has separate
 shadow, border and fill colors as well as rounded corners.
 The box is composed of three ColorArea widgets which are set up as
 public attributes so that they can be accessed and modified
-individually.
+individually. The shadow is only created once it is shown for the first
+time. Layers that are completely covered by another one of the same
+color are not drawn.
 """
 
 # Import of built-in Python modules.
+from contextlib import contextmanager as _contextmanager
+from contextlib import ExitStack as _ExitStack
+from functools import partial as _partial
+from inspect import Parameter as _Parameter
+from inspect import signature as _signature
+from math import exp as _exp
 from os.path import dirname as _dirname
+from os.path import join as _join
+from typing import Callable as _Callable
 from typing import List as _List
+from warnings import warn as _warn
 
 # Inport of third-party modules
-from kivy.core.window import Window as _Window
+from kivy.animation import Animation as _Animation
+from kivy.clock import Clock as _Clock
+from kivy.graphics import InstructionGroup as _InstructionGroup
 from kivy.input.motionevent import MotionEvent as _MotionEvent
 from kivy.lang.builder import Builder as _Builder
 from kivy.properties import ListProperty as _ListProperty
 from kivy.properties import NumericProperty as _NumericProperty
 from kivy.properties import ObjectProperty as _ObjectProperty
+from kivy.properties import OptionProperty as _OptionProperty
 from kivy.uix.widget import Widget as _Widget
 
+from ._colorarea import ColorArea as _ColorArea
+from ._hover import Hover as _Hover
+from ._render import Render as _Render
+from ._transition import Transition as _Transition
+from ._visibility import Visibility as _Visibility
 
-_Builder.load_file(_dirname(__file__) + '\\_box.kv')
 
-class Box(_Widget):
+_Builder.load_file(_join(_dirname(__file__), '_box.kv'))
+
+class DragInfo:
+    """Dragging movement of a touch accumulated over one frame.
+
+    If the drag_mode of a Box widget is 'frame', the 'on_drag' event is
+    dispatched at most once per frame and per touch with an instance of
+    this class instead of the touch itself.
+
+    Attributes:
+        touch: The dragging touch.
+        pos: The latest position of the touch.
+        delta: The movement of the touch since the last 'on_drag' event.
+        velocity: The smoothed velocity of the touch in pixels per
+        second. It can be used for kinetic scrolling after the release.
+        moves: The number of movements accumulated in delta.
+    """
+
+    def __init__(self, touch:_MotionEvent):
+        """Initialization method of the class.
+
+        Args:
+            touch: The touch that pressed the Box widget.
+        """
+        self.touch      = touch
+        self.pos        = tuple(touch.pos)
+        self.delta      = (0, 0)
+        self.velocity   = (0, 0)
+        self.moves      = 0
+        self._time      = touch.time_update
+
+    def add(self, touch:_MotionEvent, smoothing:float):
+        """Accumulates a movement of the touch.
+
+        The velocity is smoothed exponentially, i.e. older movements
+        lose their weight within the given time, no matter how often
+        the input device reports movements.
+
+        Args:
+            touch: The moved touch.
+            smoothing: The time constant of the smoothing in seconds.
+        """
+        # A released touch carries the time of the release in time_end.
+        now             = max(touch.time_update, touch.time_end)
+        dx, dy          = touch.x - self.pos[0], touch.y - self.pos[1]
+        elapsed         = now - self._time
+        self._time      = now
+        self.pos        = tuple(touch.pos)
+        self.delta      = (self.delta[0] + dx, self.delta[1] + dy)
+        self.moves     += 1
+        if elapsed > 0:
+            weight          = 1 - _exp(-elapsed / smoothing)
+            vx, vy          = self.velocity
+            self.velocity   = (vx + weight*(dx/elapsed - vx), vy + weight*(dy/elapsed - vy))
+
+
+class Box(_Visibility, _Widget):
     """Widget for a basic box shape.
 
     The widget represents a basic box with optional shadow. It has
@@ -36,9 +110,15 @@ class Box(_Widget):
 
     The box can detect touch and hover events that can be used to
     trigger custom color transitions and size changes from any derived
-    class.
+    class. The events on_enter, on_leave, on_press, on_release and
+    on_drag are regular Kivy events, i.e. any number of callback
+    functions can be bound to them. A hidden box, i.e. one whose
+    visible attribute is False, detects neither touch nor hover events,
+    and neither do its children.
     """
 
+    __events__          = ('on_enter', 'on_leave', 'on_press', 'on_release', 'on_drag')
+
     # Geometry
     radius              = _ListProperty()
     """The radius of each corner of the widget in pixels.
@@ -98,6 +178,40 @@ class Box(_Widget):
     component can transition to another color, if needed.
     """
 
+    # Input
+    touch_policy        = _OptionProperty('propagate', options=['propagate', 'consume'])
+    """Determines how the widget handles touches.
+
+    * propagate: Every touch is passed on to the children first. If
+    none of them consumes it, a touch on the widget presses it.
+    Afterwards, the touch is offered to the siblings of the widget,
+    unless one of the children consumed it.
+    * consume: Touches outside of the widget are not passed on to its
+    children. A touch on the widget is passed on to the children first.
+    If none of them consumes it, the widget is pressed and consumes the
+    touch itself, i.e. it is not offered to any other widget.
+
+    With either policy, only a widget that was pressed receives the
+    release and the dragging movements of that touch.
+    """
+
+    drag_mode           = _OptionProperty('raw', options=['raw', 'frame'])
+    """Determines how dragging movements are reported.
+
+    * raw: The 'on_drag' event is dispatched with the touch for every
+    movement reported by the input device.
+    * frame: Movements are accumulated and the 'on_drag' event is
+    dispatched at most once per frame with a DragInfo instance. On
+    release, a last one is dispatched right before the 'on_release'
+    event, carrying the velocity at the time of the release.
+
+    Input devices may report movements several times per frame. The
+    frame mode suits handlers doing heavy work, e.g. relayouts.
+    """
+
+    DRAG_SMOOTHING      = 0.05
+    """Time constant in seconds for smoothing the dragging velocity."""
+
     # Child Widgets
     fill                = _ObjectProperty()
     """The ColorArea widget representing the fill color.
@@ -115,12 +229,14 @@ class Box(_Widget):
     directly through this attribute for more control.
     """
 
-    shadow              = _ObjectProperty()
+    shadow              = _ObjectProperty(None, allownone=True)
     """The ColorArea widget representing the shadow.
 
     The widget is composed of three ColorArea widgets. The outermost
     widget represents the shadow. It can be accessed directly through
-    this attribute for more control.
+    this attribute for more control. Since most widgets never show a
+    shadow, it is created by the first call of show_shadow(). Until
+    then, the attribute is None.
     """
 
     def __init__(self, *args, **kwargs):
@@ -133,57 +249,392 @@ class Box(_Widget):
             *args: Positional arguments passed on to the base class.
             **kwargs: Keyed arguments passed on to the base class.
         """
+        self._trigger_overdraw  = _Clock.create_trigger(self._check_overdraw, -1)
+        self._trigger_layout    = _Clock.create_trigger(self._do_layout, -1)
+        self._legacy            = {}
+        self._batch_depth       = 0
+        self._layout_pending    = False
+        self._inside            = False
+        self._pressed           = set()
+        self._shadow_shown      = False
+        self._drags             = {}
+        self._trigger_drag      = _Clock.create_trigger(self._flush_drags, -1)
         super(Box, self).__init__(*args, **kwargs)
-        _Window.bind(mouse_pos = self.on_mouse_pos)
-        self._inside      = False
-        self._pressed     = False
-        self.callbacks    = {   'on_enter': None,
-                                'on_leave': None,
-                                'on_press': None,
-                                'on_release': None,
-                                'on_drag': None}
+        # Empty group right before the canvas of the border. The shadow is
+        # drawn after it, even while the border is detached.
+        self._shadow_anchor     = _InstructionGroup()
+        self.canvas.insert(max(self.canvas.indexof(self.border.canvas), 0), self._shadow_anchor)
+        self.fbind('parent', self._update_hover)
+        self.fbind('border_width', self._trigger_overdraw)
+        for name in ('pos', 'size', 'radius', 'border_width', 'shadow_width'):
+            self.fbind(name, self._on_geometry)
+        for name in ('fill_color', 'border_color', 'shadow_color', 'transition'):
+            self.fbind(name, self._update_colors)
+        for layer in (self.fill, self.border):
+            self._watch_layer(layer)
+        self._update_colors()
+        self._do_layout()
 
     def bind(self, **kwargs):
-        """Bind a callback function to one an event.
+        """Binds callback functions to events or properties.
 
-        The Box widget can react to multiple events and call a specified
-        callback function whenever such an event occurs. The following
-        events are available:
+        The method works like the one of any other Kivy widget, i.e.
+        any number of callback functions may be bound to the same event
+        or property. In contrast to Kivy, an unknown event name raises an
+        exception instead of being ignored silently. The Box widget
+        provides the following events:
         * on_enter: The mouse enters the widget space.
         * on_leave: The mouse leaves the widget space.
-        * on_down: There is a touch or click on the widget.
+        * on_press: There is a touch or click on the widget.
         * on_release: The touch or click is released.
         * on_drag: There was a touch or click on the widget and the
         input device is now moved without releasing the touch or click.
 
+        Binding to 'on_enter' or 'on_leave' starts hover tracking right
+        away. Callback functions bound by fbind(), e.g. by kv rules, are
+        noticed once the widget is added to a widget tree.
+
+        Callback functions of these events taking a single argument, as
+        up to version 0.0.3, are deprecated. They are still called with
+        the event argument only, but a DeprecationWarning is issued.
+        This will be removed in the next release.
+
         Args:
-            **kwargs: Keyed argument list to be passed on to the bound
-            callback function.
+            **kwargs: Event or property names mapped to the callback
+            functions to bind.
         """
         for key in kwargs:
-            if not key in self.callbacks:
-                Exception("Event " + key + " is unknwon.")
-            self.callbacks[key] = kwargs[key]
+            if key[:3] == 'on_' and not self.is_event_type(key):
+                raise Exception("Event " + key + " is unknown.")
+        for key, callback in list(kwargs.items()):
+            if key in Box.__events__ and Box._takes_event_only(callback):
+                _warn('Box: Callback functions of ' + key + ' taking the event argument '
+                      'only are deprecated. Add the widget as first argument.',
+                      DeprecationWarning, stacklevel = 2)
+                kwargs[key] = self._legacy.setdefault((key, callback),
+                                                      _partial(Box._call_legacy, callback))
+        super(Box, self).bind(**kwargs)
+        if 'on_enter' in kwargs or 'on_leave' in kwargs:
+            self._update_hover()
+
+    def unbind(self, **kwargs):
+        """Unbinds callback functions from events or properties.
+
+        The method works like the one of any other Kivy widget. Hover
+        tracking stops once nobody listens to 'on_enter' or 'on_leave'
+        anymore.
+
+        Args:
+            **kwargs: Event or property names mapped to the callback
+            functions to unbind.
+        """
+        for key, callback in list(kwargs.items()):
+            if (key, callback) in self._legacy:
+                kwargs[key] = self._legacy.pop((key, callback))
+        super(Box, self).unbind(**kwargs)
+        if 'on_enter' in kwargs or 'on_leave' in kwargs:
+            self._update_hover()
+
+    @staticmethod
+    def _takes_event_only(callback:_Callable) -> bool:
+        """Determines whether a callback function has the old signature.
+
+        Args:
+            callback: A callback function given to bind().
+
+        Returns:
+            bool: True, if the function takes exactly one positional
+            argument. False, otherwise.
+        """
+        try:
+            parameters = _signature(callback).parameters.values()
+        except (TypeError, ValueError):
+            return False
+        kinds = [parameter.kind for parameter in parameters]
+        if _Parameter.VAR_POSITIONAL in kinds:
+            return False
+        return len([kind for kind in kinds if kind in (_Parameter.POSITIONAL_ONLY,
+                    _Parameter.POSITIONAL_OR_KEYWORD)]) == 1
+
+    @staticmethod
+    def _call_legacy(callback:_Callable, _, *args):
+        """Calls a deprecated callback function without the widget.
+
+        Args:
+            callback: The callback function given to bind().
+            *args: The arguments of the event.
+        """
+        return callback(*args)
+
+    def on_visible(self, _, visible:bool):
+        """Callback for showing or hiding the widget.
+
+        A hidden box is neither hovered nor pressed anymore. If the
+        cursor hovered over the box, the 'on_leave' event is dispatched.
+
+        Args:
+            visible: True, if the widget is shown. False, otherwise.
+        """
+        super(Box, self).on_visible(_, visible)
+        if visible:
+            return
+        self._pressed   = set()
+        self._drags     = {}
+        if self._inside:
+            self._inside = False
+            self.dispatch('on_leave', False)
+
+    def reset(self):
+        """Returns the widget to its resting state.
 
-    def show_shadow(self):
+        The box is neither hovered nor pressed anymore, without any event
+        being dispatched. The shadow is removed and created again by the
+        next call of show_shadow(). Running transitions are stopped, so
+        that anyone awaiting them resumes, and the layers show their
+        nominal colors right away. The method is called by WidgetPool
+        before a widget is parked.
+        """
+        self._pressed       = set()
+        self._inside        = False
+        self._drags         = {}
+        self._shadow_shown  = False
+        self._trigger_drag.cancel()
+        if self.shadow:
+            _Animation.stop_all(self.shadow)
+            if self.shadow.parent is self:
+                self.remove_widget(self.shadow)
+            self.shadow = None
+        layers = [layer for layer in (self.border, self.fill) if layer]
+        for layer in layers:
+            _Animation.stop_all(layer)
+        self._update_colors()
+        for layer in layers:
+            layer.canvas_color.rgba = layer.color
+            layer._hsv              = layer.canvas_color.hsv
+        self._do_layout()
+
+    @_contextmanager
+    def batch_update(self):
+        """Context manager for changing several geometry attributes.
+
+        The layers of the box are laid out again whenever one of pos,
+        size, radius, border_width or shadow_width changes. Within the
+        context, the layout is held back and done once on exit, e.g.:
+        ```py
+        with box.batch_update():
+            box.pos     = [10, 10]
+            box.size    = [120, 40]
+            box.radius  = [6, 6, 6, 6]
+        ```
+        The contexts may be nested.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._layout_pending:
+                self._do_layout()
+
+    @staticmethod
+    @_contextmanager
+    def batch_update_tree(widget:_Widget):
+        """Context manager for batch updates of a whole widget tree.
+
+        Enters batch_update() of every Box widget in the tree of the
+        given widget, including the widget itself. This is useful for
+        relayouts that move and resize many boxes at once.
+
+        Args:
+            widget: The root of the widget tree.
+        """
+        with _ExitStack() as stack:
+            for child in widget.walk(restrict = True):
+                if isinstance(child, Box):
+                    stack.enter_context(child.batch_update())
+            yield widget
+
+    def show_shadow(self) -> _Transition:
         """Highlights the widget by a shadow.
 
         The box widget can be highlighted by a shadow in order to
         indicate focus. The shadow smoothly appears from behind the
         widget. If focus is lost, the shadow can disappear.
         This method highlights the widget by a shadow.
+
+        Returns:
+            Transition: A handle that can be awaited or cancelled.
         """
-        self.shadow.resize(self.size)
+        self._flush_layout()
+        if not self.shadow:
+            self._create_shadow()
+        self._shadow_shown = True
+        return self.shadow.resize(self.size)
 
-    def hide_shadow(self):
+    def hide_shadow(self) -> _Transition:
         """Hides the shadow of the widget.
 
         The box widget can be highlighted by a shadow in order to
         indicate focus. The shadow smoothly appears from behind the
         widget. If focus is lost, the shadow can be hidden by using
         this method.
+
+        Returns:
+            Transition: A handle that can be awaited or cancelled. It is
+            complete right away, if the shadow was never shown.
+        """
+        self._shadow_shown = False
+        if not self.shadow:
+            return _Transition()
+        self._flush_layout()
+        return self.shadow.resize(self.border.size, self.border.radius)
+
+    def _create_shadow(self):
+        """Creates the shadow layer behind the border and the fill.
+
+        The shadow starts hidden behind the border. It follows the
+        geometry, the color and the transition time of the widget.
+        """
+        self.shadow = _ColorArea(color = self.shadow_color, transition = self.transition)
+        self.add_widget(self.shadow, index = len(self.children))
+        # Kivy places the canvas next to the one of the last child, which
+        # is missing while the border is detached.
+        self.canvas.remove(self.shadow.canvas)
+        self.canvas.insert(self.canvas.indexof(self._shadow_anchor) + 1, self.shadow.canvas)
+        self._layout_shadow()
+        self._watch_layer(self.shadow)
+
+    def _on_geometry(self, *_):
+        """Schedules the layout of the layers.
+
+        The layout is done once per frame, no matter how many geometry
+        attributes changed in between. Within batch_update(), it is held
+        back until the context is left.
+        """
+        if self._batch_depth:
+            self._layout_pending = True
+            return
+        self._trigger_layout()
+
+    def _flush_layout(self):
+        """Lays out the layers right away, if a layout is pending.
+
+        Methods reading the geometry of the layers call this first, so
+        that they do not see the geometry of the previous frame.
         """
-        self.shadow.resize(self.border.size, self.border.radius)
+        if self._layout_pending or self._trigger_layout.is_triggered:
+            self._trigger_layout.cancel()
+            self._do_layout()
+
+    def _do_layout(self, *_):
+        """Places border, fill and shadow according to the geometry.
+
+        The border covers the widget except for the space reserved for
+        the shadow. The fill lies inside the border.
+        """
+        self._layout_pending    = False
+        border, fill            = self.border, self.fill
+        if not border or not fill:
+            return
+        x, y                    = self.pos
+        width, height           = self.size
+        swidth, bwidth          = self.shadow_width, self.border_width
+        inset                   = swidth + bwidth
+        border.pos              = (x + swidth, y + swidth)
+        border.size             = (width - swidth*2, height - swidth*2)
+        border.radius           = self.radius
+        fill.pos                = (x + inset, y + inset)
+        fill.size               = (width - inset*2, height - inset*2)
+        fill.radius             = tuple(max(radius - bwidth, 0) for radius in self.radius)
+        if self.shadow:
+            self._layout_shadow()
+
+    def _update_colors(self, *_):
+        """Passes colors and transition time on to the layers."""
+        self.fill.color         = self.fill_color
+        self.fill.transition    = self.transition
+        self.border.color       = self.border_color
+        self.border.transition  = self.transition
+        if self.shadow:
+            self.shadow.color       = self.shadow_color
+            self.shadow.transition  = self.transition
+
+    def _layout_shadow(self, *_):
+        """Places the shadow according to the widget's geometry.
+
+        A hidden shadow lies behind the border. A visible one covers the
+        whole widget.
+        """
+        if self._shadow_shown:
+            self.shadow.pos     = self.pos
+            self.shadow.size    = self.size
+            return
+        x, y                = self.pos
+        width               = self.shadow_width
+        self.shadow.pos     = (x + width, y + width)
+        self.shadow.size    = (self.size[0] - width*2, self.size[1] - width*2)
+        self.shadow.radius  = tuple(radius + width for radius in self.radius)
+
+    def _watch_layer(self, layer:_ColorArea):
+        """Checks for redundant layers whenever the given layer changes.
+
+        Color transitions change the color of the canvas through color
+        and _hsv, so both are followed.
+
+        Args:
+            layer: One of the ColorArea widgets of the box.
+        """
+        if not layer:
+            return
+        for name in ('color', '_hsv', 'pos', 'size'):
+            layer.fbind(name, self._trigger_overdraw)
+        self._trigger_overdraw()
+
+    def _check_overdraw(self, *_):
+        """Skips drawing layers that are hidden by another layer.
+
+        Each layer is a full rounded rectangle drawn on top of the
+        previous one. A layer is detached from rendering as long as it
+        cannot be seen, and attached again as soon as it can:
+
+        * border: The border has no width and the fill is opaque.
+        * fill: The fill has the same color as the opaque border below.
+        * shadow: The shadow is transparent, or it is hidden behind the
+        opaque border.
+
+        The colors of the canvas are compared, so this also applies while
+        colors are transitioning.
+        """
+        fill, border, shadow = self.fill, self.border, self.shadow
+        if not fill or not border:
+            return
+        fillrgba    = fill.canvas_color.rgba
+        borderrgba  = border.canvas_color.rgba
+
+        hideborder  = self.border_width <= 0 and fillrgba[3] >= 1
+        hidefill    = not hideborder and borderrgba[3] >= 1 and \
+                      all(abs(a - b) < 1 / 512 for a, b in zip(fillrgba, borderrgba))
+        Box._toggle(border, hideborder)
+        Box._toggle(fill, hidefill)
+
+        if shadow:
+            covered = not self._shadow_shown and borderrgba[3] >= 1 and \
+                      shadow.x >= border.x - 0.5 and shadow.y >= border.y - 0.5 and \
+                      shadow.right <= border.right + 0.5 and shadow.top <= border.top + 0.5
+            Box._toggle(shadow, covered or shadow.canvas_color.a <= 0)
+
+    @staticmethod
+    def _toggle(layer:_ColorArea, hidden:bool):
+        """Detaches or attaches a layer depending on its visibility.
+
+        Args:
+            layer: One of the ColorArea widgets of the box.
+            hidden: True, if the layer cannot be seen.
+        """
+        if hidden:
+            _Render.detach(layer, 'overdraw')
+        else:
+            _Render.attach(layer, 'overdraw')
 
     def ispressed(self):
         """Returns, whether the Box is currently touched.
@@ -192,13 +643,15 @@ class Box(_Widget):
         touched, i.e. the touch occured within or on the widget's border
         (the shadow is ignored) and has not yet been released. The
         method will also return true, if the touch device leaves the
-        widget without releasing the touch (dragging).
+        widget without releasing the touch (dragging). If several
+        touches pressed the widget, it is touched until all of them were
+        released.
 
         Returns:
             bool: True, if the widget is currently touched. False,
             otherwise.
         """
-        return self._pressed
+        return bool(self._pressed)
 
     def ishover(self):
         """ Returns, whether the cursor is hovering over the widget.
@@ -212,84 +665,230 @@ class Box(_Widget):
         """
         return self._inside
 
+    def on_enter(self, hover:bool):
+        """Default handler of the 'on_enter' event.
+
+        Args:
+            hover: Always True.
+        """
+
+    def on_leave(self, hover:bool):
+        """Default handler of the 'on_leave' event.
+
+        Args:
+            hover: Always False.
+        """
+
+    def on_press(self, touch:_MotionEvent):
+        """Default handler of the 'on_press' event.
+
+        Args:
+            touch: Information about the touch.
+        """
+
+    def on_release(self, touch:_MotionEvent):
+        """Default handler of the 'on_release' event.
+
+        Args:
+            touch: Information about the touch.
+        """
+
+    def on_drag(self, touch:_MotionEvent):
+        """Default handler of the 'on_drag' event.
+
+        Args:
+            touch: Information about the touch. In frame drag mode, a
+            DragInfo instance instead.
+        """
+
     def on_mouse_pos(self, _, pos:_List[int]):
         """Callback function for detecting mouse movements.
 
-        The method is called for each cursor movement. It is used to
-        detect, whether the cursor hovers over the box. If the cursor
-        starts to hover over or leaves the Box, then the callback
-        functions for 'on_enter' or 'on_leave' are called, respectively.
-        Note that the user must have bound a callback functions to those
-        events prior to the event's occurrence. Otherwise, nothing
-        happens.
+        The method is called for each cursor movement while the box is
+        part of a widget tree. It is used to detect, whether the cursor
+        hovers over the box. If the cursor starts to hover over or leaves
+        the Box, then the events 'on_enter' or 'on_leave' are dispatched,
+        respectively. Nothing happens, unless a callback function is
+        bound to one of those events or a derived class overrides one of
+        their handlers.
+
+        Hidden boxes, boxes inside a hidden widget and boxes outside of
+        the window's widget tree are never hovered. If nobody listens
+        anymore, e.g. after funbind(), the cursor is no longer tracked.
 
         Args:
             pos: The new position value.
         """
-        if not self.callbacks['on_enter'] and not self.callbacks['on_leave']:
+        if not self._listens_to_hover():
+            _Hover.untrack(self)
             return
 
-        if self.collide_point(*pos):
-            if not self._inside and self.callbacks['on_enter']:
-                self.callbacks['on_enter'](True)
-            self._inside = True
-        else:
-            if self._inside and self.callbacks['on_leave']:
-                self.callbacks['on_leave'](False)
+        if self.collide_point(*pos) and self.isshown() and self.get_root_window():
+            if not self._inside:
+                self._inside = True
+                self.dispatch('on_enter', True)
+        elif self._inside:
             self._inside = False
+            self.dispatch('on_leave', False)
+
+    def _update_hover(self, *_):
+        """Starts or stops tracking the cursor for the widget.
+
+        The cursor is only tracked while the widget is attached to a
+        window and someone is interested in hover events. The tracker
+        references the widget weakly, so a removed widget can be garbage
+        collected. If the widget was hovered when it was removed, the
+        'on_leave' event is dispatched.
+        """
+        if self.parent is not None and self._listens_to_hover():
+            _Hover.track(self)
+            return
+        _Hover.untrack(self)
+        if self._inside:
+            self._inside = False
+            self.dispatch('on_leave', False)
+
+    def _listens_to_hover(self) -> bool:
+        """Determines whether anyone is interested in hover events.
+
+        Returns:
+            bool: True, if callback functions are bound to 'on_enter' or
+            'on_leave' or their handlers are overridden. False,
+            otherwise.
+        """
+        cls = type(self)
+        if cls.on_enter is not Box.on_enter or cls.on_leave is not Box.on_leave:
+            return True
+        return bool(self.get_property_observers('on_enter') or self.get_property_observers('on_leave'))
 
     def on_touch_down(self, touch:_MotionEvent):
         """Callback function for detecting touches.
 
         The method is called for each touch / click from the user. The
-        method checks whether the touch was performed on or within
-        the border of the Box (the shadow is ignored). If so, it calls a
-        callback function that was bound to the event 'on_press' using
-        the bind() method of this class.
+        touch is passed on to the children first. If none of them
+        consumes it, the method checks whether the touch was performed
+        on or within the border of the Box (the shadow is ignored). If
+        so, it dispatches the 'on_press' event. Whether the touch is
+        consumed depends on touch_policy.
 
         Args:
             touch: Information about the touch.
+
+        Returns:
+            bool: True, if the touch was consumed. False, otherwise.
         """
+        if not self.visible:
+            return False
+
+        if self.touch_policy == 'consume':
+            if not self.collide_point(*touch.pos):
+                return False
+            if super(Box, self).on_touch_down(touch):
+                return True
+            self._press(touch)
+            return True
+
+        if super(Box, self).on_touch_down(touch):
+            return True
         if self.collide_point(*touch.pos):
-            self._pressed = True
-            if self.callbacks['on_press']:
-                self.callbacks['on_press'](touch)
-
-        super(Box, self).on_touch_down(touch)
+            self._press(touch)
         return False
 
     def on_touch_up(self, touch:_MotionEvent):
         """Callback function for detecting touch or click releases.
 
         The method is called whenever a prior touch / click is released.
-        If so, it calls the callback function that was bound to the
-        event 'on_press' using the bind() method of this class.
+        If the touch was pressed on the Box, it dispatches the
+        'on_release' event. In frame drag mode, the accumulated dragging
+        movement is dispatched first. Releases of touches that started
+        elsewhere are only passed on to the children.
 
         Args:
             touch: Information about the touch.
-        """
-        self._pressed = False
-        if self.callbacks['on_release']:
-            self.callbacks['on_release'](touch)
 
-        super(Box, self).on_touch_up(touch)
-        return False
+        Returns:
+            bool: True, if the touch was consumed. False, otherwise.
+        """
+        if touch.grab_current is self:
+            touch.ungrab(self)
+            drag    = self._drags.pop(touch.uid, None)
+            pressed = touch.uid in self._pressed
+            if drag and pressed:
+                # The release adds no movement, so it must not slow down
+                # the velocity used for kinetic scrolling.
+                velocity        = drag.velocity
+                drag.add(touch, Box.DRAG_SMOOTHING)
+                drag.velocity   = velocity
+                self.dispatch('on_drag', drag)
+            if pressed:
+                self._pressed.discard(touch.uid)
+                self.dispatch('on_release', touch)
+            return True
+
+        if not self.visible or not self._accepts(touch):
+            return False
+        return super(Box, self).on_touch_up(touch)
 
     def on_touch_move(self, touch:_MotionEvent):
         """Callback function for detecting a dragging movement.
 
         The method is called whenever the input devices moves. It
         checks whether there was a touch or click on the Box before
-        which corresponds to dragging the Box. If so, the methods calls
-        the callback function that was bound to the event 'on_drag'
-        using the bind() method of this class.
+        which corresponds to dragging the Box. If so, the method
+        dispatches the 'on_drag' event or, in frame drag mode, schedules
+        it for the next frame.
 
         Args:
             touch: Information about the touch.
+
+        Returns:
+            bool: True, if the touch was consumed. False, otherwise.
         """
+        if touch.grab_current is self:
+            drag = self._drags.get(touch.uid)
+            if drag:
+                drag.add(touch, Box.DRAG_SMOOTHING)
+                self._trigger_drag()
+            elif touch.uid in self._pressed:
+                self.dispatch('on_drag', touch)
+            return True
+
+        if not self.visible or not self._accepts(touch):
+            return False
+        return super(Box, self).on_touch_move(touch)
+
+    def _press(self, touch:_MotionEvent):
+        """Presses the Box and grabs the touch for its release.
+
+        Kivy hands grabbed touches to the grabbing widget once more,
+        with grab_current set to that widget. Therefore, only the Box
+        that was pressed sees the release and the dragging movements.
 
-        if self._pressed and self.callbacks['on_drag']:
-            self.callbacks['on_drag'](touch)
+        Args:
+            touch: Information about the touch.
+        """
+        self._pressed.add(touch.uid)
+        touch.grab(self)
+        if self.drag_mode == 'frame':
+            self._drags[touch.uid] = DragInfo(touch)
+        self.dispatch('on_press', touch)
+
+    def _flush_drags(self, *_):
+        """Dispatches the dragging movements accumulated in frame mode."""
+        for drag in list(self._drags.values()):
+            if drag.moves and drag.touch.uid in self._pressed:
+                self.dispatch('on_drag', drag)
+                drag.delta = (0, 0)
+                drag.moves = 0
+
+    def _accepts(self, touch:_MotionEvent) -> bool:
+        """Determines whether a touch is passed on to the children.
 
-        super(Box, self).on_touch_move(touch)
-        return False
+        Args:
+            touch: Information about the touch.
+
+        Returns:
+            bool: False, if touches are consumed and the given one
+            lies outside of the Box. True, otherwise.
+        """
+        return self.touch_policy != 'consume' or self.collide_point(*touch.pos)
@@ -0,0 +1,372 @@
+"""Defines a container that draws many boxes at once.
+
+Each ColorArea widget, and therefore each layer of a Box widget, is a
+rounded rectangle of its own. A dashboard or a matrix of thousands of
+buttons thus results in thousands of separate draw calls. This module
+defines a container that collects the rounded rectangles of all of its
+descendants into a few large meshes. The colors are stored in a small
+palette texture, one pixel per rectangle, so that the whole batch can be
+drawn with a single texture. If a rectangle changes, only its own
+vertices and its own palette pixel are rewritten, and only the rows of
+the palette holding changed pixels are uploaded again. If widgets are
+added or removed, only the meshes from the first changed rectangle on
+are created anew.
+"""
+
+from math import cos as _cos
+from math import pi as _pi
+from math import sin as _sin
+from typing import List as _List
+
+from kivy.clock import Clock as _Clock
+from kivy.graphics import Color as _Color
+from kivy.graphics import InstructionGroup as _InstructionGroup
+from kivy.graphics import Mesh as _Mesh
+from kivy.graphics.texture import Texture as _Texture
+from kivy.properties import NumericProperty as _NumericProperty
+from kivy.uix.widget import Widget as _Widget
+
+from ._colorarea import ColorArea as _ColorArea
+from ._render import Render as _Render
+
+
+class BoxBatch(_Widget):
+    """Container drawing the boxes of its descendants in one batch.
+
+    Widgets are added to the BoxBatch widget like to any other widget.
+    The ColorArea widgets among its descendants are not drawn by
+    themselves anymore. Instead, they are drawn by the BoxBatch widget
+    before any of its children, i.e. behind all labels and other
+    content. Therefore, the batch suits widgets that do not overlap,
+    e.g. a grid of buttons.
+
+    Descendants of widgets that transform their children, e.g. scroll
+    views or relative layouts, are not batched and draw themselves.
+    Since the opacity of the ancestors is taken into account, hidden
+    or detached widgets stay invisible.
+    """
+
+    segments            = _NumericProperty(6)
+    """Number of line segments per rounded corner."""
+
+    chunk_size          = _NumericProperty(256)
+    """Maximum number of rectangles per mesh.
+
+    Kivy uploads a mesh as a whole whenever one of its vertices
+    changes. Smaller chunks make updates cheaper but need more draw
+    calls.
+    """
+
+    PALETTE_WIDTH       = 256
+    """Width of the palette texture in pixels."""
+
+    def __init__(self, **kwargs):
+        """Initialization method of the widget.
+
+        Args:
+            **kwargs: Keyed arguments passed on to the base class.
+        """
+        self._areas             = []
+        self._slots             = {}
+        self._owners            = {}
+        self._chunks            = []
+        self._dirty             = set()
+        self._palette           = None
+        self._pixels            = bytearray()
+        self._batch             = _InstructionGroup()
+        self._trigger_rebuild   = _Clock.create_trigger(self._rebuild, -1)
+        self._trigger_refresh   = _Clock.create_trigger(self._refresh, -1)
+        self._trigger_flush     = _Clock.create_trigger(self._flush, -1)
+        super(BoxBatch, self).__init__(**kwargs)
+        self.canvas.before.add(self._batch)
+        self.fbind('children', self._trigger_refresh)
+        self.fbind('segments', self._trigger_rebuild)
+        self.fbind('chunk_size', self._trigger_rebuild)
+        self.fbind('parent', self._on_parent)
+
+    def _on_parent(self, *_):
+        """Follows detachments only while the batch is part of a tree.
+
+        Detachments that happened in the meantime are taken into account
+        by collecting the rectangles again once the batch is added.
+        """
+        if self.parent is None:
+            _Render.unlisten(self._on_render)
+            return
+        _Render.unlisten(self._on_render)
+        _Render.listen(self._on_render)
+        self._trigger_rebuild()
+
+    def _rebuild(self, *_):
+        """Collects the rectangles of all descendants.
+
+        The meshes and the palette are created anew.
+        """
+        self._update_areas()
+        self._create_palette()
+        self._create_meshes()
+        self._dirty = set(range(len(self._areas)))
+        self._flush()
+        self._reload_palette()
+
+    def _refresh(self, *_):
+        """Collects the rectangles again after widgets were added or removed.
+
+        Rectangles before the first changed one keep their slots, so the
+        meshes holding them are kept as well. The meshes from the first
+        changed rectangle on are created anew, unless the number of
+        rectangles stayed the same. The palette is only created anew, if
+        it needs more rows, since that changes the texture coordinates
+        of all rectangles.
+        """
+        if self._palette is None:
+            self._rebuild()
+            return
+        previous    = self._update_areas()
+        first       = 0
+        for old, new in zip(previous, self._areas):
+            if old is not new:
+                break
+            first  += 1
+        if first == len(previous) == len(self._areas):
+            return
+        rows = (len(self._areas) + BoxBatch.PALETTE_WIDTH - 1) // BoxBatch.PALETTE_WIDTH
+        if rows > self._palette.height:
+            self._rebuild()
+            return
+
+        if len(self._areas) != len(previous):
+            first = first // self._capacity * self._capacity
+            self._create_meshes(first)
+        self._dirty.update(range(first, len(self._areas)))
+        self._flush()
+
+    def _update_areas(self) -> _List[_ColorArea]:
+        """Collects the rectangles of all descendants in drawing order.
+
+        Rectangles that are no longer part of the batch draw themselves
+        again.
+
+        Returns:
+            The rectangles collected before.
+        """
+        for widget in self._owners:
+            widget.funbind('children', self._trigger_refresh)
+            widget.funbind('opacity', self._on_owner, widget)
+        for area in self._areas:
+            for name in ('pos', 'size', 'radius', 'color', '_hsv'):
+                area.funbind(name, self._on_area, area)
+
+        previous        = self._areas
+        self._areas     = []
+        self._owners    = {}
+        for child in reversed(self.children):
+            self._collect(child, [])
+        self._slots     = {area: slot for slot, area in enumerate(self._areas)}
+
+        for area in set(previous) - set(self._areas):
+            _Render.attach(area, 'batch')
+        for area in self._areas:
+            _Render.detach(area, 'batch')
+            for name in ('pos', 'size', 'radius', 'color', '_hsv'):
+                area.fbind(name, self._on_area, area)
+        return previous
+
+    def _collect(self, widget:_Widget, chain:_List[_Widget]):
+        """Collects the rectangles of a widget and its descendants.
+
+        The rectangles are collected in drawing order. For every widget,
+        the rectangles below it are recorded, so that a change of its
+        opacity or detachment updates them.
+
+        Args:
+            widget: The widget to start with.
+            chain: The ancestors of the widget below the batch.
+        """
+        if isinstance(widget, BoxBatch):
+            return
+        chain = chain + [widget]
+        self._owners.setdefault(widget, [])
+        widget.fbind('children', self._trigger_refresh)
+        widget.fbind('opacity', self._on_owner, widget)
+
+        if isinstance(widget, _ColorArea):
+            for owner in chain:
+                self._owners[owner].append(widget)
+            self._areas.append(widget)
+        # Positions below a transforming widget are in another coordinate
+        # system, so these widgets draw themselves.
+        if type(widget).to_parent is not _Widget.to_parent:
+            return
+        for child in reversed(widget.children):
+            self._collect(child, chain)
+
+    def _create_palette(self):
+        """Creates the palette texture with one pixel per rectangle."""
+        width           = BoxBatch.PALETTE_WIDTH
+        height          = max((len(self._areas) + width - 1) // width, 1)
+        self._pixels    = bytearray(width * height * 4)
+        self._palette   = _Texture.create(size = (width, height), colorfmt = 'rgba')
+        self._palette.mag_filter = 'nearest'
+        self._palette.min_filter = 'nearest'
+        self._palette.add_reload_observer(self._reload_palette)
+
+    def _reload_palette(self, *_):
+        """Uploads the whole palette, e.g. after the GL context was lost."""
+        self._palette.blit_buffer(self._pixels, colorfmt = 'rgba', bufferfmt = 'ubyte')
+
+    def _create_meshes(self, start:int = 0):
+        """Creates the meshes, each holding a chunk of the rectangles.
+
+        Each rectangle is a triangle fan around its center. Mesh indices
+        are 16 bits wide, so a chunk never holds more than 65536
+        vertices.
+
+        Args:
+            start: The first rectangle of the meshes to be created anew.
+            It has to be the first one of a chunk. The meshes before are
+            kept. All meshes are created anew, if it is zero.
+        """
+        if not start:
+            self._batch.clear()
+            self._chunks    = []
+            perimeter       = 4 * (int(self.segments) + 1)
+            self._stride    = perimeter + 1
+            self._capacity  = max(min(int(self.chunk_size), 65536 // self._stride), 1)
+            self._batch.add(_Color(1, 1, 1, 1))
+            angles          = [_pi / 2 * step / int(self.segments) for step in range(int(self.segments) + 1)]
+            self._corner    = [(_cos(angle), _sin(angle)) for angle in angles]
+        stride      = self._stride
+        capacity    = self._capacity
+        perimeter   = stride - 1
+        for mesh, _ in self._chunks[start // capacity:]:
+            self._batch.remove(mesh)
+        del self._chunks[start // capacity:]
+
+        for first in range(start, len(self._areas), capacity):
+            count   = min(capacity, len(self._areas) - first)
+            indices = []
+            for entry in range(count):
+                base = entry * stride
+                for point in range(perimeter):
+                    indices += [base, base + 1 + point, base + 1 + (point + 1) % perimeter]
+            vertices    = [0.0] * (count * stride * 4)
+            mesh        = _Mesh(vertices = vertices, indices = indices,
+                                mode = 'triangles', texture = self._palette)
+            self._chunks.append([mesh, vertices])
+            self._batch.add(mesh)
+
+    def _on_area(self, area:_ColorArea, *_):
+        """Marks a rectangle for update if its geometry or color changed.
+
+        Args:
+            area: The changed ColorArea widget.
+        """
+        slot = self._slots.get(area)
+        if slot is not None:
+            self._dirty.add(slot)
+            self._trigger_flush()
+
+    def _on_owner(self, widget:_Widget, *_):
+        """Marks the rectangles below a widget for update.
+
+        Args:
+            widget: The widget whose opacity or detachment changed.
+        """
+        for area in self._owners.get(widget, ()):
+            self._dirty.add(self._slots[area])
+        self._trigger_flush()
+
+    def _on_render(self, widget:_Widget, reason):
+        """Follows widgets being detached or attached by others.
+
+        Args:
+            widget: The widget that was detached or attached.
+            reason: The reason given.
+        """
+        if reason != 'batch' and widget in self._owners:
+            self._on_owner(widget)
+
+    def _flush(self, *_):
+        """Writes the vertices and colors of all changed rectangles."""
+        if not self._dirty:
+            return
+        chunks  = set()
+        slots   = [slot for slot in self._dirty if slot < len(self._areas)]
+        for slot in slots:
+            self._write(slot)
+            chunks.add(slot // self._capacity)
+        self._dirty = set()
+
+        for index in chunks:
+            mesh, vertices = self._chunks[index]
+            mesh.vertices = vertices
+        if slots:
+            self._upload_pixels(min(slots), max(slots))
+
+    def _upload_pixels(self, first:int, last:int):
+        """Uploads the palette pixels between two rectangles.
+
+        Within a single row of the palette, only the pixels in between
+        are uploaded. Otherwise, all rows from the first to the last
+        rectangle are.
+
+        Args:
+            first: The lowest index of a changed rectangle.
+            last: The highest index of a changed rectangle.
+        """
+        width       = BoxBatch.PALETTE_WIDTH
+        top, bottom = first // width, last // width
+        if top == bottom:
+            start, stop = first * 4, (last + 1) * 4
+            pos, size   = (first % width, top), (last - first + 1, 1)
+        else:
+            start, stop = top * width * 4, (bottom + 1) * width * 4
+            pos, size   = (0, top), (width, bottom - top + 1)
+        self._palette.blit_buffer(bytes(self._pixels[start:stop]), size = size, pos = pos,
+                                  colorfmt = 'rgba', bufferfmt = 'ubyte')
+
+    def _write(self, slot:int):
+        """Writes the vertices and the palette pixel of a rectangle.
+
+        Args:
+            slot: The index of the rectangle.
+        """
+        area        = self._areas[slot]
+        rgba        = list(area.canvas_color.rgba)
+        visible     = True
+        widget      = area
+        while widget is not None and widget is not self:
+            rgba[3] *= widget.opacity
+            visible = visible and not (_Render.reasons(widget) - {'batch'})
+            widget  = widget.parent
+        offset = slot * 4
+        self._pixels[offset:offset + 4] = bytes(int(max(min(value, 1), 0) * 255 + 0.5) for value in rgba)
+
+        width   = BoxBatch.PALETTE_WIDTH
+        u       = (slot % width + 0.5) / width
+        v       = (slot // width + 0.5) / self._palette.height
+        mesh, vertices = self._chunks[slot // self._capacity]
+        start   = (slot % self._capacity) * self._stride * 4
+        if not visible or rgba[3] <= 0 or area.width <= 0 or area.height <= 0:
+            vertices[start:start + self._stride * 4] = [0.0] * (self._stride * 4)
+            return
+
+        x, y    = area.pos
+        w, h    = area.size
+        limit   = min(w, h) / 2
+        radius  = [min(value, limit) for value in (list(area.radius) + [0, 0, 0, 0])[:4]]
+        # Corners counterclockwise from the bottom left one. The radius
+        # is given from the top left corner clockwise.
+        corners = [(x + radius[3], y + radius[3], radius[3], -1, -1),
+                   (x + w - radius[2], y + radius[2], radius[2], 1, -1),
+                   (x + w - radius[1], y + h - radius[1], radius[1], 1, 1),
+                   (x + radius[0], y + h - radius[0], radius[0], -1, 1)]
+
+        points = [x + w / 2, y + h / 2, u, v]
+        for index, (cx, cy, r, sx, sy) in enumerate(corners):
+            # Every other corner runs its quarter circle backwards.
+            steps = self._corner[::-1] if index % 2 else self._corner
+            for cosine, sine in steps:
+                points += [cx + sx * r * cosine, cy + sy * r * sine, u, v]
+        vertices[start:start + len(points)] = points
@@ -22,6 +22,8 @@ from kivy.properties import NumericProperty as _NumericProperty
 from kivy.graphics import RoundedRectangle as _RoundedRectangle
 from kivy.uix.widget import Widget as _Widget
 
+from ._transition import Transition as _Transition
+
 
 class ColorArea(_Widget):
     """Rounded rectangle with animated color transitions.
@@ -172,7 +174,7 @@ class ColorArea(_Widget):
         """
         self.canvas_color.hsv = hsv
 
-    def modify(self, hsv:_List[float]):
+    def modify(self, hsv:_List[float]) -> _Transition:
         """Shifts the widget's color in HSV-space.
 
         Modifies the nominal color of the widget in HSV-space (hue,
@@ -193,6 +195,9 @@ class ColorArea(_Widget):
         Args:
             hsv: List of hue, saturation, and value (brightness) values
             to shift the color of the widget.
+
+        Returns:
+            Transition: A handle that can be awaited or cancelled.
         """
         targethue       = _modf(_Color(*self.color).h + hsv[0])[0]
         targethue       = targethue if targethue > 0 else 1 - targethue
@@ -201,9 +206,11 @@ class ColorArea(_Widget):
         target          = [ targethue,
                             max(min(refsaturation + hsv[1], 1),0),
                             max(min(refvalue + hsv[2], 1),0)]
-        _Animation(_hsv = target, duration = self.transition, t='linear').start(self)
+        animation = _Animation(_hsv = target, duration = self.transition, t='linear')
+        animation.start(self)
+        return _Transition([(animation, self)])
 
-    def recolor(self, rgba:_List[float]):
+    def recolor(self, rgba:_List[float]) -> _Transition:
         """Changes the nominal color of the widget.
 
         Changes the nominal color by smoothly transitioning to the given
@@ -216,10 +223,15 @@ class ColorArea(_Widget):
         Args:
             rgba: The new color as a list in RGBA-space to transition
             to. Each list component is a float value between 0 and 1.
+
+        Returns:
+            Transition: A handle that can be awaited or cancelled.
         """
-        _Animation(color = rgba, duration = self.transition, t='linear').start(self)
+        animation = _Animation(color = rgba, duration = self.transition, t='linear')
+        animation.start(self)
+        return _Transition([(animation, self)])
 
-    def resize(self, targetsize:_List[int], targetradius:_Optional[_List[int]] = None):
+    def resize(self, targetsize:_List[int], targetradius:_Optional[_List[int]] = None) -> _Transition:
         """Starts an animated change of the widget's size and radius.
 
         The method smoothly resizes the widget relative to its center.
@@ -235,6 +247,9 @@ class ColorArea(_Widget):
             recommended to explicitly provide a radius every once in
             a while (if the method is used multiple times) to avoid
             a summation of rounding errors.
+
+        Returns:
+            Transition: A handle that can be awaited or cancelled.
         """
         delta       = [self.size[0] - targetsize[0], self.size[1] - targetsize[1]]
         newradius   = targetradius
@@ -243,7 +258,9 @@ class ColorArea(_Widget):
             newradius = [   self.radius[0]*mpl, self.radius[1]*mpl,
                             self.radius[2]*mpl, self.radius[3]*mpl]
 
-        _Animation( size     = targetsize,
-                    radius   = newradius,
-                    pos      = [self.pos[0] + delta[0] / 2, self.pos[1] + delta[1] / 2],
-                    duration = self.transition, t='linear').start(self)
+        animation   = _Animation(size     = targetsize,
+                                 radius   = newradius,
+                                 pos      = [self.pos[0] + delta[0] / 2, self.pos[1] + delta[1] / 2],
+                                 duration = self.transition, t='linear')
+        animation.start(self)
+        return _Transition([(animation, self)])
@@ -4,6 +4,7 @@ The color shift is animated. This can be used for link-style text.
 """
 
 from os.path import dirname as _dirname
+from os.path import join as _join
 from math import modf as _modf
 from typing import Optional as _Optional
 
@@ -15,10 +16,13 @@ from kivy.properties import NumericProperty as _NumericProperty
 from kivy.properties import StringProperty as _StringProperty
 from kivy.uix.label import Label as _Label
 
+from ._transition import Transition as _Transition
+from ._visibility import Visibility as _Visibility
 
-_Builder.load_file(_dirname(__file__) + '\\_colorlabel.kv')
 
-class ColorLabel(_Label):
+_Builder.load_file(_join(_dirname(__file__), '_colorlabel.kv'))
+
+class ColorLabel(_Visibility, _Label):
     """Label widget that can shift its color.
 
     The color shift is animated. This can be used for link-style text.
@@ -90,7 +94,7 @@ class ColorLabel(_Label):
         hcolor.hsv  = hsv
         self.color  = hcolor.rgba
 
-    def modify(self, hsv):
+    def modify(self, hsv) -> _Transition:
         """Shifts the widget's color in HSV-space.
 
         Modifies the nominal color of the widget in HSV-space (hue,
@@ -111,6 +115,9 @@ class ColorLabel(_Label):
         Args:
             hsv: List of hue, saturation, and value (brightness) values
             to shift the color of the widget.
+
+        Returns:
+            Transition: A handle that can be awaited or cancelled.
         """
 
         # Since hue is the angle on a color wheel, there is no minimum
@@ -123,9 +130,11 @@ class ColorLabel(_Label):
         target          = [ targethue,
                             max(min(refsaturation + hsv[1], 1),0),
                             max(min(refvalue + hsv[2], 1),0)]
-        _Animation(_hsv = target, duration = self.transition, t='linear').start(self)
+        animation = _Animation(_hsv = target, duration = self.transition, t='linear')
+        animation.start(self)
+        return _Transition([(animation, self)])
 
-    def recolor(self, color):
+    def recolor(self, color) -> _Transition:
         """Changes the nominal color of the widget.
 
         Changes the nominal color by smoothly transitioning to the given
@@ -138,5 +147,10 @@ class ColorLabel(_Label):
         Args:
             rgba: The new color as a list in RGBA-space to transition
             to. Each list component is a float value between 0 and 1.
+
+        Returns:
+            Transition: A handle that can be awaited or cancelled.
         """
-        _Animation(nominal_color = color, duration = self.transition, t='linear').start(self)
+        animation = _Animation(nominal_color = color, duration = self.transition, t='linear')
+        animation.start(self)
+        return _Transition([(animation, self)])
@@ -0,0 +1,172 @@
+"""Defines a helper for tracking the cursor over widgets.
+
+Kivy reports cursor movements through the mouse_pos attribute of the
+window. If every widget bound a method to that attribute, the window
+would keep every such widget alive, even long after it was removed from
+the widget tree. This module binds to the window only once and hands
+the cursor position on to the widgets registered, which are referenced
+weakly, while they are attached to the window.
+"""
+
+from typing import List as _List
+from weakref import WeakKeyDictionary as _WeakKeyDictionary
+from weakref import WeakSet as _WeakSet
+
+from kivy.core.window import Window as _Window
+from kivy.uix.widget import Widget as _Widget
+
+
+class Hover:
+    """Class for passing cursor movements on to widgets.
+
+    A registered widget has its method on_mouse_pos(window, pos) called
+    for each cursor movement, as long as it is attached to a window.
+    Widgets are referenced weakly, so they are dropped once they are
+    garbage collected.
+
+    The parent of a registered widget and the parents of all of its
+    ancestors are followed. Therefore, a widget is set dormant right
+    away when it loses its window, e.g. because an ancestor is removed
+    from the widget tree but kept alive, and becomes active again once
+    it is attached again. A widget losing its window gets on_mouse_pos
+    called once more, so it can dispatch 'on_leave'.
+    """
+
+    _widgets        = _WeakSet()
+    """Private attribute for the registered widgets attached to a window."""
+
+    _dormant        = _WeakSet()
+    """Private attribute for the registered widgets without window."""
+
+    _chains         = _WeakKeyDictionary()
+    """Private attribute mapping registered widgets to their parent bindings."""
+
+    _bound          = False
+    """Private attribute indicating whether the window is observed."""
+
+    @staticmethod
+    def track(widget:_Widget):
+        """Registers a widget for cursor movements.
+
+        Args:
+            widget: A widget providing a method on_mouse_pos.
+        """
+        Hover._follow(widget.__self__)
+        if not Hover._bound:
+            _Window.fbind('mouse_pos', Hover._on_mouse_pos)
+            Hover._bound = True
+
+    @staticmethod
+    def untrack(widget:_Widget):
+        """Unregisters a widget registered by track().
+
+        The window is not observed anymore once no widget is left.
+
+        Args:
+            widget: The widget not to be informed anymore.
+        """
+        widget = widget.__self__
+        Hover._unfollow(widget)
+        Hover._chains.pop(widget, None)
+        Hover._widgets.discard(widget)
+        Hover._dormant.discard(widget)
+        if Hover._bound and not Hover._widgets and not Hover._dormant:
+            _Window.funbind('mouse_pos', Hover._on_mouse_pos)
+            Hover._bound = False
+
+    @staticmethod
+    def is_tracked(widget:_Widget) -> bool:
+        """Determines whether a widget is registered.
+
+        Args:
+            widget: The widget to check.
+
+        Returns:
+            True, if the widget is informed about cursor movements.
+            False, otherwise.
+        """
+        return widget.__self__ in Hover._widgets
+
+    @staticmethod
+    def is_dormant(widget:_Widget) -> bool:
+        """Determines whether a registered widget lost its window.
+
+        Args:
+            widget: The widget to check.
+
+        Returns:
+            True, if the widget is registered but not informed about
+            cursor movements until it is attached again. False,
+            otherwise.
+        """
+        return widget.__self__ in Hover._dormant
+
+    @staticmethod
+    def _follow(widget:_Widget):
+        """Follows the parents of the widget and of its ancestors.
+
+        The widget is sorted into the active or the dormant widgets,
+        depending on whether the chain of its ancestors ends in a
+        window.
+
+        Args:
+            widget: The registered widget.
+        """
+        Hover._unfollow(widget)
+        chain       = []
+        ancestor    = widget
+        while isinstance(ancestor, _Widget):
+            uid = ancestor.fbind('parent', Hover._on_ancestor, widget.proxy_ref)
+            chain.append((ancestor.proxy_ref, uid))
+            ancestor = ancestor.parent
+        Hover._chains[widget] = chain
+        # The chain ends in the window, which is no widget, or in None.
+        if ancestor is None:
+            Hover._widgets.discard(widget)
+            Hover._dormant.add(widget)
+        else:
+            Hover._dormant.discard(widget)
+            Hover._widgets.add(widget)
+
+    @staticmethod
+    def _unfollow(widget:_Widget):
+        """Stops following the parents of the widget and its ancestors.
+
+        Args:
+            widget: The registered widget.
+        """
+        for ancestor, uid in Hover._chains.get(widget, ()):
+            try:
+                ancestor.unbind_uid('parent', uid)
+            except ReferenceError:
+                pass
+        Hover._chains[widget] = []
+
+    @staticmethod
+    def _on_ancestor(widget:_Widget, *_):
+        """Updates a widget after it or one of its ancestors was moved.
+
+        Args:
+            widget: A proxy of the registered widget.
+        """
+        try:
+            widget = widget.__self__
+        except ReferenceError:
+            return
+        if widget not in Hover._chains:
+            return
+        active = widget in Hover._widgets
+        Hover._follow(widget)
+        if active and widget in Hover._dormant:
+            widget.on_mouse_pos(_Window, _Window.mouse_pos)
+
+    @staticmethod
+    def _on_mouse_pos(window, pos:_List[int]):
+        """Passes a cursor movement on to the registered widgets.
+
+        Args:
+            window: The window the cursor moved in.
+            pos: The new cursor position.
+        """
+        for widget in list(Hover._widgets):
+            widget.on_mouse_pos(window, pos)
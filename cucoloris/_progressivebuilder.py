@@ -0,0 +1,258 @@
+"""Defines a builder creating large widget trees across several frames.
+
+Each widget runs its __init__ method and applies its kv rules when it
+is created. A screen of a few thousand buttons and form controls thus
+blocks the first frame for a long time. This module creates widgets
+from a declarative specification in slices of limited duration, one
+slice per frame. Cheap placeholders keep the place of widgets not
+created yet, and widgets that can be seen are created first.
+"""
+
+from collections import deque as _deque
+from collections.abc import Sequence as _Sequence
+from time import perf_counter as _perf_counter
+from typing import Callable as _Callable
+from typing import Iterable as _Iterable
+
+from kivy.clock import Clock as _Clock
+from kivy.factory import Factory as _Factory
+from kivy.uix.widget import Widget as _Widget
+
+
+class ProgressiveBuilder:
+    """Class for creating widgets in time-limited slices.
+
+    The specification is a list of dictionaries or a generator yielding
+    them. Each dictionary names the widget class with the key 'cls',
+    either as class or as name registered with Kivy's Factory, e.g.
+    'BtnPrimary'. The key 'children' may hold a list of specifications
+    of child widgets, which are created together with their parent. All
+    other keys are passed on to the widget as keyed arguments, e.g.:
+    ```py
+    spec    = [{'cls': 'BtnPrimary', 'text': 'Row ' + str(row), 'on_release': open_row}
+               for row in range(2000)]
+    builder = ProgressiveBuilder(layout, spec, callback = lambda _: print('Done'))
+    builder.start()
+    ```
+    For a list, a placeholder is added to the parent for each entry.
+    It takes over the keys size, size_hint, pos and pos_hint, so that
+    layouts place it like the widget to come. Placeholders are plain
+    widgets, so they are cheap but not free. Therefore, they are added
+    in slices as well. Once the parent laid out a placeholder, it is
+    checked whether it can be seen. Placeholders within the window are
+    replaced before any further placeholders are added, the others only
+    after all placeholders were added. The entries of a generator are
+    created in the order they are yielded, without placeholders.
+    """
+
+    BUDGET          = 0.008
+    """Maximum time in seconds spent on creating widgets per frame."""
+
+    PLACEHOLDER_KEYS = ('size', 'size_hint', 'size_hint_x', 'size_hint_y', 'width', 'height',
+                        'pos', 'pos_hint', 'x', 'y')
+    """Keys of a specification that are passed on to placeholders."""
+
+    def __init__(self, parent:_Widget, spec:_Iterable[dict], callback:_Callable = None,
+                 budget:float = None):
+        """Initialization method of the class.
+
+        Args:
+            parent: The widget to add the created widgets to.
+            spec: A list of dictionaries or a generator yielding them.
+            callback: Called as callback(builder) once all widgets were
+            created.
+            budget: Time in seconds spent per frame. Defaults to BUDGET.
+        """
+        self.parent         = parent
+        self.callback       = callback
+        self.budget         = budget if budget is not None else ProgressiveBuilder.BUDGET
+        self.created        = 0
+        """Number of widgets created so far, not counting children."""
+
+        self._spec          = spec
+        self._source        = None
+        self._entries       = _deque()
+        self._fresh         = []
+        self._visible       = _deque()
+        self._hidden        = _deque()
+        self._event         = None
+
+    @property
+    def done(self) -> bool:
+        """True, if nothing is left to be created."""
+        return self._source is None and not self._entries and not self._placeholders()
+
+    def start(self):
+        """Starts creating widgets, beginning with the next frame."""
+        if isinstance(self._spec, _Sequence):
+            self._entries.extend(self._spec)
+        else:
+            self._source = iter(self._spec)
+        self._event = _Clock.schedule_interval(self._step, 0)
+
+    def cancel(self):
+        """Stops creating widgets. Remaining placeholders are removed."""
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+        for placeholder, _, _ in self._placeholders():
+            if placeholder.parent is self.parent:
+                self.parent.remove_widget(placeholder)
+        self._entries.clear()
+        self._fresh         = []
+        self._visible.clear()
+        self._hidden.clear()
+        self._source        = None
+
+    @staticmethod
+    def create(entry:dict) -> _Widget:
+        """Creates a widget and its children from a specification.
+
+        Args:
+            entry: The specification of the widget.
+
+        Returns:
+            The created widget.
+        """
+        kwargs      = dict(entry)
+        cls         = kwargs.pop('cls')
+        children    = kwargs.pop('children', [])
+        if isinstance(cls, str):
+            cls = _Factory.get(cls)
+        widget = cls(**kwargs)
+        for child in children:
+            widget.add_widget(ProgressiveBuilder.create(child))
+        return widget
+
+    def _placeholders(self) -> list:
+        """Returns all placeholders with their specifications and depths."""
+        return self._fresh + list(self._visible) + list(self._hidden)
+
+    def _step(self, *_):
+        """Creates widgets until the time budget of the frame is spent.
+
+        Returns:
+            False once all widgets were created, which stops the clock
+            event.
+        """
+        start = _perf_counter()
+        if self._source is not None:
+            self._consume_source(start)
+        else:
+            self._classify()
+            self._replace(self._visible, start)
+            self._add_placeholders(start)
+            if not self._entries and not self._fresh:
+                self._replace(self._hidden, start)
+
+        if not self.done:
+            return True
+        self._event = None
+        if self.callback:
+            self.callback(self)
+        return False
+
+    def _classify(self):
+        """Sorts the placeholders laid out since the last slice.
+
+        Placeholders within the window go to the visible queue, all
+        others to the hidden one.
+        """
+        for item in self._fresh:
+            if ProgressiveBuilder._is_visible(item[0]):
+                self._visible.append(item)
+            else:
+                self._hidden.append(item)
+        self._fresh = []
+
+    def _add_placeholders(self, start:float):
+        """Adds placeholders for the next entries.
+
+        Each placeholder is stored with its depth, i.e. the number of
+        children added before it, which locates it among the children
+        of the parent without searching them.
+
+        Args:
+            start: The time the slice started.
+        """
+        keys = ProgressiveBuilder.PLACEHOLDER_KEYS
+        while self._entries and _perf_counter() - start <= self.budget:
+            entry       = self._entries.popleft()
+            placeholder = _Widget(**{key: entry[key] for key in keys if key in entry})
+            self.parent.add_widget(placeholder)
+            self._fresh.append((placeholder, entry, len(self.parent.children) - 1))
+
+    def _replace(self, queue:_deque, start:float):
+        """Replaces placeholders by the widgets they stand for.
+
+        Placeholders the application removed in the meantime, e.g. by
+        clear_widgets(), are skipped.
+
+        Args:
+            queue: The placeholders, their specifications and depths.
+            start: The time the slice started.
+        """
+        while queue and _perf_counter() - start <= self.budget:
+            placeholder, entry, depth = queue.popleft()
+            index = self._index(placeholder, depth)
+            if index is None:
+                continue
+            widget = ProgressiveBuilder.create(entry)
+            self.parent.remove_widget(placeholder)
+            self.parent.add_widget(widget, index = index)
+            self.created += 1
+
+    def _index(self, placeholder:_Widget, depth:int) -> int:
+        """Locates a placeholder among the children of the parent.
+
+        Args:
+            placeholder: The placeholder.
+            depth: The number of children added before the placeholder.
+
+        Returns:
+            int: The index of the placeholder. None, if it is no longer
+            a child of the parent.
+        """
+        children = self.parent.children
+        if placeholder.parent is not self.parent:
+            return None
+        index = len(children) - 1 - depth
+        if 0 <= index < len(children) and children[index] is placeholder:
+            return index
+        # The application added or removed other children.
+        for index, child in enumerate(children):
+            if child is placeholder:
+                return index
+        return None
+
+    def _consume_source(self, start:float):
+        """Creates widgets from the generator of the specification.
+
+        Args:
+            start: The time the slice started.
+        """
+        while _perf_counter() - start <= self.budget:
+            try:
+                entry = next(self._source)
+            except StopIteration:
+                self._source = None
+                return
+            self.parent.add_widget(ProgressiveBuilder.create(entry))
+            self.created += 1
+
+    @staticmethod
+    def _is_visible(widget:_Widget) -> bool:
+        """Determines whether a widget lies within its window.
+
+        Args:
+            widget: The widget to check.
+
+        Returns:
+            bool: True, if the widget overlaps the window. False,
+            otherwise.
+        """
+        window = widget.get_root_window()
+        if window is None:
+            return False
+        x, y = widget.to_window(*widget.pos)
+        return x < window.width and y < window.height and x + widget.width > 0 and y + widget.height > 0
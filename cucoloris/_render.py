@@ -0,0 +1,239 @@
+"""Defines a helper for excluding widgets from rendering.
+
+Kivy draws every widget that is part of the widget tree, even if it
+cannot be seen, e.g. because it was scrolled out of view. Removing such
+a widget from the tree is no option, since its state, bindings and
+position in the layout are to be kept. This module excludes a widget
+from rendering by swapping its canvas for an empty placeholder in the
+canvas of its parent. The widget itself stays where it is.
+"""
+
+from functools import partial as _partial
+from typing import Callable as _Callable
+from typing import Hashable as _Hashable
+from weakref import WeakKeyDictionary as _WeakKeyDictionary
+from weakref import WeakMethod as _WeakMethod
+
+from kivy.clock import Clock as _Clock
+from kivy.graphics import InstructionGroup as _InstructionGroup
+from kivy.graphics.opengl import GL_MAX_TEXTURE_SIZE as _GL_MAX_TEXTURE_SIZE
+from kivy.graphics.opengl import glGetIntegerv as _glGetIntegerv
+from kivy.uix.widget import Widget as _Widget
+
+
+class Render:
+    """Class for excluding widgets from rendering.
+
+    A widget may be detached for several reasons at the same time, e.g.
+    because it is scrolled out of view and because it is hidden. It is
+    drawn again only after it was attached for every reason it was
+    detached for. If a detached widget is moved to another parent, it
+    stays detached.
+    """
+
+    _detached       = _WeakKeyDictionary()
+    """Private attribute mapping detached widgets to their state."""
+
+    _max_texture    = None
+    """Private attribute for the maximum texture size of the GPU."""
+
+    _listeners      = []
+    """Private attribute for weak references to the listener methods."""
+
+    @staticmethod
+    def listen(method:_Callable):
+        """Registers a method to be called on detachment changes.
+
+        The method is called as method(widget, reason) whenever a widget
+        is detached or attached for a reason. It is referenced weakly,
+        so it does not keep its object alive.
+
+        Args:
+            method: A bound method.
+        """
+        Render._listeners.append(_WeakMethod(method))
+
+    @staticmethod
+    def unlisten(method:_Callable):
+        """Unregisters a method registered by listen().
+
+        Args:
+            method: The bound method given to listen().
+        """
+        Render._listeners = [ref for ref in Render._listeners if ref() not in (None, method)]
+
+    @staticmethod
+    def max_texture_size() -> int:
+        """Returns the maximum width and height of a texture in pixels.
+
+        The value is queried from OpenGL once, so a window has to exist.
+
+        Returns:
+            The maximum texture size supported by the GPU.
+        """
+        if not Render._max_texture:
+            Render._max_texture = int(_glGetIntegerv(_GL_MAX_TEXTURE_SIZE)[0])
+        return Render._max_texture
+
+    @staticmethod
+    def detach(widget:_Widget, reason:_Hashable = 'default'):
+        """Excludes the given widget from rendering.
+
+        Args:
+            widget: The widget not to be drawn anymore.
+            reason: Any hashable value identifying the caller. The same
+            value has to be given to attach() again.
+        """
+        # Widgets referenced by kv ids are weak proxies.
+        widget  = widget.__self__
+        state   = Render._detached.get(widget)
+        if state is None:
+            state = {'reasons': set(), 'group': None, 'placeholder': _InstructionGroup()}
+            state['uid']                = widget.fbind('parent', Render._on_parent)
+            Render._detached[widget]    = state
+        if reason not in state['reasons']:
+            state['reasons'].add(reason)
+            Render._notify(widget, reason)
+        if state['group'] is None:
+            Render._swap_out(widget, state)
+
+    @staticmethod
+    def attach(widget:_Widget, reason:_Hashable = 'default'):
+        """Includes the given widget in rendering again.
+
+        Args:
+            widget: The widget to be drawn again.
+            reason: The value given to detach() before.
+        """
+        widget  = widget.__self__
+        state   = Render._detached.get(widget)
+        if state is None or reason not in state['reasons']:
+            return
+        state['reasons'].discard(reason)
+        if not state['reasons']:
+            Render._swap_in(widget, state)
+            widget.unbind_uid('parent', state['uid'])
+            del Render._detached[widget]
+        Render._notify(widget, reason)
+
+    @staticmethod
+    def is_detached(widget:_Widget, reason:_Hashable = None) -> bool:
+        """Determines whether the given widget is excluded from rendering.
+
+        Args:
+            widget: The widget to check.
+            reason: If given, only detachments for this reason count.
+
+        Returns:
+            True, if the widget is detached. False, otherwise.
+        """
+        state = Render._detached.get(widget.__self__)
+        if state is None:
+            return False
+        return reason is None or reason in state['reasons']
+
+    @staticmethod
+    def reasons(widget:_Widget) -> frozenset:
+        """Returns the reasons the given widget is detached for.
+
+        Args:
+            widget: The widget to check.
+
+        Returns:
+            The reasons given to detach(), if any.
+        """
+        state = Render._detached.get(widget.__self__)
+        return frozenset(state['reasons']) if state else frozenset()
+
+    @staticmethod
+    def _notify(widget:_Widget, reason:_Hashable):
+        """Calls the registered listeners.
+
+        Args:
+            widget: The widget that was detached or attached.
+            reason: The reason given.
+        """
+        for ref in list(Render._listeners):
+            method = ref()
+            if method is None:
+                Render._listeners.remove(ref)
+            else:
+                method(widget, reason)
+
+    @staticmethod
+    def _swap_out(widget:_Widget, state:dict):
+        """Replaces the canvas of the widget by the placeholder.
+
+        Args:
+            widget: The widget to be detached.
+            state: The detachment state of the widget.
+        """
+        # The window is no widget, but it has a canvas of its own.
+        parent = widget.parent
+        if getattr(parent, 'canvas', None) is None:
+            return
+        # Accessing before or after of a canvas creates them if missing.
+        canvas  = parent.canvas
+        groups  = [canvas, canvas.before if canvas.has_before else None,
+                   canvas.after if canvas.has_after else None,
+                   getattr(parent, 'canvas_viewport', None)]
+        for group in groups:
+            if group is not None and widget.canvas in group.children:
+                index = group.indexof(widget.canvas)
+                group.remove(widget.canvas)
+                group.insert(index, state['placeholder'])
+                state['group'] = group
+                return
+
+    @staticmethod
+    def _swap_in(widget:_Widget, state:dict):
+        """Puts the canvas of the widget back in place of the placeholder.
+
+        Args:
+            widget: The widget to be attached.
+            state: The detachment state of the widget.
+        """
+        group           = state['group']
+        state['group']  = None
+        if group is None:
+            return
+        index = group.indexof(state['placeholder'])
+        if index >= 0:
+            group.remove(state['placeholder'])
+            group.insert(index, widget.canvas)
+
+    @staticmethod
+    def _on_parent(widget:_Widget, parent:_Widget):
+        """Keeps a widget detached if it is moved to another parent.
+
+        Kivy sets the new parent before it adds the widget's canvas to
+        the parent's canvas. Therefore, the canvas is swapped out again
+        right before the next frame.
+
+        Args:
+            widget: The detached widget.
+            parent: The new parent of the widget, if any.
+        """
+        state = Render._detached.get(widget)
+        if state is None:
+            return
+        if state['group'] is not None:
+            if state['placeholder'] in state['group'].children:
+                state['group'].remove(state['placeholder'])
+            state['group'] = None
+        if parent is not None:
+            _Clock.schedule_once(_partial(Render._redetach, widget.proxy_ref), -1)
+
+    @staticmethod
+    def _redetach(widget:_Widget, *_):
+        """Swaps out the canvas of a widget that was moved while detached.
+
+        Args:
+            widget: A proxy of the detached widget.
+        """
+        try:
+            state = Render._detached.get(widget.__self__)
+        except ReferenceError:
+            return
+        if state is not None and state['group'] is None:
+            Render._swap_out(widget.__self__, state)
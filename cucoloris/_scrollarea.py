@@ -5,18 +5,176 @@ However, that does not fit the rounded Bootstrap shapes well.
 Therefore, this widget has the same functionality as the original
 ScrollView but uses the ScrollBar widget, a scroll bar with rounded
 edges.
+
+Instead of adding child widgets, the ScrollArea can also be given a list
+of data dictionaries and a view class. Then, only the rows that are
+currently visible exist as widgets and are recycled while scrolling.
+The data may also be pulled page by page from a data source, e.g. a
+local database, while the user scrolls.
 """
 
+from asyncio import CancelledError as _CancelledError
+from functools import partial as _partial
+from math import ceil as _ceil
 from os.path import dirname as _dirname
+from os.path import join as _join
 from typing import List as _List
 
+from kivy.clock import Clock as _Clock
+from kivy.factory import Factory as _Factory
+from kivy.logger import Logger as _Logger
 from kivy.lang.builder import Builder as _Builder
+from kivy.properties import BooleanProperty as _BooleanProperty
 from kivy.properties import ListProperty as _ListProperty
+from kivy.properties import NumericProperty as _NumericProperty
 from kivy.properties import ObjectProperty as _ObjectProperty
+from kivy.properties import OptionProperty as _OptionProperty
 from kivy.uix.widget import Widget as _Widget
 from kivy.input.motionevent import MotionEvent as _MotionEvent
 
-_Builder.load_file(_dirname(__file__) + '\\_scrollarea.kv')
+from ._scrollbar import ScrollBar as _ScrollBar
+from ._scrollpane import ScrollPane as _ScrollPane
+from ._tasks import Tasks as _Tasks
+
+_Builder.load_file(_join(_dirname(__file__), '_scrollarea.kv'))
+
+
+class _RowPool(_Widget):
+    """Content widget that recycles a small pool of row widgets.
+
+    The widget is as high as all rows of the data list together.
+    However, row widgets are only created for the rows that are
+    currently visible in the scroll view. Rows that are scrolled out of
+    view are parked and reused for rows that are scrolled into view.
+    If the data changes, only rows whose dictionaries changed are set
+    again. Attributes set by a previous dictionary but missing in the
+    current one are reset to the values the widget had before.
+    """
+
+    def __init__(self, area:'ScrollArea', **kwargs):
+        """Initialization method of the class.
+
+        Args:
+            area: The ScrollArea widget providing data, view class,
+            row height and scroll position.
+            **kwargs: Keyed arguments passed on to the base class.
+        """
+        super(_RowPool, self).__init__(**kwargs)
+        self.size_hint_y    = None
+        self._area          = area.proxy_ref
+        self._active        = {}
+        self._free          = []
+        self._entries       = {}
+        self._originals     = {}
+        self._stale         = True
+        self._shift         = 0
+        self._trigger       = _Clock.create_trigger(self.refresh, -1)
+        self.visible_range  = (0, 0)
+
+    def shift(self, rows:int):
+        """Keeps the visible rows in place if rows are added on top.
+
+        Args:
+            rows: The number of rows inserted above the first row. A
+            negative number means that rows were removed.
+        """
+        self._shift += rows
+        self._stale = True
+        self._trigger()
+
+    def reset(self):
+        """Discards all row widgets, e.g. if the view class changes."""
+        self.clear_widgets()
+        self._active    = {}
+        self._free      = []
+        self._entries   = {}
+        self._originals = {}
+        self._trigger()
+
+    def invalidate(self, *_):
+        """Marks the data of all visible rows as outdated."""
+        self._stale = True
+        self._trigger()
+
+    def refresh(self, *_):
+        """Creates, recycles and positions the visible row widgets."""
+        area        = self._area
+        scroll      = area._scroll
+        data        = area.data
+        rowheight   = area.row_height
+        if not area.viewclass or rowheight <= 0:
+            return
+
+        previous    = self.height
+        self.height = height = len(data) * rowheight
+        if self._shift:
+            # The rows keep their widgets, which moved by the same number.
+            self._active = {index + self._shift: view for index, view in self._active.items()}
+            # Restore the distance between the top of the content and
+            # the top of the viewport, corrected by the inserted rows.
+            offset      = (1 - scroll.scroll_y) * max(previous - scroll.height, 0)
+            offset      += self._shift * rowheight
+            self._shift = 0
+            if height > scroll.height:
+                scroll.scroll_y = max(min(1 - offset / (height - scroll.height), 1.0), 0.0)
+                scroll._update_effect_y_bounds()
+
+        if height > scroll.height:
+            bottom  = scroll.scroll_y * (height - scroll.height)
+        else:
+            bottom  = height - scroll.height
+        first       = max(int((height - bottom - scroll.height) // rowheight), 0)
+        last        = min(int(_ceil((height - bottom) / rowheight)), len(data))
+
+        # Park the widgets of rows that left the viewport.
+        for index in list(self._active):
+            if not first <= index < last:
+                view = self._active.pop(index)
+                self.remove_widget(view)
+                self._free.append(view)
+
+        for index in range(first, last):
+            view = self._active.get(index)
+            if view is None:
+                view = self._free.pop() if self._free else self._create_view()
+                self._apply(view, data[index])
+                self._active[index] = view
+                self.add_widget(view)
+            elif self._stale and data[index] != self._entries[view]:
+                self._apply(view, data[index])
+            view.size_hint  = [None, None]
+            view.size       = [self.width, rowheight]
+            view.pos        = [self.x, self.y + height - (index + 1) * rowheight]
+
+        self._stale         = False
+        self.visible_range  = (first, last)
+        area._check_prefetch()
+
+    def _apply(self, view:_Widget, entry:dict):
+        """Sets the attributes of a row widget from a data dictionary.
+
+        Args:
+            view: The row widget.
+            entry: The data dictionary of the row.
+        """
+        originals = self._originals.setdefault(view, {})
+        for key in self._entries.get(view, {}):
+            if key not in entry:
+                setattr(view, key, originals[key])
+        for key, value in entry.items():
+            if key not in originals:
+                original        = getattr(view, key, None)
+                originals[key]  = list(original) if isinstance(original, list) else original
+            setattr(view, key, value)
+        # A copy notices changes made to the dictionary in place.
+        self._entries[view] = dict(entry)
+
+    def _create_view(self) -> _Widget:
+        """Creates a new row widget of the configured view class."""
+        viewclass = self._area.viewclass
+        if isinstance(viewclass, str):
+            viewclass = _Factory.get(viewclass)
+        return viewclass()
 
 
 class ScrollArea(_Widget):
@@ -49,9 +207,140 @@ class ScrollArea(_Widget):
     [upper left, upper right, lower right, lower left]
     """
 
+    clip_mode           = _OptionProperty('stencil', options=['stencil', 'scissor', 'auto'])
+    """The method used for clipping the scrolled content.
+
+    * stencil: The content is clipped using the stencil buffer like
+    Kivy's ScrollView does. This works for all transformations.
+    * scissor: The content is clipped using a scissor rectangle. This is
+    cheaper, especially for nested scroll areas, but requires that the
+    ScrollArea is neither rotated nor scaled.
+    * auto: Uses a scissor rectangle unless rounded clipping is needed,
+    i.e. unless a clip_radius is given.
+    """
+
+    clip_radius         = _ListProperty([0, 0, 0, 0])
+    """The radius of each corner of the clipping region in pixels.
+
+    Rounded clipping always uses the stencil buffer.
+    """
+
+    cull_content        = _BooleanProperty(False)
+    """Whether to skip drawing children that are scrolled out of view.
+
+    If True, children of the content widget whose bounding boxes lie
+    outside the visible region are not drawn. This keeps scrolling cheap
+    for long content like forms with hundreds of widgets. Children that
+    draw outside of their bounding box may be cut off, so culling has to
+    be enabled explicitly.
+    """
+
+    cache_content       = _BooleanProperty(False)
+    """Whether to render the content into a texture.
+
+    If True, the content is rendered once and scrolling only moves the
+    resulting texture. The texture is rendered again whenever the canvas
+    of a descendant changes, so this is meant for read-only content.
+    Scroll areas inside cached content need a clip_mode other than
+    'scissor'.
+
+    There is a single texture of at most the maximum texture size of the
+    GPU. Content larger than that is not split into tiles. Instead, the
+    texture covers the region around the view and is rendered again as
+    a whole, whenever scrolling leaves that region. Scrolling through
+    such content therefore re-renders it once per texture size.
+    """
+
+    data                = _ListProperty()
+    """List of dictionaries describing the rows of the ScrollArea.
+
+    If a viewclass is given, one widget of that class is shown per
+    dictionary. Each key of a dictionary is set as attribute of the row
+    widget. Only widgets for the visible rows are created.
+    """
+
+    viewclass           = _ObjectProperty(None, allownone=True)
+    """The class of the row widgets or its name.
+
+    Setting the view class switches the ScrollArea to data mode, i.e.
+    the rows are created from the data attribute instead of adding child
+    widgets. A content widget added before is removed.
+    """
+
+    row_height          = _NumericProperty(32)
+    """The height of each row in pixels if used in data mode."""
+
+    data_source         = _ObjectProperty(None, allownone=True)
+    """Source the rows are pulled from while scrolling in data mode.
+
+    The source is either an asynchronous generator yielding lists of row
+    dictionaries or a page callback source(start, count) returning such
+    a list. The page callback may be a coroutine function or a plain
+    function. Plain functions are run in a worker thread, asynchronous
+    sources on the asyncio event loop the application runs on. Pages are
+    inserted on Kivy's clock. A page shorter than page_size marks the
+    end of the data. If the source fails, the error is logged and the
+    page is requested again after RETRY_DELAY seconds at the earliest.
+    """
+
+    page_size           = _NumericProperty(50)
+    """Number of rows requested from the data source at once."""
+
+    prefetch_rows       = _NumericProperty(20)
+    """Minimum distance in rows to the end of the data to fetch ahead.
+
+    If fewer rows than this are left below or above the viewport, the
+    next page is requested from the data source.
+    """
+
+    prefetch_time       = _NumericProperty(0.5)
+    """Time in seconds to look ahead while scrolling.
+
+    The prefetch distance grows with the velocity of the kinetic scroll
+    effect, so that the page needed in this many seconds is requested
+    in time.
+    """
+
+    max_rows            = _NumericProperty(0)
+    """Maximum number of rows pulled from the data source kept in data.
+
+    If exceeded, rows at the opposite end of the scroll direction are
+    dropped and fetched again when needed. This requires a page callback
+    as data source. Zero means that no rows are dropped.
+    """
+
+    RETRY_DELAY         = 1.0
+    """Time in seconds to wait before requesting a page that failed again."""
+
+    BAR_POOL_SIZE       = 8
+    """Maximum number of unused scroll bars kept for reuse."""
+
+    _bar_pool           = []
+    """Private attribute for scroll bars that are currently unused."""
+
     _scroll             = _ObjectProperty()
     """Private attribute for the scroll view child widget."""
 
+    _pool               = _ObjectProperty(None, allownone=True)
+    """Private attribute for the content widget used in data mode."""
+
+    def __init__(self, **kwargs):
+        """Initialization method of the widget.
+
+        Args:
+            **kwargs: Keyed arguments passed on to the base class.
+        """
+        self._first_row     = 0
+        self._generation    = 0
+        self._loading       = {'start': False, 'end': False}
+        self._exhausted     = False
+        self._bar           = None
+        self._trigger_bar   = _Clock.create_trigger(self._update_bar, -1)
+        super(ScrollArea, self).__init__(**kwargs)
+        self.fbind('bar_radius', self._style_bar)
+        self.fbind('bar_fill_color', self._style_bar)
+        self.fbind('bar_border_color', self._style_bar)
+
     @property
     def scroll_x(self):
         """Returns the scroll_x value of the ScrollView child."""
@@ -346,12 +635,241 @@ class ScrollArea(_Widget):
         """
         self._scroll.bar_width = value
 
+    def on_viewclass(self, _, viewclass):
+        """Callback for switching to or from data mode.
+
+        Args:
+            viewclass: The class of the row widgets or its name. If
+            None, data mode is disabled.
+        """
+        if not self._scroll:
+            return
+        if viewclass is None:
+            if self._pool:
+                self._scroll.unbind(scroll_y = self._pool._trigger, size = self._pool._trigger)
+                self._scroll.remove_widget(self._pool)
+                self._pool = None
+            # Pages still pending are discarded. They are requested
+            # again once data mode is enabled.
+            self._generation    += 1
+            self._loading       = {'start': False, 'end': False}
+            return
+        if not self._pool:
+            # The rows replace any content widget added before.
+            self._scroll.clear_widgets()
+            self._pool = _RowPool(self)
+            self._scroll.add_widget(self._pool)
+            self._scroll.bind(scroll_y = self._pool._trigger, size = self._pool._trigger)
+        self._pool.reset()
+
+    def on_data(self, _, __):
+        """Callback for refreshing the visible rows in data mode."""
+        if self._pool:
+            self._pool.invalidate()
+
+    def on_row_height(self, _, __):
+        """Callback for repositioning the rows in data mode."""
+        if self._pool:
+            self._pool.invalidate()
+
+    def on_data_source(self, _, __):
+        """Callback for replacing the data source.
+
+        The current rows are discarded and the first page is requested
+        from the new source. Pages still pending from the previous
+        source are ignored.
+        """
+        self._generation    += 1
+        self._first_row     = 0
+        self._loading       = {'start': False, 'end': False}
+        self._exhausted     = False
+        self.data           = []
+        if self.data_source is not None:
+            self._fetch('end')
+
+    def _check_prefetch(self):
+        """Requests pages, if the viewport nears the start or the end.
+
+        The distance to look ahead consists of a minimum number of rows
+        plus the distance the kinetic scroll effect travels within
+        prefetch_time at its current velocity.
+        """
+        if self.data_source is None or not self._pool:
+            return
+        effect      = self._scroll.effect_y
+        velocity    = abs(effect.velocity) if effect else 0
+        distance    = self.prefetch_rows + velocity * self.prefetch_time / max(self.row_height, 1)
+        first, last = self._pool.visible_range
+
+        if len(self.data) - last < distance and not self._exhausted:
+            self._fetch('end')
+        if first < distance and self._first_row > 0:
+            self._fetch('start')
+
+    def _fetch(self, direction:str):
+        """Requests the next page in the given direction.
+
+        Args:
+            direction: Either 'start' or 'end' of the current rows.
+        """
+        if self._loading[direction]:
+            return
+        if direction == 'end':
+            start   = self._first_row + len(self.data)
+            count   = int(self.page_size)
+        else:
+            start   = max(self._first_row - int(self.page_size), 0)
+            count   = self._first_row - start
+
+        source      = self.data_source
+        callback    = _partial(self._insert_page, self._generation, direction, start)
+        self._loading[direction] = True
+        try:
+            if hasattr(source, '__anext__'):
+                _Tasks.submit(source.__anext__(), callback = callback)
+            else:
+                _Tasks.submit(source, start, count, callback = callback)
+        except Exception:
+            self._loading[direction] = False
+            raise
+
+    def _insert_page(self, generation:int, direction:str, start:int, page, error):
+        """Inserts a page fetched from the data source.
+
+        The method is called on Kivy's clock. If rows are inserted above
+        the viewport, the scroll position is corrected so that the
+        visible rows stay in place.
+
+        Args:
+            generation: Counter identifying the data source and the
+            data mode the page was requested in.
+            direction: Either 'start' or 'end' of the current rows.
+            start: Index of the first row of the page within the data
+            source.
+            page: The list of row dictionaries.
+            error: The exception raised by the data source, if any.
+        """
+        if generation != self._generation:
+            return
+        self._loading[direction] = False
+        if not self._pool:
+            return
+
+        if isinstance(error, StopAsyncIteration):
+            self._exhausted = True
+            return
+        if isinstance(error, _CancelledError):
+            return
+        if error:
+            _Logger.error('ScrollArea: Data source failed: ' + repr(error))
+            # Blocks the direction until the page is requested again.
+            self._loading[direction] = True
+            _Clock.schedule_once(_partial(self._retry, generation, direction), ScrollArea.RETRY_DELAY)
+            return
+
+        page = list(page or [])
+        if direction == 'end':
+            self._exhausted = self._exhausted or len(page) < self.page_size
+            self.data.extend(page)
+        else:
+            self._pool.shift(len(page))
+            self.data[0:0] = page
+            self._first_row = start
+
+        excess = len(self.data) - int(self.max_rows)
+        if self.max_rows <= 0 or excess <= 0 or hasattr(self.data_source, '__anext__'):
+            return
+        if direction == 'end':
+            self._pool.shift(-excess)
+            del self.data[:excess]
+            self._first_row += excess
+        else:
+            del self.data[-excess:]
+            self._exhausted = False
+
+    def _retry(self, generation:int, direction:str, *_):
+        """Allows requesting a page again after the data source failed.
+
+        Args:
+            generation: Counter identifying the data source that failed.
+            direction: Either 'start' or 'end' of the current rows.
+        """
+        if generation != self._generation:
+            return
+        self._loading[direction] = False
+        self._check_prefetch()
+
+    def on__scroll(self, _, __):
+        """Follows the scroll state and enables data mode, if needed.
+
+        The scroll bar geometry is updated at most once per frame, no
+        matter how often the scroll position changes in between. Data
+        mode is enabled, if a view class was given beforehand.
+        """
+        for name in ('scroll_y', 'viewport_size', 'pos', 'size', 'bar_width'):
+            self._scroll.fbind(name, self._trigger_bar)
+        self._trigger_bar()
+        if self.viewclass is not None:
+            self.on_viewclass(self, self.viewclass)
+
+    def _update_bar(self, *_):
+        """Passes the latest scroll state on to the scroll bar.
+
+        The scroll bar only exists while the content overflows the
+        widget and the bar has a width. It is created when needed and
+        put aside for reuse by another ScrollArea widget otherwise. The
+        scroll bar places itself on the right edge of the widget.
+        """
+        scroll      = self._scroll
+        height      = scroll.viewport_size[1]
+        if height <= scroll.height or scroll.bar_width <= 0:
+            self._release_bar()
+            return
+
+        bar = self._acquire_bar()
+        bar.bar_width       = scroll.bar_width
+        bar.bar_length      = scroll.height * scroll.height / height
+        bar.track_pos       = [scroll.right - scroll.bar_width, scroll.y]
+        bar.track_length    = scroll.height
+        bar.bar_value       = scroll.scroll_y
+
+    def _acquire_bar(self) -> _ScrollBar:
+        """Returns the scroll bar and creates it, if necessary.
+
+        Returns:
+            The vertical scroll bar of the widget.
+        """
+        if self._bar:
+            return self._bar
+        pool        = ScrollArea._bar_pool
+        self._bar   = pool.pop() if pool else _ScrollBar(bar_orientation = _ScrollBar.STR_VERTICAL)
+        self._style_bar()
+        super(ScrollArea, self).add_widget(self._bar)
+        return self._bar
+
+    def _release_bar(self):
+        """Removes the scroll bar and keeps it for reuse, if possible."""
+        if not self._bar:
+            return
+        super(ScrollArea, self).remove_widget(self._bar)
+        if len(ScrollArea._bar_pool) < ScrollArea.BAR_POOL_SIZE:
+            ScrollArea._bar_pool.append(self._bar)
+        self._bar = None
+
+    def _style_bar(self, *_):
+        """Passes the colors and the radius on to the scroll bar."""
+        if not self._bar:
+            return
+        self._bar.radius        = self.bar_radius
+        self._bar.fill_color    = self.bar_fill_color
+        self._bar.border_color  = self.bar_border_color
+
     def add_widget(self, widget:_List, index:int = 0, canvas=None):
         """Passes on the given child to the ScrollView widget.
 
         During initialization of the widget's own child, i.e. the
-        ScrollView and the ScrollBar widgets, the given widgets are
-        added as children of the ScrollArea widget. After initialization
+        ScrollView widget, the given widgets are added as children of
+        the ScrollArea widget. After initialization
         is complete a widget added from outside the ScrollArea widget
         will be passed on to the ScrollView widget and added there.
 
@@ -8,15 +8,18 @@ scroll bar.
 """
 
 from os.path import dirname as _dirname
+from os.path import join as _join
 
+from kivy.clock import Clock as _Clock
 from kivy.lang.builder import Builder as _Builder
+from kivy.properties import ListProperty as _ListProperty
 from kivy.properties import NumericProperty as _NumericProperty
 from kivy.properties import StringProperty as _StringProperty
 
 from ._box import Box as _Box
 
 
-_Builder.load_file(_dirname(__file__) + '\\_scrollbar.kv')
+_Builder.load_file(_join(_dirname(__file__), '_scrollbar.kv'))
 
 class ScrollBar(_Box):
     """Widget for a scroll bar with rounded corners.
@@ -26,6 +29,11 @@ class ScrollBar(_Box):
     Therefore, this widget defines a new scroll bar with rounded corners
     and the ability to define separate border and fill colors of the
     scroll bar.
+
+    The scroll bar is a Box without border and shadow. Box skips drawing
+    layers that are hidden by another layer, so the scroll bar is drawn
+    as a single rounded rectangle as long as border_width and
+    shadow_width are zero or border and fill have the same opaque color.
     """
 
     bar_orientation         = _StringProperty()
@@ -38,7 +46,9 @@ class ScrollBar(_Box):
     """The length of the scroll bar in pixels.
 
     Typically, the length of the scroll bar depends on the ratio of the
-    scroll areas size and the size of the document being scrolled.
+    scroll areas size and the size of the document being scrolled. The
+    length is never shorter than the rounded corners need. Shorter
+    values are raised to that minimum.
     """
 
     STR_VERTICAL            = 'vertical'
@@ -54,6 +64,42 @@ class ScrollBar(_Box):
     pixels.
     """
 
+    track_pos               = _ListProperty([0, 0])
+    """The position of the start of the track in pixels.
+
+    The scroll bar moves along a track, e.g. the right edge of a scroll
+    area. This is the lower left corner of that track.
+    """
+
+    track_length            = _NumericProperty(0)
+    """The length of the track in pixels.
+
+    If zero, the scroll bar does not position itself and its pos
+    attribute may be set directly.
+    """
+
+    bar_value               = _NumericProperty(0)
+    """The position of the scroll bar on its track between 0 and 1.
+
+    Zero places the scroll bar at the start of the track, i.e. at the
+    bottom or at the left.
+    """
+
+    def __init__(self, **kwargs):
+        """Initialization method of the widget.
+
+        Args:
+            **kwargs: Keyed arguments passed on to the base class.
+        """
+        self._trigger_update = _Clock.create_trigger(self._update, -1)
+        super(ScrollBar, self).__init__(**kwargs)
+        for name in ('bar_length', 'bar_width', 'radius', 'track_pos', 'track_length',
+                     'bar_value'):
+            self.fbind(name, self._trigger_update)
+        self.fbind('radius', self._clamp_length)
+        self._clamp_length()
+        self._trigger_update()
+
     def on_bar_orientation(self, _, orientation:str):
         """Determines the validity of the selected orientation value.
 
@@ -67,35 +113,51 @@ class ScrollBar(_Box):
             Can be either 'vertical' or 'horizontal'.
         """
         if orientation in (ScrollBar.STR_VERTICAL, ScrollBar.STR_HORIZONTAL):
-            self._update(self.bar_length)
+            self._clamp_length()
+            self._trigger_update()
             return
         raise Exception('Orientation must be "veritcal" or "horizontal". Got "' + orientation + '"')
 
-    def _update(self, length:int):
-        """Updates the scroll bar geometry.
+    def on_bar_length(self, _, __):
+        """Callback for scroll bar length changes.
 
-        Updates the dimensions of the scroll bar based on the selected
-        orientation and length. This method needs to be called whenever
-        either the orientation or the length of the scroll bar changes.
+        Raises the length to the minimum the rounded corners need. The
+        geometry itself is updated once per frame.
+        """
+        self._clamp_length()
 
-        Args:
-            length: The desired length of the scroll bar.
+    def _clamp_length(self, *_):
+        """Raises bar_length to the length the rounded corners need.
+
+        Setting the raised value calls on_bar_length() once more, which
+        then leaves the value as is.
         """
+        radius = self.radius if len(self.radius) == 4 else [0, 0, 0, 0]
         if self.bar_orientation == ScrollBar.STR_VERTICAL:
-            minv            = max(self.radius[0] + self.radius[3], self.radius[1] + self.radius[2])
-            self.bar_length = max(length, minv)
+            minimum = max(radius[0] + radius[3], radius[1] + radius[2])
         elif self.bar_orientation == ScrollBar.STR_HORIZONTAL:
-            minh            = max(self.radius[0] + self.radius[1], self.radius[2] + self.radius[3])
-            self.bar_length = max(length, minh)
-
-    def on_bar_length(self, _, length:int):
-        """Callback for scroll bar length changes.
+            minimum = max(radius[0] + radius[1], radius[2] + radius[3])
+        else:
+            return
+        if self.bar_length < minimum:
+            self.bar_length = minimum
 
-        This is a callback method that gets called whenever the length
-        of the scroll bar is changed. It then triggers an update of the
-        scroll bar's dimensions.
+    def _update(self, *_):
+        """Updates the scroll bar geometry.
 
-        Args:
-            length: The desired length of the scroll bar in pixels.
+        Updates the dimensions and the position of the scroll bar based
+        on the selected orientation, length and position on the track.
+        The method is triggered at most once per frame, no matter how
+        many of these values changed.
         """
-        self._update(length)
+        length = self.bar_length
+        if self.bar_orientation == ScrollBar.STR_VERTICAL:
+            self.size   = [self.bar_width, length]
+            if self.track_length > 0:
+                self.pos = [self.track_pos[0],
+                            self.track_pos[1] + self.bar_value * (self.track_length - length)]
+        elif self.bar_orientation == ScrollBar.STR_HORIZONTAL:
+            self.size   = [length, self.bar_width]
+            if self.track_length > 0:
+                self.pos = [self.track_pos[0] + self.bar_value * (self.track_length - length),
+                            self.track_pos[1]]
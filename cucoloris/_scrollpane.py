@@ -0,0 +1,554 @@
+"""Defines the scroll view used inside the ScrollArea widget.
+
+Kivy's ScrollView is a StencilView, i.e. it clips its content by
+drawing its own rectangle into the stencil buffer. Every scroll view on
+screen pushes and pops a stencil layer, which is costly on low-end GPUs,
+especially if scroll views are nested. This module defines a scroll view
+that can clip its content using a scissor rectangle instead. Stencil
+clipping is only needed for rounded corners or if the widget is
+transformed by a parent in a way a scissor rectangle cannot follow.
+
+In addition, the scroll view can exclude the children of its content
+from rendering while they are scrolled out of view. Then, only the
+instructions of visible children are drawn, regardless of how long the
+content is. For static content, the scroll view can also render the
+content into a texture once and only move that texture while scrolling.
+"""
+
+from bisect import bisect_left as _bisect_left
+from bisect import bisect_right as _bisect_right
+from math import ceil as _ceil
+
+from kivy.clock import Clock as _Clock
+from kivy.graphics import BindTexture as _BindTexture
+from kivy.graphics import ClearBuffers as _ClearBuffers
+from kivy.graphics import ClearColor as _ClearColor
+from kivy.graphics import Color as _Color
+from kivy.graphics import Fbo as _Fbo
+from kivy.graphics import InstructionGroup as _InstructionGroup
+from kivy.graphics import Rectangle as _Rectangle
+from kivy.graphics import RoundedRectangle as _RoundedRectangle
+from kivy.graphics import ScissorPop as _ScissorPop
+from kivy.graphics import ScissorPush as _ScissorPush
+from kivy.graphics import StencilPop as _StencilPop
+from kivy.graphics import StencilPush as _StencilPush
+from kivy.graphics import StencilUnUse as _StencilUnUse
+from kivy.graphics import StencilUse as _StencilUse
+from kivy.graphics import Translate as _Translate
+from kivy.properties import BooleanProperty as _BooleanProperty
+from kivy.properties import ListProperty as _ListProperty
+from kivy.properties import OptionProperty as _OptionProperty
+from kivy.uix.scrollview import ScrollView as _ScrollView
+from kivy.uix.widget import Widget as _Widget
+
+from ._render import Render as _Render
+
+
+class ScrollPane(_ScrollView):
+    """Scroll view with selectable clipping method.
+
+    The widget behaves like Kivy's ScrollView. However, the stencil
+    instructions inherited from StencilView are replaced by instructions
+    depending on the clip_mode attribute. A scissor rectangle is given
+    in window coordinates. Therefore, the widget follows the position of
+    every ancestor that moves its children without changing their
+    position, e.g. other scroll views.
+    """
+
+    clip_mode           = _OptionProperty('stencil', options=['stencil', 'scissor', 'auto'])
+    """The method used for clipping the content.
+
+    * stencil: The content is clipped using the stencil buffer like
+    Kivy's ScrollView does. This works for all transformations.
+    * scissor: The content is clipped using a scissor rectangle. This is
+    cheaper but requires an axis-aligned, unscaled widget.
+    * auto: Uses a scissor rectangle unless rounded clipping is needed,
+    i.e. unless a clip_radius is given.
+    """
+
+    clip_radius         = _ListProperty([0, 0, 0, 0])
+    """The radius of each corner of the clipping region in pixels.
+
+    Rounded clipping always uses the stencil buffer.
+    """
+
+    cull_content        = _BooleanProperty(False)
+    """Whether to skip drawing children that are out of view.
+
+    If True, each child of the content widget whose bounding box does
+    not intersect the visible region is excluded from rendering. The
+    visible children are looked up in an index sorted by position, so
+    scrolling only touches the children that enter or leave the view.
+    Children that move or resize are updated in the index individually.
+    Culling is not applied while the content is cached.
+    """
+
+    cache_content       = _BooleanProperty(False)
+    """Whether to render the content into a texture.
+
+    If True, the content is rendered into a frame buffer once. Scrolling
+    only moves the resulting texture, so a single textured rectangle is
+    drawn per frame. Whenever the canvas of any descendant changes, the
+    texture is rendered again. Therefore, this is meant for static
+    content. If the content exceeds the maximum texture size of the GPU,
+    a single tile of that size around the visible region is rendered.
+    Once the view leaves the tile, the tile is moved and the whole
+    texture is rendered again. If the content is detached from
+    rendering, e.g. hidden by its visible attribute, the texture is not
+    drawn either.
+
+    Scroll views inside cached content cannot be clipped by a scissor
+    rectangle, since the scissor rectangle is given in window
+    coordinates. If their clip_mode is 'auto', they use the stencil
+    buffer instead.
+    """
+
+    def __init__(self, **kwargs):
+        """Initialization method of the widget.
+
+        Args:
+            **kwargs: Keyed arguments passed on to the base class.
+        """
+        self._clip_before   = _InstructionGroup()
+        self._clip_after    = _InstructionGroup()
+        self._clip_shapes   = []
+        self._clip_scissor  = None
+        self._clip_current  = None
+        self._ancestors     = []
+        self._cull_parent   = None
+        self._cull_index    = []
+        self._cull_keys     = []
+        self._cull_height   = 0
+        self._cull_shown    = set()
+        self._cull_entries  = {}
+        self._cull_dirty    = set()
+        self._cache_parent  = None
+        self._cache_group   = None
+        self._cache_draw    = None
+        self._cache_fbo     = None
+        self._cache_shift   = None
+        self._cache_rect    = None
+        self._cache_tile    = None
+        self._trigger_clip  = _Clock.create_trigger(self._update_clip, -1)
+        self._trigger_bind  = _Clock.create_trigger(self._bind_ancestors, -1)
+        self._trigger_index = _Clock.create_trigger(self._index_content, -1)
+        self._trigger_cull  = _Clock.create_trigger(self._update_cull, -1)
+        super(ScrollPane, self).__init__(**kwargs)
+
+        self.fbind('pos', self._trigger_clip)
+        self.fbind('size', self._trigger_clip)
+        self.fbind('clip_mode', self._trigger_clip)
+        self.fbind('clip_radius', self._trigger_clip)
+        self.fbind('parent', self._trigger_bind)
+        self.fbind('cull_content', self._on_content)
+        self.fbind('cache_content', self._on_content)
+        self.fbind('_viewport', self._on_content)
+
+    def on_kv_post(self, base_widget:_Widget):
+        """Replaces the stencil instructions of Kivy's StencilView.
+
+        The kv rules, including the canvas instructions of StencilView,
+        are applied after initialization if the widget is created by a
+        kv rule. Therefore, the instructions are replaced once all rules
+        were applied.
+
+        Args:
+            base_widget: The widget whose kv rule created this widget.
+        """
+        super(ScrollPane, self).on_kv_post(base_widget)
+        if self._clip_current is not None:
+            return
+        ScrollPane._strip(self.canvas.before, _StencilPush, _StencilUse)
+        ScrollPane._strip(self.canvas.after, _StencilUnUse, _StencilPop)
+        self.canvas.before.insert(0, self._clip_before)
+        self.canvas.after.insert(0, self._clip_after)
+        self._build_clip(self._resolve_mode())
+        self._update_clip()
+
+    @staticmethod
+    def _strip(group:_InstructionGroup, first:type, last:type):
+        """Removes a sequence of instructions from a canvas group.
+
+        Args:
+            group: The canvas group to remove the instructions from.
+            first: Type of the first instruction to be removed.
+            last: Type of the last instruction to be removed.
+        """
+        removing = False
+        for instruction in list(group.children):
+            removing = removing or isinstance(instruction, first)
+            # Vertex instructions remove their texture binding, too.
+            if removing and not isinstance(instruction, _BindTexture):
+                group.remove(instruction)
+            if isinstance(instruction, last):
+                return
+
+    def _resolve_mode(self) -> str:
+        """Determines the clipping method to be used.
+
+        Inside cached content, the window coordinates of a scissor
+        rectangle are meaningless. Then, 'auto' uses the stencil buffer.
+
+        Returns:
+            Either 'stencil' or 'scissor'.
+        """
+        if self.clip_mode != 'auto':
+            return self.clip_mode
+        if any(self.clip_radius):
+            return 'stencil'
+        widget = self.parent
+        while isinstance(widget, _Widget):
+            if isinstance(widget, ScrollPane) and widget.cache_content:
+                return 'stencil'
+            widget = widget.parent
+        return 'scissor'
+
+    def _bind_ancestors(self, *_):
+        """Follows ancestors that move their children by transformation.
+
+        Scroll views, relative layouts and scatters change where their
+        children appear in the window without changing the children's
+        positions. The scissor rectangle needs to be updated in that case.
+        Since the chain of ancestors changes if any of them is moved to
+        another parent, the parent of each ancestor is followed, too.
+        """
+        for widget, uid in self._ancestors:
+            widget.unbind_uid(*uid)
+        self._ancestors = []
+
+        widget = self.parent
+        while isinstance(widget, _Widget):
+            uid = widget.fbind('parent', self._trigger_bind)
+            self._ancestors.append((widget, ('parent', uid)))
+            if type(widget).to_parent is not _Widget.to_parent:
+                names = ['pos', 'transform', 'scroll_x', 'scroll_y', 'cache_content']
+                for name in names:
+                    if name in widget.properties():
+                        uid = widget.fbind(name, self._trigger_clip)
+                        self._ancestors.append((widget, (name, uid)))
+            widget = widget.parent
+        self._trigger_clip()
+
+    def _update_clip(self, *_):
+        """Updates the clipping instructions."""
+        if self._clip_current is None:
+            return
+        mode = self._resolve_mode()
+        if (mode, any(self.clip_radius)) != self._clip_current:
+            self._build_clip(mode)
+
+        if mode == 'scissor':
+            x, y                        = self.to_window(*self.pos)
+            self._clip_scissor.x        = int(round(x))
+            self._clip_scissor.y        = int(round(y))
+            self._clip_scissor.width    = int(round(self.width))
+            self._clip_scissor.height   = int(round(self.height))
+            return
+
+        for shape in self._clip_shapes:
+            shape.pos   = self.pos
+            shape.size  = self.size
+            if isinstance(shape, _RoundedRectangle):
+                shape.radius = self.clip_radius
+
+    def _build_clip(self, mode:str):
+        """Creates the instructions for the given clipping method.
+
+        Args:
+            mode: Either 'stencil' or 'scissor'.
+        """
+        self._clip_before.clear()
+        self._clip_after.clear()
+        self._clip_current  = (mode, any(self.clip_radius))
+
+        if mode == 'scissor':
+            self._clip_scissor  = _ScissorPush()
+            self._clip_shapes   = []
+            self._clip_before.add(self._clip_scissor)
+            self._clip_after.add(_ScissorPop())
+            return
+
+        shape               = _RoundedRectangle if any(self.clip_radius) else _Rectangle
+        self._clip_scissor  = None
+        self._clip_shapes   = [shape(), shape()]
+        self._clip_before.add(_StencilPush())
+        self._clip_before.add(self._clip_shapes[0])
+        self._clip_before.add(_StencilUse())
+        self._clip_after.add(_StencilUnUse())
+        self._clip_after.add(self._clip_shapes[1])
+        self._clip_after.add(_StencilPop())
+
+    def update_from_scroll(self, *largs):
+        """Repositions the content and updates the culled children.
+
+        Args:
+            *largs: Arguments passed on to the base class.
+        """
+        super(ScrollPane, self).update_from_scroll(*largs)
+        if self._cull_parent:
+            self._trigger_cull()
+        if self._cache_parent:
+            self._update_cache()
+
+    def remove_widget(self, widget:_Widget, *args, **kwargs):
+        """Removes the content widget.
+
+        The canvas of cached content is put back in place beforehand, so
+        that the base class can remove it as usual.
+
+        Args:
+            widget: The widget to be removed.
+            *args: Arguments passed on to the base class.
+            **kwargs: Keyed arguments passed on to the base class.
+        """
+        if widget is self._cache_parent:
+            self._uncache()
+        super(ScrollPane, self).remove_widget(widget, *args, **kwargs)
+
+    def _on_content(self, *_):
+        """Follows the current content widget for culling and caching."""
+        if self._cache_parent is not self._viewport or not self.cache_content:
+            self._uncache()
+            if self.cache_content and self._viewport:
+                self._cache(self._viewport)
+        if self._cull_parent:
+            self._cull_parent.unbind(children = self._on_cull_children)
+            for widget in list(self._cull_entries):
+                self._unwatch(widget)
+            self._cull_index    = []
+            self._cull_keys     = []
+            self._cull_height   = 0
+            self._cull_shown    = set()
+            self._cull_dirty    = set()
+            self._cull_parent   = None
+
+        if self.cull_content and not self.cache_content and self._viewport:
+            self._cull_parent = self._viewport
+            self._cull_parent.bind(children = self._on_cull_children)
+            self._on_cull_children(self._cull_parent, self._cull_parent.children)
+
+    def _on_cull_children(self, _, children:list):
+        """Follows children added to or removed from the content.
+
+        Kivy updates the list of children before it removes the canvas
+        of a removed child. Attaching it right away puts it back in place
+        so that Kivy can remove it as usual.
+
+        Args:
+            children: The current children of the content widget.
+        """
+        current = set(children)
+        for widget in [widget for widget in self._cull_entries if widget not in current]:
+            self._unwatch(widget)
+        for widget in children:
+            if widget not in self._cull_entries:
+                self._cull_entries[widget] = None
+                widget.bind(pos = self._on_cull_child, size = self._on_cull_child)
+                self._cull_dirty.add(widget)
+        self._trigger_index()
+
+    def _on_cull_child(self, widget:_Widget, _):
+        """Schedules updating the index entry of a moved or resized child.
+
+        Args:
+            widget: The child of the content widget.
+        """
+        self._cull_dirty.add(widget)
+        self._trigger_index()
+
+    def _unwatch(self, widget:_Widget):
+        """Stops culling the given child.
+
+        Args:
+            widget: A child of the content widget.
+        """
+        widget.unbind(pos = self._on_cull_child, size = self._on_cull_child)
+        self._unindex(widget)
+        del self._cull_entries[widget]
+        self._cull_dirty.discard(widget)
+        self._cull_shown.discard(widget)
+        _Render.attach(widget, 'cull')
+
+    def _unindex(self, widget:_Widget):
+        """Removes the entry of a child from the index, if it has one.
+
+        Args:
+            widget: A child of the content widget.
+        """
+        entry = self._cull_entries.get(widget)
+        if entry is None:
+            return
+        position = _bisect_left(self._cull_keys, entry[0])
+        while self._cull_index[position][0] is not widget:
+            position += 1
+        del self._cull_index[position]
+        del self._cull_keys[position]
+        self._cull_entries[widget] = None
+
+    def _index_content(self, *_):
+        """Updates the index entries of children that moved or resized.
+
+        Each entry is moved to its new position in the index sorted by
+        the vertical position of the children. If most children changed,
+        e.g. after a relayout, the index is sorted again as a whole.
+        """
+        if not self._cull_parent:
+            return
+        dirty               = self._cull_dirty
+        self._cull_dirty    = set()
+        if len(dirty) * 4 > len(self._cull_entries):
+            for widget in dirty:
+                self._cull_entries[widget] = (widget.y, widget.top)
+            index = sorted(((widget, y, top) for widget, (y, top) in self._cull_entries.items()),
+                           key = lambda entry: entry[1])
+            self._cull_index    = index
+            self._cull_keys     = [entry[1] for entry in index]
+            self._cull_height   = max([entry[2] - entry[1] for entry in index], default = 0)
+        else:
+            for widget in dirty:
+                self._unindex(widget)
+                position = _bisect_right(self._cull_keys, widget.y)
+                self._cull_index.insert(position, (widget, widget.y, widget.top))
+                self._cull_keys.insert(position, widget.y)
+                self._cull_entries[widget] = (widget.y, widget.top)
+                # The height only serves as bound, so it is never lowered here.
+                self._cull_height = max(self._cull_height, widget.height)
+
+        # Changed children are checked once, whether they were drawn or not.
+        self._cull_shown -= dirty
+        self._update_cull()
+        for widget in dirty:
+            if widget not in self._cull_shown:
+                _Render.detach(widget, 'cull')
+
+    def _update_cull(self, *_):
+        """Detaches children that left and attaches those entering view.
+
+        The content is drawn translated by g_translate, so the visible
+        region in content coordinates is the widget's own rectangle moved
+        back by that translation.
+        """
+        if not self._cull_parent:
+            return
+        left, bottom    = self.x - self.g_translate.x, self.y - self.g_translate.y
+        right, top      = left + self.width, bottom + self.height
+
+        # Children starting above the view cannot be visible. Neither can
+        # children starting further below than the highest child is high.
+        first   = _bisect_left(self._cull_keys, bottom - self._cull_height)
+        last    = _bisect_right(self._cull_keys, top)
+        shown   = set()
+        for widget, y, ytop in self._cull_index[first:last]:
+            if ytop >= bottom and widget.right >= left and widget.x <= right:
+                shown.add(widget)
+
+        for widget in self._cull_shown - shown:
+            _Render.detach(widget, 'cull')
+        for widget in shown - self._cull_shown:
+            _Render.attach(widget, 'cull')
+        self._cull_shown = shown
+
+    def _cache(self, viewport:_Widget):
+        """Moves the canvas of the content into a frame buffer.
+
+        The frame buffer is part of the viewport canvas, so Kivy renders
+        it again whenever one of the instructions inside was changed.
+        The resulting texture is drawn in content coordinates, i.e. it is
+        moved by the scroll translation like the content would be.
+
+        Args:
+            viewport: The content widget.
+        """
+        index = self.canvas_viewport.indexof(viewport.canvas)
+        if index < 0:
+            return
+        fbo = _Fbo(size = (1, 1), with_stencilbuffer = True)
+        with fbo:
+            _ClearColor(0, 0, 0, 0)
+            _ClearBuffers(clear_stencil = True)
+            self._cache_shift = _Translate(0, 0)
+        self.canvas_viewport.remove(viewport.canvas)
+        fbo.add(viewport.canvas)
+
+        self._cache_fbo     = fbo
+        self._cache_rect    = _Rectangle(texture = fbo.texture)
+        self._cache_draw    = _InstructionGroup()
+        self._cache_draw.add(fbo)
+        self._cache_draw.add(_Color(1, 1, 1, 1))
+        self._cache_draw.add(self._cache_rect)
+        self._cache_group   = _InstructionGroup()
+        self._cache_group.add(self._cache_draw)
+        self.canvas_viewport.insert(index, self._cache_group)
+        self._cache_parent  = viewport
+        self._cache_tile    = None
+        _Render.listen(self._on_render)
+        self._update_cache()
+
+    def _on_render(self, widget:_Widget, _):
+        """Hides the texture while the cached content is detached.
+
+        Detaching the content, e.g. by setting visible to False, cannot
+        swap out its canvas, since that canvas lives in the frame buffer.
+        Instead, the frame buffer and the texture are taken out of the
+        viewport canvas, so neither is rendered.
+
+        Args:
+            widget: The widget that was detached or attached.
+        """
+        if widget is not self._cache_parent:
+            return
+        shown = self._cache_draw in self._cache_group.children
+        if _Render.is_detached(widget) and shown:
+            self._cache_group.remove(self._cache_draw)
+        elif not _Render.is_detached(widget) and not shown:
+            self._cache_group.add(self._cache_draw)
+
+    def _uncache(self):
+        """Puts the canvas of the content back into the viewport canvas."""
+        if not self._cache_parent:
+            return
+        _Render.unlisten(self._on_render)
+        viewport    = self._cache_parent
+        index       = self.canvas_viewport.indexof(self._cache_group)
+        self._cache_fbo.remove(viewport.canvas)
+        self.canvas_viewport.remove(self._cache_group)
+        self.canvas_viewport.insert(max(index, 0), viewport.canvas)
+        # Detaching again swaps out the canvas that was just put back.
+        for reason in _Render.reasons(viewport):
+            _Render.detach(viewport, reason)
+        self._cache_parent  = None
+        self._cache_group   = None
+        self._cache_draw    = None
+        self._cache_fbo     = None
+        self._cache_shift   = None
+        self._cache_rect    = None
+        self._cache_tile    = None
+
+    def _update_cache(self):
+        """Selects the part of the content rendered into the texture.
+
+        The texture covers the whole content if possible. Otherwise, a
+        tile of the maximum texture size centered on the visible region
+        is rendered. Moving the tile changes the translation inside the
+        frame buffer, which makes Kivy render it again.
+        """
+        viewport    = self._cache_parent
+        limit       = _Render.max_texture_size()
+        size        = [max(min(int(_ceil(length)), limit), 1) for length in viewport.size]
+        region      = [self.x - self.g_translate.x, self.y - self.g_translate.y]
+
+        tile = self._cache_tile
+        if tile and tile[2:] == size and \
+           all(tile[i] <= region[i] and region[i] + self.size[i] <= tile[i] + size[i]
+               for i in (0, 1)):
+            return
+
+        origin  = [int(max(min(region[i] + (self.size[i] - size[i]) / 2,
+                               viewport.size[i] - size[i]), 0)) for i in (0, 1)]
+        if list(self._cache_fbo.size) != size:
+            self._cache_fbo.size = size
+        self._cache_rect.texture    = self._cache_fbo.texture
+        self._cache_rect.pos        = origin
+        self._cache_rect.size       = size
+        self._cache_shift.xy        = (-origin[0], -origin[1])
+        self._cache_tile            = origin + size
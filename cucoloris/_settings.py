@@ -47,6 +47,8 @@ class Settings:
         """
         if _platform == 'win32':
             return -1
+        else:
+            return 0
 
     @staticmethod
     def get_scroll_threshold() -> int:
@@ -0,0 +1,94 @@
+"""Defines a helper for running work outside of Kivy's main loop.
+
+Loading data or running actions may take a while. If done on Kivy's
+main thread, animations and scrolling freeze until the work is
+finished. This module runs synchronous callables in a thread pool and
+asynchronous ones on the running asyncio event loop. In both cases, the
+result is handed back on Kivy's clock, i.e. on the main thread.
+"""
+
+from asyncio import CancelledError as _CancelledError
+from asyncio import ensure_future as _ensure_future
+from asyncio import get_running_loop as _get_running_loop
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from functools import partial as _partial
+from inspect import isawaitable as _isawaitable
+from inspect import iscoroutinefunction as _iscoroutinefunction
+from typing import Any as _Any
+from typing import Callable as _Callable
+
+from kivy.clock import Clock as _Clock
+
+
+class Tasks:
+    """Class for running work in the background.
+
+    Synchronous callables are run in a shared thread pool. Asynchronous
+    callables and awaitables are run on the asyncio event loop Kivy is
+    running on, e.g. if the application was started using
+    async_runTouchApp. The given callback is always called on Kivy's
+    clock with the result and the exception raised, if any.
+    """
+
+    MAX_WORKERS     = 4
+    """Maximum number of threads used for synchronous callables."""
+
+    _executor       = None
+    """Private attribute for the shared thread pool."""
+
+    @staticmethod
+    def submit(function:_Callable, *args, callback:_Callable[[_Any, BaseException], None]):
+        """Runs the given callable in the background.
+
+        Args:
+            function: A synchronous callable, a coroutine function or an
+            awaitable. Awaitables are awaited directly and ignore args.
+            *args: Positional arguments passed on to the callable.
+            callback: Called on Kivy's clock as callback(result, error)
+            once the work is finished. Either result or error is None.
+            If the work was cancelled, error is a CancelledError.
+
+        Returns:
+            The asyncio task or the concurrent future of the work.
+
+        Raises:
+            RuntimeError: An asynchronous callable or awaitable was given,
+            but there is no running event loop. A given awaitable is
+            closed in that case.
+        """
+        if _isawaitable(function) or _iscoroutinefunction(function):
+            try:
+                _get_running_loop()
+            except RuntimeError:
+                # Awaitables created by the caller would never be awaited.
+                if _isawaitable(function) and hasattr(function, 'close'):
+                    function.close()
+                raise
+            awaitable   = function if _isawaitable(function) else function(*args)
+            future      = _ensure_future(awaitable)
+        else:
+            if not Tasks._executor:
+                Tasks._executor = _ThreadPoolExecutor(max_workers = Tasks.MAX_WORKERS,
+                                                      thread_name_prefix = 'cucoloris')
+            future      = Tasks._executor.submit(function, *args)
+        future.add_done_callback(_partial(Tasks._done, callback))
+        return future
+
+    @staticmethod
+    def _done(callback:_Callable, future):
+        """Hands the outcome of the work back to Kivy's clock.
+
+        The method may be called from a worker thread. Kivy's clock is
+        thread-safe, so the callback is scheduled there.
+
+        Args:
+            callback: The callback given to submit().
+            future: The finished asyncio task or concurrent future.
+        """
+        if future.cancelled():
+            error   = _CancelledError()
+            result  = None
+        else:
+            error   = future.exception()
+            result  = None if error else future.result()
+        _Clock.schedule_once(lambda _: callback(result, error))
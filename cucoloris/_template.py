@@ -0,0 +1,133 @@
+"""Defines a factory creating widgets of one kind ahead of time.
+
+Kivy compiles the expressions of kv files once, when the file is loaded,
+and caches which rules apply to a class. Creating a widget, e.g. a
+BtnPrimary, therefore mostly costs building the widget itself: its
+properties, its children and their canvases, and the bindings of the
+expressions that depend on the instance. That work cannot be skipped
+by public means. This module moves it out of the way instead: widgets
+are built in advance, in time-limited slices during the frames, and
+handed out ready-made when they are needed.
+"""
+
+from time import perf_counter as _perf_counter
+from typing import Union as _Union
+
+from kivy.clock import Clock as _Clock
+from kivy.factory import Factory as _Factory
+from kivy.uix.widget import Widget as _Widget
+
+
+class Template:
+    """Class for stamping out widgets of one class with preset attributes.
+
+    The widget class and its default attributes are resolved once, when
+    the template is created. prepare() builds widgets in advance, a few
+    per frame, and create() hands them out, e.g.:
+    ```py
+    template = Template('BtnPrimary', size_hint = (None, None))
+    template.prepare(500)
+    ...
+    rows = [template.create(text = 'Row ' + str(row), on_release = open_row)
+            for row in range(500)]
+    ```
+    A prepared widget only needs the attributes given to create() to be
+    set. If no prepared widget is left, create() builds one right away,
+    which costs as much as calling the class. Building a widget is not
+    faster than before, it just happens while there is time to spare.
+    """
+
+    BUDGET          = 0.004
+    """Maximum time in seconds spent on preparing widgets per frame."""
+
+    def __init__(self, cls:_Union[type, str], budget:float = None, **defaults):
+        """Initialization method of the class.
+
+        Args:
+            cls: The widget class, either as class or as name registered
+            with Kivy's Factory, e.g. 'BtnPrimary'.
+            budget: Time in seconds spent per frame. Defaults to BUDGET.
+            **defaults: Attributes of every widget and, for keys
+            starting with 'on_', callback functions to bind.
+        """
+        self.cls            = _Factory.get(cls) if isinstance(cls, str) else cls
+        self.budget         = budget if budget is not None else Template.BUDGET
+        self._attributes    = {key: value for key, value in defaults.items() if key[:3] != 'on_'}
+        self._handlers      = {key: value for key, value in defaults.items() if key[:3] == 'on_'}
+        self._prepared      = []
+        self._wanted        = 0
+        self._event         = None
+
+    @property
+    def prepared(self) -> int:
+        """Number of widgets built in advance and not handed out yet."""
+        return len(self._prepared)
+
+    def prepare(self, count:int):
+        """Builds widgets in advance, beginning with the next frame.
+
+        Args:
+            count: The number of widgets to keep ready. Widgets prepared
+            before count towards it.
+        """
+        self._wanted = count
+        if self._event is None and len(self._prepared) < count:
+            self._event = _Clock.schedule_interval(self._step, 0)
+
+    def cancel(self):
+        """Stops preparing widgets. Prepared widgets are kept."""
+        self._wanted = 0
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def create(self, **kwargs) -> _Widget:
+        """Returns a widget with the default and the given attributes.
+
+        Args:
+            **kwargs: Attributes to set and, for keys starting with
+            'on_', callback functions to bind.
+
+        Returns:
+            The widget, which has no parent.
+        """
+        widget      = self._prepared.pop() if self._prepared else self._build()
+        handlers    = {}
+        for key, value in kwargs.items():
+            if key[:3] == 'on_':
+                handlers[key] = value
+            else:
+                setattr(widget, key, value)
+        if handlers:
+            widget.bind(**handlers)
+        return widget
+
+    def _build(self) -> _Widget:
+        """Builds a widget with the default attributes.
+
+        Returns:
+            The new widget.
+        """
+        # Keyed arguments of the class may be overridden by the constants
+        # of dynamic kv classes, so the attributes are set afterwards.
+        widget = self.cls()
+        for key, value in self._attributes.items():
+            setattr(widget, key, value)
+        if self._handlers:
+            widget.bind(**self._handlers)
+        return widget
+
+    def _step(self, *_):
+        """Builds widgets until the time budget of the frame is spent.
+
+        Returns:
+            False once enough widgets are prepared, which stops the clock
+            event.
+        """
+        start = _perf_counter()
+        while len(self._prepared) < self._wanted and _perf_counter() - start <= self.budget:
+            self._prepared.append(self._build())
+        if len(self._prepared) < self._wanted:
+            return True
+        self._event = None
+        return False
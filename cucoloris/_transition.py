@@ -0,0 +1,200 @@
+"""Defines awaitable handles for animated transitions.
+
+Color transitions and size changes of cucoloris widgets are done by
+Kivy's Animation class, which reports completion through callbacks. If
+several effects shall run one after another, these callbacks need to be
+nested. This module defines a handle for running transitions that can
+be awaited in asynchronous code, e.g. if the application was started
+using async_runTouchApp, and that can be cancelled.
+"""
+
+from asyncio import CancelledError as _CancelledError
+from asyncio import get_running_loop as _get_running_loop
+from typing import List as _List
+from typing import Tuple as _Tuple
+from weakref import WeakSet as _WeakSet
+
+from kivy.animation import Animation as _Animation
+from kivy.clock import Clock as _Clock
+from kivy.uix.widget import Widget as _Widget
+
+
+class Transition:
+    """Handle for one or more running animations.
+
+    Awaiting the handle waits until all of its animations completed.
+    Cancelling the handle, or the task awaiting it, stops the animations
+    where they are. Kivy advances all running animations in a single
+    clock event per frame, so transitions started together also progress
+    together.
+
+    Most transitions are never awaited. Therefore, a transition only
+    follows its animations once it is awaited. Until then, an animation
+    that ended for whatever reason counts as completed.
+
+    Animations cancelled from outside, e.g. by Animation.cancel_all(),
+    do not report completion. Awaited transitions are therefore checked
+    once per frame, and those whose animations are gone are cancelled.
+    """
+
+    _watched        = _WeakSet()
+    """Private attribute for the transitions checked once per frame."""
+
+    _watch_event    = None
+    """Private attribute for the clock event checking the transitions."""
+
+    def __init__(self, pairs:_List[_Tuple[_Animation, _Widget]] = None,
+                 children:_List['Transition'] = None):
+        """Initialization method of the class.
+
+        Args:
+            pairs: The animations and the widgets they were started on.
+            If empty, the transition is complete right away.
+            children: Transitions cancelled along with this one.
+        """
+        self._pending   = [(animation, widget) for animation, widget in pairs or []
+                           if animation.have_properties_to_animate(widget)]
+        self._futures   = []
+        self._children  = list(children or [])
+        self._following = False
+        self.cancelled  = False
+        """True, if the transition was cancelled before completion."""
+
+    @classmethod
+    def gather(cls, *transitions:'Transition') -> 'Transition':
+        """Combines several transitions into one.
+
+        Args:
+            *transitions: The transitions to be combined.
+
+        Returns:
+            Transition: A transition that completes once all of the given
+            ones completed. Cancelling it cancels all of them.
+        """
+        running = [transition for transition in transitions if not transition.done]
+        return cls([pair for transition in running for pair in transition._pending], running)
+
+    @property
+    def done(self) -> bool:
+        """True, if all animations completed or were cancelled."""
+        if not self._following:
+            self._pending = [(animation, widget) for animation, widget in self._pending
+                             if animation.have_properties_to_animate(widget)]
+        return not self._pending
+
+    def cancel(self):
+        """Stops all animations without completing them.
+
+        The widgets keep the values reached so far. Anyone awaiting the
+        transition, or one of the transitions it gathered, gets a
+        CancelledError.
+        """
+        children        = self._children
+        self._children  = []
+        for child in children:
+            child.cancel()
+        if self.done:
+            return
+        for animation, widget in self._pending:
+            animation.cancel(widget)
+        self._abort()
+
+    def _abort(self):
+        """Marks the transition as cancelled and wakes up its awaiters.
+
+        The animations themselves are left alone.
+        """
+        pending         = self._pending
+        self._pending   = []
+        if not pending:
+            return
+        self.cancelled  = True
+        if self._following:
+            for animation, _ in pending:
+                animation.funbind('on_complete', self._on_complete)
+        for future in self._futures:
+            future.cancel()
+        self._futures   = []
+
+    def _on_complete(self, animation:_Animation, widget:_Widget):
+        """Callback for completed animations.
+
+        Args:
+            animation: The animation that completed.
+            widget: The widget it was running on.
+        """
+        if (animation, widget) not in self._pending:
+            return
+        self._pending.remove((animation, widget))
+        animation.funbind('on_complete', self._on_complete)
+        if self._pending:
+            return
+        for future in self._futures:
+            if not future.done():
+                future.set_result(None)
+        self._futures = []
+
+    def _follow(self):
+        """Starts following the animations that are still running.
+
+        The transition is completed by the animations and checked once
+        per frame from now on.
+        """
+        if self._following or self.done:
+            return
+        self._following = True
+        for animation, _ in self._pending:
+            animation.fbind('on_complete', self._on_complete)
+        Transition._watch(self)
+
+    @staticmethod
+    def _watch(transition:'Transition'):
+        """Checks the given transition once per frame until it is done.
+
+        Args:
+            transition: A pending transition.
+        """
+        Transition._watched.add(transition)
+        if Transition._watch_event is None:
+            Transition._watch_event = _Clock.schedule_interval(Transition._check, 0)
+
+    @staticmethod
+    def _check(*_) -> bool:
+        """Cancels transitions whose animations were cancelled from outside.
+
+        Returns:
+            bool: False, if no transition is left to check, which stops
+            the clock event.
+        """
+        for transition in list(Transition._watched):
+            if transition.done:
+                Transition._watched.discard(transition)
+            elif not all(animation.have_properties_to_animate(widget)
+                         for animation, widget in transition._pending):
+                Transition._watched.discard(transition)
+                transition._abort()
+        if Transition._watched:
+            return True
+        Transition._watch_event = None
+        return False
+
+    def __await__(self):
+        """Waits for the transition to complete.
+
+        Raises:
+            CancelledError: The transition was cancelled.
+        """
+        if self.cancelled:
+            raise _CancelledError()
+        self._follow()
+        if self.done:
+            return None
+        future = _get_running_loop().create_future()
+        self._futures.append(future)
+        try:
+            return (yield from future.__await__())
+        except _CancelledError:
+            # The awaiting task was cancelled, not the transition itself.
+            if not self.cancelled:
+                self.cancel()
+            raise
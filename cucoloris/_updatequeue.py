@@ -0,0 +1,98 @@
+"""Defines a queue for updating widgets from other threads.
+
+Kivy widgets must only be changed on Kivy's main thread. Threads reading
+sensors or polling databases therefore have to schedule a clock callback
+for every single change, which becomes expensive if values change
+thousands of times per second. This module collects such changes from
+any thread and applies them in a single clock callback per frame.
+"""
+
+from threading import Lock as _Lock
+from time import perf_counter as _perf_counter
+from typing import Any as _Any
+
+from kivy.clock import Clock as _Clock
+from kivy.event import EventDispatcher as _EventDispatcher
+from kivy.logger import Logger as _Logger
+
+
+class UpdateQueue:
+    """Class for applying property changes once per frame.
+
+    Any thread may post a new value for a property of a widget. If the
+    same property is posted several times before the next frame, only
+    the last value is applied. Updates are applied in the order they were
+    first posted. If applying them takes longer than BUDGET, the rest is
+    applied in the following frames.
+    """
+
+    BUDGET          = 0.004
+    """Maximum time in seconds spent on applying updates per frame."""
+
+    _pending        = {}
+    """Private attribute mapping widgets and property names to values."""
+
+    _lock           = _Lock()
+    """Private attribute guarding the pending updates."""
+
+    _scheduled      = False
+    """Private attribute indicating whether a flush is scheduled."""
+
+    @staticmethod
+    def post(widget:_EventDispatcher, name:str, value:_Any):
+        """Sets a property of a widget before the next frame.
+
+        The method may be called from any thread. It returns immediately.
+
+        Args:
+            widget: The widget or any other event dispatcher to update.
+            name: The name of the property.
+            value: The new value of the property.
+        """
+        key = (getattr(widget, '__self__', widget), name)
+        with UpdateQueue._lock:
+            UpdateQueue._pending[key] = value
+            if UpdateQueue._scheduled:
+                return
+            UpdateQueue._scheduled = True
+        # Kivy's clock is thread-safe.
+        _Clock.schedule_once(UpdateQueue._flush, -1)
+
+    @staticmethod
+    def pending() -> int:
+        """Returns the number of updates not applied yet.
+
+        Returns:
+            The number of pending updates.
+        """
+        with UpdateQueue._lock:
+            return len(UpdateQueue._pending)
+
+    @staticmethod
+    def _flush(*_):
+        """Applies the pending updates within the time budget."""
+        with UpdateQueue._lock:
+            items                   = iter(UpdateQueue._pending.items())
+            UpdateQueue._pending    = {}
+            UpdateQueue._scheduled  = False
+
+        start = _perf_counter()
+        for (widget, name), value in items:
+            try:
+                setattr(widget, name, value)
+            except Exception as error:
+                _Logger.error('UpdateQueue: Setting ' + name + ' failed: ' + repr(error))
+            if _perf_counter() - start > UpdateQueue.BUDGET:
+                break
+
+        remaining = dict(items)
+        if not remaining:
+            return
+        with UpdateQueue._lock:
+            # Values posted in the meantime are newer.
+            remaining.update(UpdateQueue._pending)
+            UpdateQueue._pending = remaining
+            if UpdateQueue._scheduled:
+                return
+            UpdateQueue._scheduled = True
+        _Clock.schedule_once(UpdateQueue._flush, 0)
@@ -0,0 +1,93 @@
+"""Defines a mixin for hiding widgets.
+
+Setting the opacity of a widget to zero makes it invisible, but Kivy
+still draws it and still dispatches touch events to it and its
+children. This module defines a mixin class with a visible attribute.
+A hidden widget is detached from rendering together with all of its
+children, and touches are not passed on to it anymore.
+"""
+
+from kivy.input.motionevent import MotionEvent as _MotionEvent
+from kivy.properties import BooleanProperty as _BooleanProperty
+from kivy.uix.widget import Widget as _Widget
+
+from ._render import Render as _Render
+
+
+class Visibility:
+    """Mixin class adding the visible attribute to a widget.
+
+    The class has to be listed before the widget class it is mixed in,
+    e.g. class MyLabel(Visibility, Label).
+    """
+
+    visible         = _BooleanProperty(True)
+    """Determines, whether the widget and its children are shown.
+
+    A hidden widget keeps its place, its size and its state, but it is
+    neither drawn nor does it receive touch events. Since its canvas is
+    removed from the canvas of its parent, a hidden widget costs nothing
+    while rendering, no matter how many children it has. If the widget
+    has focus, it loses focus once it is hidden.
+    """
+
+    def on_visible(self, _, visible:bool):
+        """Callback for showing or hiding the widget.
+
+        Args:
+            visible: True, if the widget is shown. False, otherwise.
+        """
+        if visible:
+            _Render.attach(self, 'hidden')
+            return
+        _Render.detach(self, 'hidden')
+        if getattr(self, 'focus', False):
+            self.focus = False
+
+    def isshown(self) -> bool:
+        """Returns, whether the widget can be seen.
+
+        In contrast to the visible attribute, the method also takes the
+        ancestors of the widget into account. A widget cannot be seen if
+        any of its ancestors is hidden.
+
+        Returns:
+            bool: True, if neither the widget nor any of its ancestors
+            is hidden. False, otherwise.
+        """
+        widget = self
+        while isinstance(widget, _Widget):
+            if _Render.is_detached(widget, 'hidden'):
+                return False
+            widget = widget.parent
+        return True
+
+    def on_touch_down(self, touch:_MotionEvent):
+        """Ignores touches while the widget is hidden.
+
+        Args:
+            touch: Information about the touch.
+        """
+        if not self.visible:
+            return False
+        return super(Visibility, self).on_touch_down(touch)
+
+    def on_touch_move(self, touch:_MotionEvent):
+        """Ignores dragging movements while the widget is hidden.
+
+        Args:
+            touch: Information about the touch.
+        """
+        if not self.visible:
+            return False
+        return super(Visibility, self).on_touch_move(touch)
+
+    def on_touch_up(self, touch:_MotionEvent):
+        """Ignores touch releases while the widget is hidden.
+
+        Args:
+            touch: Information about the touch.
+        """
+        if not self.visible:
+            return False
+        return super(Visibility, self).on_touch_up(touch)
@@ -0,0 +1,364 @@
+"""Defines a pool for reusing widgets.
+
+Screens that rebuild lists or dialogs discard whole subtrees of buttons
+and form controls only to create the same kind of widgets again. Each
+new widget applies its kv rules and binds its expressions anew, and
+each discarded one has to be collected by the garbage collector. This
+module parks released widgets instead and hands them out again, reset
+to the state they had after creation.
+"""
+
+import ast as _ast
+import builtins as _builtins
+from types import CodeType as _CodeType
+from typing import Union as _Union
+from weakref import WeakKeyDictionary as _WeakKeyDictionary
+
+from kivy.event import EventDispatcher as _EventDispatcher
+from kivy.factory import Factory as _Factory
+from kivy.lang.builder import Builder as _Builder
+from kivy.lang.parser import global_idmap as _global_idmap
+from kivy.uix.widget import Widget as _Widget
+
+
+class WidgetPool:
+    """Class for acquiring widgets from and releasing them to a pool.
+
+    Widgets are parked per class. If a parked widget is available,
+    acquire() returns it, otherwise a new one is created, e.g.:
+    ```py
+    rows = [WidgetPool.acquire('BtnPrimary', text = 'Row ' + str(row), on_release = open_row)
+            for row in range(500)]
+    ...
+    for row in rows:
+        WidgetPool.release(row)
+    ```
+    On release, the widget is removed from its parent. Callback functions
+    bound since creation are unbound, attributes set by acquire() and
+    the constant values of the kv rules are restored, and children added
+    since creation are removed or, if they came from the pool, released
+    as well. Finally, the reset() method of the widget is called, if it
+    has one, to clear focus, hover and pressed states.
+
+    At most CAPACITY widgets of a class are parked, unless set otherwise
+    by set_capacity(). Widgets released beyond that are dropped.
+    """
+
+    CAPACITY        = 512
+    """Default maximum number of parked widgets per class."""
+
+    _parked         = {}
+    """Private attribute mapping widget classes to their parked widgets."""
+
+    _capacities     = {}
+    """Private attribute mapping widget classes to their capacity."""
+
+    _counters       = {}
+    """Private attribute mapping widget classes to hits, misses and drops."""
+
+    _records        = _WeakKeyDictionary()
+    """Private attribute mapping widgets to their state after creation."""
+
+    _constants      = {}
+    """Private attribute mapping widget classes to their constant kv values."""
+
+    _RESERVED       = ('app', 'self', 'root', 'ctx')
+    """Private attribute for kv names that depend on the widget or its app."""
+
+    @staticmethod
+    def acquire(cls:_Union[type, str], **kwargs) -> _Widget:
+        """Returns a parked widget or a new one.
+
+        Args:
+            cls: The widget class, either as class or as name registered
+            with Kivy's Factory, e.g. 'BtnPrimary'.
+            **kwargs: Attributes to set and, for keys starting with
+            'on_', callback functions to bind.
+
+        Returns:
+            The widget, which has no parent.
+        """
+        cls         = _Factory.get(cls) if isinstance(cls, str) else cls
+        parked      = WidgetPool._parked.get(cls)
+        counters    = WidgetPool._counters.setdefault(cls, [0, 0, 0])
+        if parked:
+            widget          = parked.pop()
+            counters[0]    += 1
+        else:
+            widget          = cls()
+            counters[1]    += 1
+            if cls not in WidgetPool._constants:
+                WidgetPool._constants[cls] = WidgetPool._kv_constants(widget)
+            WidgetPool._records[widget] = {'observers': WidgetPool._observers(widget),
+                                           'children': list(widget.children),
+                                           'initial': {}}
+        record              = WidgetPool._records[widget]
+        record['parked']    = False
+
+        handlers = {}
+        for key, value in kwargs.items():
+            if key[:3] == 'on_':
+                handlers[key] = value
+                continue
+            if key not in record['initial']:
+                record['initial'][key] = WidgetPool._copy(getattr(widget, key))
+            setattr(widget, key, value)
+        if handlers:
+            widget.bind(**handlers)
+        return widget
+
+    @staticmethod
+    def release(widget:_Widget) -> bool:
+        """Resets a widget and parks it for later use.
+
+        Releasing a parked widget again has no effect.
+
+        Args:
+            widget: A widget returned by acquire().
+
+        Returns:
+            bool: True, if the widget was parked. False, if the pool of
+            its class was full and the widget was dropped.
+        """
+        record = WidgetPool._records.get(widget)
+        if record is None:
+            raise Exception("WidgetPool: The widget was not acquired from the pool.")
+        if record['parked']:
+            return True
+        if widget.parent is not None:
+            widget.parent.remove_widget(widget)
+
+        cls     = type(widget)
+        parked  = WidgetPool._parked.setdefault(cls, [])
+        if len(parked) >= WidgetPool.get_capacity(cls):
+            WidgetPool._counters.setdefault(cls, [0, 0, 0])[2] += 1
+            return False
+
+        WidgetPool._reset(widget, record)
+        record['parked'] = True
+        parked.append(widget)
+        return True
+
+    @staticmethod
+    def get_capacity(cls:_Union[type, str]) -> int:
+        """Returns the maximum number of parked widgets of a class.
+
+        Args:
+            cls: The widget class or its name.
+
+        Returns:
+            int: The capacity of the class.
+        """
+        cls = _Factory.get(cls) if isinstance(cls, str) else cls
+        return WidgetPool._capacities.get(cls, WidgetPool.CAPACITY)
+
+    @staticmethod
+    def set_capacity(cls:_Union[type, str], capacity:int):
+        """Sets the maximum number of parked widgets of a class.
+
+        Parked widgets beyond the new capacity are dropped.
+
+        Args:
+            cls: The widget class or its name.
+            capacity: The maximum number of parked widgets.
+        """
+        cls                             = _Factory.get(cls) if isinstance(cls, str) else cls
+        WidgetPool._capacities[cls]     = capacity
+        parked                          = WidgetPool._parked.get(cls, [])
+        del parked[capacity:]
+
+    @staticmethod
+    def clear(cls:_Union[type, str] = None):
+        """Drops parked widgets.
+
+        Args:
+            cls: The widget class or its name. If None, the parked
+            widgets of all classes are dropped.
+        """
+        if cls is None:
+            WidgetPool._parked.clear()
+            return
+        cls = _Factory.get(cls) if isinstance(cls, str) else cls
+        WidgetPool._parked.pop(cls, None)
+
+    @staticmethod
+    def stats(cls:_Union[type, str] = None) -> dict:
+        """Returns usage metrics of the pool.
+
+        Args:
+            cls: The widget class or its name. If None, the metrics of
+            all classes are summed up.
+
+        Returns:
+            dict: The number of 'hits', i.e. acquired widgets that were
+            parked, of 'misses', i.e. acquired widgets that had to be
+            created, of 'dropped' widgets released to a full pool, of
+            currently 'parked' widgets and the 'hit_rate', i.e. the share
+            of hits among all acquired widgets.
+        """
+        if cls is None:
+            classes = set(WidgetPool._counters) | set(WidgetPool._parked)
+        else:
+            classes = [_Factory.get(cls) if isinstance(cls, str) else cls]
+        hits = misses = dropped = parked = 0
+        for each in classes:
+            counters    = WidgetPool._counters.get(each, [0, 0, 0])
+            hits       += counters[0]
+            misses     += counters[1]
+            dropped    += counters[2]
+            parked     += len(WidgetPool._parked.get(each, []))
+        return {'hits': hits,
+                'misses': misses,
+                'dropped': dropped,
+                'parked': parked,
+                'hit_rate': hits / (hits + misses) if hits + misses else 0.0}
+
+    @staticmethod
+    def _reset(widget:_Widget, record:dict):
+        """Returns a widget to the state it had after creation.
+
+        Args:
+            widget: The widget to reset.
+            record: The state of the widget after creation.
+        """
+        for child in list(widget.children):
+            if any(child is original for original in record['children']):
+                continue
+            if child in WidgetPool._records:
+                WidgetPool.release(child)
+            else:
+                widget.remove_widget(child)
+
+        for name, entries in WidgetPool._observers(widget).items():
+            known = record['observers'].get(name, {})
+            for key, (callback, is_ref, uid) in entries.items():
+                if key in known:
+                    continue
+                if uid:
+                    widget.unbind_uid(name, uid)
+                    continue
+                callback = callback() if is_ref else callback
+                if callback is not None:
+                    widget.unbind(**{name: callback})
+
+        for key, value in record['initial'].items():
+            setattr(widget, key, WidgetPool._copy(value))
+        for key, value in WidgetPool._constants.get(type(widget), {}).items():
+            setattr(widget, key, WidgetPool._copy(value))
+        if hasattr(widget, 'reset'):
+            widget.reset()
+
+    @staticmethod
+    def _observers(widget:_Widget) -> dict:
+        """Collects the callback functions bound to a widget.
+
+        Args:
+            widget: The widget.
+
+        Returns:
+            dict: The names of properties and events mapped to their
+            callbacks, each identified by the callback and its uid.
+        """
+        observers = {}
+        for name in list(widget.properties()) + list(widget.events()):
+            entries = widget.get_property_observers(name, True)
+            if entries:
+                observers[name] = {(id(callback), uid): (callback, is_ref, uid)
+                                   for callback, _, _, is_ref, uid in entries}
+        return observers
+
+    @staticmethod
+    def _kv_constants(widget:_Widget) -> dict:
+        """Evaluates the constant properties of the kv rules of a widget.
+
+        Constants are values that use nothing but kv imports and
+        builtins, e.g. colors given by utils.get_color_from_hex(). Later
+        rules override earlier ones.
+
+        Args:
+            widget: A widget of the class.
+
+        Returns:
+            dict: The names of the properties mapped to their values.
+        """
+        rules       = _Builder.match(widget)
+        ids         = set()
+        for rule in rules:
+            ids |= WidgetPool._ids(rule)
+        idmap       = dict(_global_idmap)
+        constants   = {}
+        for rule in rules:
+            for key, prop in rule.properties.items():
+                if not WidgetPool._is_constant(prop, ids):
+                    constants.pop(key, None)
+                elif type(prop.co_value) is _CodeType:
+                    constants[key] = eval(prop.co_value, idmap)
+                else:
+                    constants[key] = prop.co_value
+        return constants
+
+    @staticmethod
+    def _is_constant(prop, ids:set) -> bool:
+        """Determines whether a kv property is the same for all instances.
+
+        Args:
+            prop: The ParserRuleProperty of a kv rule.
+            ids: The ids used by the rules, which may shadow kv imports
+            and builtins.
+
+        Returns:
+            bool: True, if the value uses nothing but kv imports and
+            builtins that cannot be observed. False, otherwise.
+        """
+        if prop.ignore_prev:
+            return False
+        if type(prop.co_value) is not _CodeType:
+            return True
+        if prop.watched_keys is not None and ['_'] in prop.watched_keys:
+            return False
+        try:
+            tree = _ast.parse(prop.value.strip(), mode = 'eval')
+        except SyntaxError:
+            return False
+        for node in _ast.walk(tree):
+            if not isinstance(node, _ast.Name):
+                continue
+            if node.id in WidgetPool._RESERVED or node.id in ids:
+                return False
+            if node.id in _global_idmap:
+                if isinstance(_global_idmap[node.id], _EventDispatcher):
+                    return False
+            elif not hasattr(_builtins, node.id):
+                return False
+        return True
+
+    @staticmethod
+    def _ids(rule) -> set:
+        """Collects the ids of a kv rule and its child rules.
+
+        Args:
+            rule: The kv rule.
+
+        Returns:
+            set: The ids found.
+        """
+        ids = {rule.id.split('#', 1)[0].strip()} if rule.id else set()
+        for child in rule.children:
+            ids |= WidgetPool._ids(child)
+        return ids
+
+    @staticmethod
+    def _copy(value):
+        """Copies lists and dictionaries, so they can be restored later.
+
+        Args:
+            value: The value of an attribute.
+
+        Returns:
+            A copy of lists and dictionaries, the value itself otherwise.
+        """
+        if isinstance(value, list):
+            return list(value)
+        if isinstance(value, dict):
+            return dict(value)
+        return value
@@ -1,13 +1,14 @@
 """Defines a background widget to create a single-color background."""
 
 from os.path import dirname as _dirname
+from os.path import join as _join
 from typing import Optional as _Optional
 
 from kivy.lang.builder import Builder as _Builder
 from kivy.properties import ListProperty as _ListProperty
 from kivy.uix.widget import Widget as _Widget
 
-_Builder.load_file(_dirname(__file__) + '\\background.kv')
+_Builder.load_file(_join(_dirname(__file__), 'background.kv'))
 
 class Background(_Widget):
     """Simple single-color background.
@@ -5,22 +5,32 @@ to the Bootstrap classes btn-primary, btn-secondary,
 btn-outline-primary, btn-outline-secondary, etc.
 """
 
+from functools import partial as _partial
 from os.path import dirname as _dirname
+from os.path import join as _join
+from typing import Any as _Any
 from typing import List as _List
 
+from kivy.animation import Animation as _Animation
+from kivy.clock import Clock as _Clock
+from kivy.graphics import Color as _Color
 from kivy.lang.builder import Builder as _Builder
+from kivy.logger import Logger as _Logger
 from kivy.properties import ListProperty as _ListProperty
 from kivy.properties import ObjectProperty as _ObjectProperty
 from kivy.properties import StringProperty as _StringProperty
 from kivy.properties import BooleanProperty as _BooleanProperty
+from kivy.properties import NumericProperty as _NumericProperty
+from kivy.properties import OptionProperty as _OptionProperty
 from kivy.uix.behaviors.focus import FocusBehavior as _FocusBehaviour
 from kivy.input.motionevent import MotionEvent as _MotionEvent
 
 from ._box import Box as _Box
 from ._settings import Settings as _Settings
+from ._tasks import Tasks as _Tasks
 
 
-_Builder.load_file(_dirname(__file__) + '\\button.kv')
+_Builder.load_file(_join(_dirname(__file__), 'button.kv'))
 
 class Btn(_FocusBehaviour, _Box):
     """Widget for drawing a touchable / clickable button.
@@ -29,8 +39,14 @@ class Btn(_FocusBehaviour, _Box):
     to the btn class of Bootstrap. From this base class the classes
     SolidButton and OutlineButton are derived modelling buttons similar
     to the btn and btn-outline classes of Bootstrap.
+
+    Instead of binding heavy work to on_release, it can be assigned to
+    the action attribute. The action is run in the background whenever
+    the button is released, and the button is busy until it finished.
     """
 
+    __events__      = ('on_action_done', 'on_action_error')
+
     padding         = _ListProperty([0,0])
     """Padding of the button's label in pixels.
 
@@ -99,6 +115,61 @@ class Btn(_FocusBehaviour, _Box):
     The button text also determines the button's overall size.
     """
 
+    busy_fill       = _ListProperty()
+    """Fill color used while the action is running.
+
+    The value has the same meaning as hover_fill and press_fill. If it
+    is empty, the button looks pressed while busy.
+    """
+
+    busy_text       = _ListProperty()
+    """Text color used while the action is running.
+
+    The value has the same meaning as hover_text and press_text. If it
+    is empty, the button looks pressed while busy.
+    """
+
+    action          = _ObjectProperty(None, allownone=True)
+    """Callable run in the background whenever the button is released.
+
+    The action may be a synchronous callable, which is run in a thread
+    pool, or a coroutine function, which is run on the asyncio event
+    loop Kivy is running on. It is called without arguments. Its result
+    is passed to the 'on_action_done' event and any exception raised to
+    the 'on_action_error' event, both dispatched on Kivy's clock. If the
+    task or future returned by run_action() is cancelled, e.g. when the
+    event loop shuts down, 'on_action_error' receives a CancelledError
+    and the button is no longer busy. The action must not modify widgets
+    directly, if it runs in a thread.
+    """
+
+    busy            = _BooleanProperty(False)
+    """Determines, whether the action is running.
+
+    While the button is busy, releasing it does not start the action
+    again, so that repeated clicks do not queue up duplicate work. The
+    attribute is meant to be read only.
+    """
+
+    visual_state    = _OptionProperty('normal', options=['normal', 'hover', 'focus', 'pressed', 'busy',
+                                                         'disabled'])
+    """The visual state the button is currently shown in.
+
+    The state is derived from whether the button is disabled, busy,
+    pressed, hovered or focused, in that order of precedence. Colors only
+    transition if the state changes. The attribute is meant to be read
+    only.
+    """
+
+    transitions_skipped = _NumericProperty(0)
+    """Number of events that did not change the target colors.
+
+    Each of these events would have started color transitions towards
+    the colors the button already had, e.g. leaving a focused button,
+    which looks like a hovered one. The counter can be used to
+    measure the effect of the state machine.
+    """
+
     _label          = _ObjectProperty()
     """Private attribute for the button's label object."""
 
@@ -120,41 +191,113 @@ class Btn(_FocusBehaviour, _Box):
         self.font_size  = font_size if font_size else self.font_size
         self.text_color = text_color if text_color else self.text_color
         self.underline  = underline
+        self._targets   = None
+        self._applied   = None
+        self._action    = None
+        self._runs      = 0
 
 
         super(Btn, self).__init__(**kwargs)
-        self.bind( on_enter     = self.on_enter,
-                   on_leave     = self.on_leave,
-                   on_press     = self.on_press,
-                   on_release   = self.on_release)
+        self._trigger_targets = _Clock.create_trigger(self._refresh_targets)
+        self.fbind('disabled', self._update_state)
+        self.fbind('busy', self._update_state)
+        for name in ('fill_color', 'text_color', 'hover_fill', 'press_fill', 'hover_text', 'press_text',
+                     'busy_fill', 'busy_text'):
+            self.fbind(name, self._invalidate_targets)
 
     def on_enter(self, _):
         """Callback for cursor hover events.
 
         If the cursor enters the button area and hovers over it, this
-        callback method is called. It can be used to modify the
-        button's colors.
+        callback method is called. It updates the visual state.
         """
+        self._update_state()
 
     def on_leave(self, _):
         """Callback for end of hover events.
 
         If the cursor leaves the button area and stops to hovers over
-        it, this callback method is called. It can be used to modify
-        the button's colors.
+        it, this callback method is called. It updates the visual state.
         """
+        self._update_state()
 
-    def on_release(self, _):
+    def on_release(self, touch:_MotionEvent):
         """Callback for button release events.
 
-        If the button is released, this callback method is called.
+        If the button is released, this callback method is called. It
+        updates the visual state and runs the action, if the touch is
+        released on the button.
+
+        Args:
+            touch: Motion event with more information about the release.
+        """
+        if self.action is not None and self.collide_point(*touch.pos):
+            self.run_action()
+        self._update_state()
+
+    def run_action(self):
+        """Runs the action in the background.
+
+        Nothing happens, if there is no action or the button is busy.
+
+        Returns:
+            The asyncio task or the concurrent future of the action, if
+            it was started. None, otherwise.
+        """
+        if self.action is None or self.busy:
+            return None
+        self.busy   = True
+        self._runs += 1
+        callback    = _partial(self._finish_action, self._runs)
+        try:
+            self._action = _Tasks.submit(self.action, callback = callback)
+        except Exception as error:
+            # E.g. a coroutine function without a running event loop.
+            callback(None, error)
+        return self._action
+
+    def on_action_done(self, result:_Any):
+        """Default handler of the 'on_action_done' event.
+
+        Args:
+            result: The return value of the action.
         """
 
+    def on_action_error(self, error:BaseException):
+        """Default handler of the 'on_action_error' event.
+
+        Args:
+            error: The exception raised by the action, or a
+            CancelledError if the action was cancelled.
+        """
+        _Logger.error('Btn: Action failed: ' + repr(error))
+
+    def _finish_action(self, run:int, result:_Any, error:BaseException):
+        """Ends the busy state and reports the outcome of the action.
+
+        Outcomes of actions started before the last reset() are ignored.
+
+        Args:
+            run: Counter identifying the run of the action.
+            result: The return value of the action.
+            error: The exception raised by the action, if any.
+        """
+        if run != self._runs:
+            return
+        self._action    = None
+        self.busy       = False
+        if error is not None:
+            self.dispatch('on_action_error', error)
+        else:
+            self.dispatch('on_action_done', result)
+
     def on_press(self, _):
         """Callback for button press events.
 
-        If the button is pressed, this callback method is called.
+        If the button is pressed, this callback method is called. It
+        updates the visual state.
         """
+        self._update_state()
 
     def on_focus(self, _, value:bool):
         """Callback for button focus events.
@@ -167,6 +310,7 @@ class Btn(_FocusBehaviour, _Box):
             self.show_shadow()
         else:
             self.hide_shadow()
+        self._update_state()
 
     def on__label(self, _, __):
         """Callback method for initializing the label.
@@ -177,123 +321,186 @@ class Btn(_FocusBehaviour, _Box):
         """
         self._label.font_name = _Settings.get_font_name()
 
+    def reset(self):
+        """Returns the button to its resting state.
 
-class SolidBtn(Btn):
-    """This widget represents a button with solid fill color.
-
-    The widget represents a button similar to the typical Bootstrap
-    buttons btn-primary, btn-secondary, etc. It can shift its color
-    while the cursor is hovering over it or the button is pressed.
-    There is also a shadow surrounding the button to indicate focus.
-    """
+        The button loses focus and is not busy anymore. A running action
+        is cancelled, if possible, and its outcome is not reported. Like
+        the layers, the label shows its nominal color right away.
+        """
+        if self._action is not None:
+            self._action.cancel()
+            self._action = None
+        self._runs += 1
+        self.focus  = False
+        self.busy   = False
+        super(Btn, self).reset()
+        label                   = self._label
+        _Animation.stop_all(label)
+        label.nominal_color     = self.text_color
+        label.color             = list(label.nominal_color)
+        label._hsv              = _Color(*label.color).hsv
+        self._applied           = None
+        self.visual_state       = self._derive_state()
+
+    def _derive_state(self) -> str:
+        """Derives the visual state from the state of interaction.
+
+        Returns:
+            str: The visual state the button has to be shown in.
+        """
+        if self.disabled:
+            return 'disabled'
+        if self.busy:
+            return 'busy'
+        if self.ispressed():
+            return 'pressed'
+        if self.ishover():
+            return 'hover'
+        if self.focus:
+            return 'focus'
+        return 'normal'
+
+    def _update_state(self, *_):
+        """Transitions the colors, if the targets of the visual state differ.
+
+        Many events do not change what the button looks like, e.g. a
+        release while the cursor is still hovering over the button, or
+        leaving a focused button, which looks like a hovered one. In
+        that case, no transition is started and transitions_skipped is
+        increased instead.
+        """
+        self.visual_state = self._derive_state()
+        if self._targets is None:
+            self._targets = self._compute_targets()
+        target = self._targets.get(self.visual_state)
+        if target is None or target == self._shown_targets():
+            self.transitions_skipped += 1
+            return
+        self._applied = target
+        self._apply_targets(*target)
+
+    def _shown_targets(self) -> tuple:
+        """Returns the targets the colors currently transition to.
+
+        Until a transition was started, the button shows the colors of
+        the normal state.
+        """
+        return self._applied if self._applied is not None else self._targets.get('normal')
 
-    def on_enter(self, hover:bool):
-        """Callback for cursor hover events.
+    def _invalidate_targets(self, *_):
+        """Discards the targets and schedules applying them again."""
+        self._targets = None
+        self._trigger_targets()
 
-        If the cursor enters the button area and hovers over it, this
-        callback method is called. It can be used to modify the
-        button's colors.
+    def _refresh_targets(self, *_):
+        """Applies the targets of the current visual state again.
 
-        Args:
-            hover: True, if the cursor hovers over the button. False,
-            otherwise.
+        The colors are only transitioned, if a transition was started
+        before and its targets changed. Otherwise, the button shows its
+        nominal colors, which follow the color attributes anyway.
+        """
+        self._targets = self._compute_targets()
+        if self._applied is None:
+            return
+        target = self._targets.get(self.visual_state)
+        if target is not None and target != self._applied:
+            self._applied = target
+            self._apply_targets(*target)
+
+    def _compute_targets(self) -> dict:
+        """Computes the target colors of each visual state.
+
+        The basic button does not change its colors. Derived classes
+        return a dictionary mapping each visual state to the arguments
+        of _apply_targets().
+
+        Returns:
+            dict: The targets of each visual state.
         """
-        super(SolidBtn, self).on_enter(hover)
-        self.fill.modify(self.hover_fill)
-        self.border.modify(self.hover_fill)
-        self._label.modify(self.hover_text)
+        return {}
 
-    def on_leave(self, hover:bool):
-        """Callback for end of hover events.
-
-        If the cursor leaves the button area and stops to hovers over
-        it, this callback method is called. It can be used to modify
-        the button's colors.
+    def _busy_targets(self, pressed:tuple) -> tuple:
+        """Returns the targets of the busy state.
 
         Args:
-            hover: True, if the cursor hovers over the button. False,
-            otherwise.
-        """
-        super(SolidBtn, self).on_leave(hover)
-        if not self.ispressed() and not self.focus:
-            self.fill.modify([0, 0, 0])
-            self.border.modify([0, 0, 0])
-            self._label.modify([0, 0, 0])
+            pressed: The targets of the pressed state, used for the
+            colors not given by busy_fill and busy_text.
 
-    def on_release(self, touch:_MotionEvent):
-        """Callback for button release events.
+        Returns:
+            tuple: The fill and text targets.
+        """
+        return (list(self.busy_fill) or pressed[0], list(self.busy_text) or pressed[1])
 
-        If the button is released, this callback method is called.
+    def _apply_targets(self, fill:_List[float], text:_List[float]):
+        """Starts the transitions towards the given targets.
 
         Args:
-            touch: Motion event with more information about the release.
+            fill: The target of the fill.
+            text: The target of the label.
         """
-        super(SolidBtn, self).on_release(touch)
-        if self.ishover():
-            self.fill.modify(self.hover_fill)
-            self.border.modify(self.hover_fill)
-            self._label.modify(self.hover_text)
-        elif self.focus:
-            self.fill.modify(self.hover_fill)
-            self.border.modify(self.hover_fill)
 
-    def on_focus(self, _, value:bool):
-        """Callback for button focus events.
 
-        If the button gets focus, this callback method is called. One
-        can focus on the button by either pressing it or pressing tab
-        until the button is focused on.
+class SolidBtn(Btn):
+    """This widget represents a button with solid fill color.
 
-        Args:
-            value: True, if the button has focus. False, otherwise.
-        """
-        if value:
-            self.show_shadow()
-            self.fill.modify(self.hover_fill)
-            self.border.modify(self.hover_fill)
-            self._label.modify(self.hover_text)
-        else:
-            self.hide_shadow()
-            if not self.ishover():
-                self.fill.modify([0, 0, 0])
-                self.border.modify([0, 0, 0])
-                self._label.modify([0, 0, 0])
+    The widget represents a button similar to the typical Bootstrap
+    buttons btn-primary, btn-secondary, etc. It can shift its color
+    while the cursor is hovering over it or the button is pressed.
+    There is also a shadow surrounding the button to indicate focus.
+    """
 
-    def on_press(self, touch:_MotionEvent):
-        """Callback for button press events.
+    def _compute_targets(self) -> dict:
+        """Computes the color offsets of each visual state.
 
-        If the button is pressed, this callback method is called.
+        Fill and border are shifted in HSV-space by hover_fill or
+        press_fill, the label by hover_text or press_text. A focused
+        button looks like a hovered one.
+
+        Returns:
+            dict: The fill and text offsets of each visual state.
+        """
+        normal  = ([0, 0, 0], [0, 0, 0])
+        hover   = (list(self.hover_fill), list(self.hover_text))
+        pressed = (list(self.press_fill), list(self.press_text))
+        return {'normal': normal,
+                'disabled': normal,
+                'hover': hover,
+                'focus': hover,
+                'pressed': pressed,
+                'busy': self._busy_targets(pressed)}
+
+    def _apply_targets(self, fill:_List[float], text:_List[float]):
+        """Shifts the colors by the given HSV-offsets.
 
         Args:
-            touch: Motion event with more information about the release.
+            fill: The HSV-offset of fill and border.
+            text: The HSV-offset of the label.
         """
-        super(SolidBtn, self).on_press(touch)
-        self.fill.modify(self.press_fill)
-        self.border.modify(self.press_fill)
-        self._label.modify(self.press_text)
+        self.fill.modify(fill)
+        self.border.modify(fill)
+        self._label.modify(text)
 
 
 class SolidLinkBtn(SolidBtn):
     """A button with a solid fill color for links.
 
     The solid link button has a similar hover animation to SolidBtn.
-    However, the color transition is applied to the link text only.
+    However, a pressed or focused link button shows its normal colors
+    as long as the cursor is not over it. Focus is only indicated by
+    the shadow.
     """
 
-    def on_leave(self, hover:bool):
-        """Callback for end of hover events.
-
-        If the cursor leaves the button area and stops to hovers over
-        it, this callback method is called. It can be used to modify
-        the button's colors.
+    def _derive_state(self) -> str:
+        """Derives the visual state from the state of interaction.
 
-        Args:
-            hover: True, if the cursor hovers over the button. False,
-            otherwise.
+        Returns:
+            str: The visual state the button has to be shown in.
         """
-        self.fill.modify([0, 0, 0])
-        self.border.modify([0, 0, 0])
-        self._label.modify([0, 0, 0])
+        state = super(SolidLinkBtn, self)._derive_state()
+        if state == 'focus' or (state == 'pressed' and not self.ishover()):
+            return 'normal'
+        return state
 
 
 class OutlineBtn(Btn):
@@ -306,63 +513,30 @@ class OutlineBtn(Btn):
     btn-outline-secondary, etc.
     """
 
-    def on_enter(self, _):
-        """Callback for cursor hover events.
-
-        If the cursor enters the button area and hovers over it, this
-        callback method is called. It can be used to modify the
-        button's colors.
-        """
-        self.fill.recolor(self.hover_fill)
-        self._label.recolor(self.hover_text)
-
-    def on_leave(self, _):
-        """Callback for end of hover events.
+    def _compute_targets(self) -> dict:
+        """Computes the colors of each visual state.
 
-        If the cursor leaves the button area and stops to hovers over
-        it, this callback method is called. It can be used to modify
-        the button's colors.
-        """
-        self.fill.recolor(self.fill_color)
-        self._label.recolor(self.text_color)
-
-    def on_release(self, _):
-        """Callback for button release events.
+        A focused button looks like a hovered one.
 
-        If the button is released, this callback method is called.
+        Returns:
+            dict: The fill and text colors of each visual state.
         """
-        if self.ishover():
-            self.fill.recolor(self.hover_fill)
-            self._label.recolor(self.hover_text)
-
-    def on_focus(self, _, value:bool):
-        """Callback for button focus events.
-
-        If the button gets focus, this callback method is called. One
-        can focus on the button by either pressing it or pressing tab
-        until the button is focused on.
+        normal  = (list(self.fill_color), list(self.text_color))
+        hover   = (list(self.hover_fill), list(self.hover_text))
+        pressed = (list(self.press_fill), list(self.press_text))
+        return {'normal': normal,
+                'disabled': normal,
+                'hover': hover,
+                'focus': hover,
+                'pressed': pressed,
+                'busy': self._busy_targets(pressed)}
+
+    def _apply_targets(self, fill:_List[float], text:_List[float]):
+        """Transitions fill and label to the given colors.
 
         Args:
-            value: True, if the button has focus. False, otherwise.
-        """
-        if value:
-            self.show_shadow()
-            self.fill.recolor(self.hover_fill)
-            self._label.recolor(self.hover_text)
-        else:
-            self.hide_shadow()
-            if not self.ishover():
-                self.fill.recolor(self.fill_color)
-                self._label.recolor(self.text_color)
-
-    def on_press(self, touch:_MotionEvent):
-        """Callback for button press events.
-
-        If the button is pressed, this callback method is called.
-
-        Args:
-            touch: Motion event with more information about the release.
+            fill: The RGBA color of the fill.
+            text: The RGBA color of the label.
         """
-        super(OutlineBtn, self).on_press(touch)
-        self.fill.recolor(self.press_fill)
-        self._label.recolor(self.press_text)
+        self.fill.recolor(fill)
+        self._label.recolor(text)
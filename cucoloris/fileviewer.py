@@ -0,0 +1,542 @@
+"""Defines a read-only viewer for large text files.
+
+Files like multi-hundred-megabyte CSV exports or traces cannot be
+loaded into a FormControl widget, because the whole text would have to
+be kept in memory and laid out at once. The FileViewer widget looks
+like a FormControl but maps the file into memory using mmap instead.
+An index of line offsets is built lazily in small portions per frame and
+only the lines that are currently visible are read and rendered.
+"""
+
+from array import array as _array
+from bisect import bisect_left as _bisect_left
+from mmap import mmap as _mmap
+from mmap import ACCESS_READ as _ACCESS_READ
+from os import fstat as _fstat
+from os.path import dirname as _dirname
+from os.path import join as _join
+from typing import List as _List
+from weakref import finalize as _finalize
+
+from kivy.clock import Clock as _Clock
+from kivy.core.text import Label as _CoreLabel
+from kivy.lang.builder import Builder as _Builder
+from kivy.logger import Logger as _Logger
+from kivy.properties import ListProperty as _ListProperty
+from kivy.properties import ObjectProperty as _ObjectProperty
+from kivy.properties import NumericProperty as _NumericProperty
+from kivy.properties import StringProperty as _StringProperty
+from kivy.uix.behaviors.focus import FocusBehavior as _FocusBehaviour
+
+from ._box import Box as _Box
+from ._settings import Settings as _Settings
+
+
+_Builder.load_file(_join(_dirname(__file__), 'fileviewer.kv'))
+
+class _LineIndex:
+    """Sparse index of line offsets inside a memory-mapped file.
+
+    Instead of the offset of each line, the number of line breaks before
+    every BLOCK-th byte is stored. The line breaks of a block are counted
+    in bulk by bytes.count(), so indexing does not execute any Python
+    code per line. Seeking to an arbitrary line looks up its block by
+    bisection and searches the line breaks of that block only, which
+    takes constant time regardless of the file size. The index is built
+    incrementally by calling scan() repeatedly.
+    """
+
+    BLOCK           = 16 * 1024
+    """Number of bytes between two stored line counts."""
+
+    def __init__(self, path:str):
+        """Initialization method of the class.
+
+        Args:
+            path: Path of the file to be indexed.
+
+        Raises:
+            OSError: The file cannot be opened or mapped into memory.
+        """
+        self._path          = path
+        self._file          = None
+        self._map           = None
+        self._stamp         = None
+        self._finalizer     = None
+        self.open()
+        self._breaks        = _array('Q', [0])
+        self._scanned       = 0
+        self.line_count     = 1 if self._size else 0
+        self.complete       = not self._size
+
+    @property
+    def closed(self) -> bool:
+        """True, if the file is currently closed."""
+        return self._file is None
+
+    def open(self) -> bool:
+        """Opens the file and maps it into memory.
+
+        The file is closed automatically once the index is garbage
+        collected, even if close() is never called.
+
+        Returns:
+            bool: False, if the size or the modification time of the file
+            changed since it was opened last, i.e. the index is outdated.
+            True, otherwise.
+
+        Raises:
+            OSError: The file cannot be opened or mapped into memory.
+        """
+        file = open(self._path, 'rb')
+        try:
+            stat = _fstat(file.fileno())
+            # Empty files cannot be mapped into memory.
+            mapped = _mmap(file.fileno(), 0, access=_ACCESS_READ) if stat.st_size else None
+        except OSError:
+            file.close()
+            raise
+        self._file          = file
+        self._map           = mapped
+        self._size          = stat.st_size
+        self._finalizer     = _finalize(self, _LineIndex._release, file, mapped)
+        stamp               = (stat.st_size, stat.st_mtime_ns)
+        unchanged           = self._stamp is None or self._stamp == stamp
+        self._stamp         = stamp
+        return unchanged
+
+    def close(self):
+        """Releases the memory map and the file handle.
+
+        The index is kept, so the file can be opened again by open().
+        """
+        if self._finalizer:
+            self._finalizer()
+        self._finalizer     = None
+        self._file          = None
+        self._map           = None
+
+    @staticmethod
+    def _release(file, mapped:_mmap):
+        """Closes a memory map and its file.
+
+        Args:
+            file: The file object.
+            mapped: The memory map or None for empty files.
+        """
+        if mapped:
+            mapped.close()
+        file.close()
+
+    def scan(self, budget:int):
+        """Extends the index by scanning the next portion of the file.
+
+        Args:
+            budget: The maximum number of bytes to scan. It is rounded up
+            to whole blocks.
+        """
+        if self.complete:
+            return
+        end     = min(self._scanned + budget, self._size)
+        breaks  = self._breaks[-1]
+        while self._scanned < end:
+            stop            = min(self._scanned + _LineIndex.BLOCK, self._size)
+            breaks         += self._map[self._scanned:stop].count(b'\n')
+            self._scanned   = stop
+            self._breaks.append(breaks)
+        self.complete = self._scanned >= self._size
+        # A line break at the very end of the file does not start a line.
+        if self.complete and self._map[self._size - 1] == ord('\n'):
+            self.line_count = breaks
+        else:
+            self.line_count = breaks + 1
+
+    def offset(self, line:int) -> int:
+        """Returns the byte offset of the given line.
+
+        Args:
+            line: The index of a line that is already indexed.
+
+        Returns:
+            The offset of the first byte of the line.
+        """
+        if line <= 0:
+            return 0
+        # The block containing the line break that ends the previous line.
+        block   = _bisect_left(self._breaks, line) - 1
+        pos     = block * _LineIndex.BLOCK
+        for _ in range(line - self._breaks[block]):
+            pos = self._map.find(b'\n', pos) + 1
+        return pos
+
+    def read(self, first:int, count:int, encoding:str, maxlength:int) -> _List[str]:
+        """Reads a number of consecutive lines.
+
+        Args:
+            first: The index of the first line to read.
+            count: The maximum number of lines to read.
+            encoding: The encoding used to decode the lines.
+            maxlength: Lines are truncated after this number of bytes
+            so that very long lines do not blow up the rendered texture.
+
+        Returns:
+            The decoded lines without line breaks.
+        """
+        lines   = []
+        last    = min(first + count, self.line_count)
+        if first >= last:
+            return lines
+
+        pos = self.offset(first)
+        for _ in range(first, last):
+            end = self._map.find(b'\n', pos)
+            end = end if end >= 0 else self._size
+            raw = self._map[pos:min(end, pos + maxlength)]
+            lines.append(raw.decode(encoding, 'replace').rstrip('\r'))
+            pos = end + 1
+        return lines
+
+
+class FileViewer(_FocusBehaviour, _Box):
+    """Read-only viewer for large text files.
+
+    The widget looks like the FormControl widget, i.e. it has the same
+    border, focus shadow and rounded scroll bar. However, its content is
+    not kept in memory. Instead, the file is mapped into memory and only
+    the lines that are currently visible are decoded and rendered. The
+    index of line offsets is built incrementally in the background, so
+    the scrollable area grows while the file is being indexed. Memory
+    consumption does not depend on the size of the file.
+
+    The height of the scrollable content is limited to CONTENT_LIMIT
+    pixels. Coordinates on the GPU are single precision floats, so text
+    placed millions of pixels away from the origin would jitter. For
+    longer files, the scroll position is mapped onto the whole file, i.e.
+    it is a virtual offset, and the visible lines are always placed
+    inside the viewport.
+    """
+
+    CONTENT_LIMIT           = 2 ** 20
+    """Maximum height of the scrollable content in pixels."""
+
+    source                  = _StringProperty()
+    """Path of the file to be displayed."""
+
+    encoding                = _StringProperty()
+    """The encoding of the file.
+
+    Bytes that cannot be decoded are replaced by a replacement
+    character.
+    """
+
+    text_color              = _ListProperty()
+    """The color of the text.
+
+    The color has to be given as a list of RGBA values between 0 and 1.
+    """
+
+    border_color_focus      = _ListProperty()
+    """The color of the border on focus.
+
+    The color has to be given as a list of RGBA values between 0 and 1.
+    """
+
+    border_color_normal     = _ListProperty()
+    """The color of the border without focus.
+
+    The color has to be given as a list of RGBA values between 0 and 1.
+    """
+
+    padding                 = _ListProperty([12, 7])
+    """ The text padding in pixels.
+
+    The text is padded to give it some space inside the box shape it
+    resides in. The padding is given in pixels.
+    """
+
+    scroll_bar_width        = _NumericProperty()
+    """The width of the scroll bar in pixels."""
+
+    num_lines               = _NumericProperty()
+    """The number of lines the FileViewer widget shall display.
+
+    This attribute determines the height of the widget, i.e. the
+    widget's size attribute is set depending on the value of this
+    attribute.
+    """
+
+    line_spacing            = _NumericProperty()
+    """Space between two consecutive lines in pixels."""
+
+    max_line_length         = _NumericProperty()
+    """Maximum number of bytes displayed per line.
+
+    Longer lines are truncated. This keeps the size of the rendered text
+    independent of the file's content.
+    """
+
+    line_count              = _NumericProperty(0)
+    """Number of lines indexed so far.
+
+    The value grows while the file is being indexed in the background.
+    It is meant to be read only.
+    """
+
+    index_chunk             = _NumericProperty(4 * 1024 * 1024)
+    """Number of bytes to index per frame."""
+
+    bar_fill_color          = _ListProperty()
+    """Fill color of the scroll bar.
+
+    The color is given as a list of RGBA values between 0 and 1.
+    """
+
+    bar_border_color        = _ListProperty()
+    """Color of the scroll bar's border.
+
+    The color is given as a list of RGBA values between 0 and 1.
+    """
+
+    font_size               = _StringProperty()
+    """The font size to use for the FileViewer widget, e.g. '16sp'."""
+
+    _scroll                 = _ObjectProperty()
+    """Private attribute for the scroll area widget."""
+
+    _content                = _ObjectProperty()
+    """Private attribute for the scrollable content widget."""
+
+    _display                = _ObjectProperty()
+    """Private attribute for the label rendering the visible lines."""
+
+    _line_pitch             = _NumericProperty(0)
+    """Private attribute for the distance of two lines in pixels."""
+
+    _text_height            = _NumericProperty(0)
+    """Private attribute for the height of all lines including padding."""
+
+    def __init__(self, source:str = None, **kwargs):
+        """Initialization method of the class.
+
+        Args:
+            source: Path of the file to be displayed.
+            **kwargs: Keyed parameters passed on to the base class.
+        """
+        self._index             = None
+        self._index_event       = None
+        self._trigger_render    = _Clock.create_trigger(self._render)
+        self._wheel_distance    = None
+        super(FileViewer, self).__init__(**kwargs)
+        self.fbind('parent', self._on_parent)
+        self.source             = source if source else self.source
+
+    def close(self):
+        """Closes the file that is currently displayed.
+
+        The memory map is released and the viewer is emptied. The method
+        is called automatically if another source is set. If the viewer
+        is removed from its parent, the file is closed as well but it is
+        opened again once the viewer gets a new parent.
+        """
+        if self._index_event:
+            self._index_event.cancel()
+            self._index_event = None
+        if self._index:
+            self._index.close()
+            self._index = None
+        self.line_count = 0
+        self._trigger_render()
+
+    def on_source(self, _, source:str):
+        """Callback for opening a new file.
+
+        Args:
+            source: Path of the new file.
+        """
+        self.close()
+        if not source:
+            return
+        try:
+            self._index = _LineIndex(source)
+        except OSError as error:
+            _Logger.error('FileViewer: Opening ' + source + ' failed: ' + repr(error))
+            return
+        self.line_count = self._index.line_count
+        if not self._index.complete:
+            self._index_event = _Clock.schedule_interval(self._index_step, 0)
+        if self._scroll:
+            self._scroll.scroll_y = 1
+
+    def _on_parent(self, _, parent):
+        """Releases the file while the viewer has no parent.
+
+        A file that changed in the meantime is indexed anew.
+
+        Args:
+            parent: The new parent widget or None.
+        """
+        index = self._index
+        if not index:
+            return
+        if parent is None:
+            if self._index_event:
+                self._index_event.cancel()
+                self._index_event = None
+            index.close()
+            return
+        if not index.closed:
+            return
+        try:
+            unchanged = index.open()
+        except OSError as error:
+            _Logger.error('FileViewer: Opening ' + self.source + ' failed: ' + repr(error))
+            self.close()
+            return
+        if not unchanged:
+            self.on_source(self, self.source)
+            return
+        if not index.complete:
+            self._index_event = _Clock.schedule_interval(self._index_step, 0)
+        self._trigger_render()
+
+    def on_border_color_normal(self, _, color):
+        """Sets the border color, if the nominal color is changed.
+
+        Args:
+            color: The new nominal color of the border.
+        """
+        self.border_color = color
+
+    def on_focus(self, _, value:bool):
+        """Callback for focus events.
+
+        Args:
+            value: True, if the widget has focus. False, otherwise.
+        """
+        if value:
+            self.border_color = self.border_color_focus
+            self.show_shadow()
+        else:
+            self.border_color = self.border_color_normal
+            self.hide_shadow()
+
+    def on__display(self, _, __):
+        """Sets the font according to the current platform."""
+        self._display.font_name = _Settings.get_font_name()
+        self._display.bind(font_size = self._update_pitch, font_name = self._update_pitch)
+        self._update_pitch()
+
+    def on__scroll(self, _, __):
+        """Sets scroll behavior and binds scroll events for rendering."""
+        self._scroll.scroll_distance    = _Settings.get_scroll_threshold()
+        self._scroll.scroll_type        = _Settings.get_scroll_type()
+        self._scroll._scroll.bind(scroll_y = self._trigger_render, size = self._trigger_render)
+        self._scroll.bind(height = self._update_text_height)
+        self.bind(padding = self._update_text_height)
+        self._wheel_distance            = self._scroll.scroll_wheel_distance
+        self._update_text_height()
+
+    def on_line_count(self, _, __):
+        """Renders the visible lines again, if more lines are indexed."""
+        self._update_text_height()
+        self._trigger_render()
+
+    def keyboard_on_key_down(self, window, keycode, text, modifiers):
+        """Scrolls the content using the keyboard.
+
+        The arrow keys scroll by a single line, the page keys by the
+        number of visible lines. Home and end jump to the beginning and
+        the end of the file, respectively.
+        """
+        lines = {'up': 1, 'down': -1, 'pageup': self.num_lines, 'pagedown': -self.num_lines}
+        if keycode[1] in lines:
+            hidden = self._text_height - self._scroll.height
+            if hidden > 0:
+                delta                   = lines[keycode[1]] * self._line_pitch / hidden
+                self._scroll.scroll_y   = max(min(self._scroll.scroll_y + delta, 1.0), 0.0)
+            return True
+        if keycode[1] in ('home', 'end'):
+            self._scroll.scroll_y = 1.0 if keycode[1] == 'home' else 0.0
+            return True
+        return super(FileViewer, self).keyboard_on_key_down(window, keycode, text, modifiers)
+
+    def _update_pitch(self, *_):
+        """Determines the distance between two lines in pixels.
+
+        The height of a line depends on the font. It is measured once
+        whenever the font changes, so that every visible line can be
+        located without laying out the text before it.
+        """
+        core                        = _CoreLabel(font_size = self._display.font_size,
+                                                 font_name = self._display.font_name)
+        height                      = core.get_extents(' ')[1]
+        self._line_pitch            = height + self.line_spacing
+        self._display.line_height   = self._line_pitch / height
+        self._update_text_height()
+        self._trigger_render()
+
+    def _update_text_height(self, *_):
+        """Determines the height of all lines and scales the mouse wheel.
+
+        The virtual offset of the viewport is kept while the text grows.
+        If the content is limited to CONTENT_LIMIT pixels, the scroll
+        distance of the mouse wheel is scaled down by the same ratio, so
+        that a step of the wheel still scrolls the same number of lines.
+        """
+        previous            = self._text_height
+        self._text_height   = self.line_count * self._line_pitch + self.padding[1] * 2
+        if not self._scroll or self._wheel_distance is None:
+            return
+        viewheight  = self._scroll.height
+        hidden      = self._text_height - viewheight
+        if previous != self._text_height and previous > viewheight and hidden > 0:
+            offset                  = (previous - viewheight) * (1 - self._scroll.scroll_y)
+            self._scroll.scroll_y   = max(1 - offset / hidden, 0.0)
+        limited     = min(self._text_height, FileViewer.CONTENT_LIMIT) - viewheight
+        ratio       = hidden / limited if hidden > 0 and limited > 0 else 1
+        self._scroll._scroll.scroll_wheel_distance = self._wheel_distance / ratio
+
+    def _index_step(self, _):
+        """Extends the line index by one portion per frame.
+
+        Returns:
+            False, if the index is complete. This unschedules the method.
+        """
+        self._index.scan(self.index_chunk)
+        self.line_count = self._index.line_count
+        if self._index.complete:
+            self._index_event = None
+            return False
+        return True
+
+    def _render(self, *_):
+        """Renders the lines that are currently visible.
+
+        The position of the first visible line is derived from the
+        scroll position. Since the line pitch is constant, the line can
+        be looked up in the index directly without reading the lines
+        before it. The label is placed relative to the top of the
+        viewport, so its coordinates stay small for any file size.
+        """
+        if not self._display or not self._line_pitch:
+            return
+
+        if not self._index:
+            self._display.text = ''
+            return
+        if self._index.closed:
+            return
+
+        scroll      = self._scroll
+        viewheight  = scroll.height
+        # The virtual offset of the viewport inside the whole text.
+        offset      = max(self._text_height - viewheight, 0) * (1 - scroll.scroll_y)
+        first       = max(int((offset - self.padding[1]) // self._line_pitch), 0)
+        count       = int(viewheight // self._line_pitch) + 2
+        lines       = self._index.read(first, count, self.encoding, int(self.max_line_length))
+
+        self._display.text  = '\n'.join(lines)
+        self._display.texture_update()
+        viewtop             = self._content.top - max(self._content.height - viewheight, 0) * (1 - scroll.scroll_y)
+        top                 = viewtop + offset - self.padding[1] - first * self._line_pitch
+        self._display.pos   = [self._content.x, top - self._display.texture_size[1]]
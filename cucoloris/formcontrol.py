@@ -9,6 +9,7 @@ https://kivy.org/doc/stable/api-kivy.core.text.markup.html
 """
 
 from os.path import dirname as _dirname
+from os.path import join as _join
 from typing import Optional as _Optional
 
 from kivy.lang.builder import Builder as _Builder
@@ -22,7 +23,7 @@ from ._box import Box as _Box
 from ._settings import Settings as _Settings
 
 
-_Builder.load_file(_dirname(__file__) + '\\formcontrol.kv')
+_Builder.load_file(_join(_dirname(__file__), 'formcontrol.kv'))
 
 class FormControl(_Box):
     """Text input widget similar to Bootstrap's form-control class.
@@ -197,6 +198,20 @@ class FormControl(_Box):
 
         super(FormControl, self).__init__(**kwargs)
 
+    def reset(self):
+        """Returns the form control to its resting state.
+
+        The text input loses focus, scrolls back to the top and shows
+        the text attribute again, discarding anything typed since.
+        """
+        edit                    = self._input._edit
+        edit.focus              = False
+        self._input.text        = self.text
+        edit.text               = self.text
+        self._input.on_markup(self._input, self._input.markup)
+        self._scroll.scroll_y   = 1
+        super(FormControl, self).reset()
+
     def on_border_color_normal(self, _, color):
         """
         Sets the border color, if the nominal color is changed.
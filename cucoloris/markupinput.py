@@ -1,6 +1,7 @@
 """Defines a text input widget with markup support."""
 
 from os.path import dirname as _dirname
+from os.path import join as _join
 
 from kivy.lang.builder import Builder as _Builder
 from kivy.properties import ObjectProperty as _ObjectProperty
@@ -10,9 +11,12 @@ from kivy.properties import ListProperty as _ListProperty
 from kivy.properties import NumericProperty as _NumericProperty
 from kivy.uix.widget import Widget as _Widget
 
-_Builder.load_file(_dirname(__file__) + '\\markupinput.kv')
+from ._render import Render as _Render
+from ._visibility import Visibility as _Visibility
 
-class MarkupInput(_Widget):
+_Builder.load_file(_join(_dirname(__file__), 'markupinput.kv'))
+
+class MarkupInput(_Visibility, _Widget):
     """A text input widget with markup support.
 
     Kivy's standard text input field has some bugs at the time of this
@@ -24,9 +28,10 @@ class MarkupInput(_Widget):
     https://kivy.org/doc/stable/api-kivy.core.text.markup.html. Markup
     commands can be mixed with other text. Once focus is lost, the text
     field is displayed with all markup formatting applied. This is done
-    by overlaying a TextField widget with a Label widget. Opacity of the
-    two is toggled between zero and one depending on whether to display
-    plain or formatted text.
+    by overlaying a TextField widget with a Label widget. Depending on
+    whether to display plain or formatted text, the opacity of the
+    TextField widget is toggled between zero and one and the Label
+    widget is drawn or not.
     """
 
     text                    = _StringProperty()
@@ -138,9 +143,9 @@ class MarkupInput(_Widget):
 
         if infocus:
             self._edit.opacity          = 1
-            self._display.opacity       = 0
+            self._show_display(False)
         elif self._edit.text:
-            self._display.opacity       = 1
+            self._show_display(True)
             self._edit.opacity          = 0
 
     def on_markup(self, _, __):
@@ -150,4 +155,19 @@ class MarkupInput(_Widget):
         PlainInput and Label child widgets is toggled.
         """
         self._edit.opacity      = 0 if self.text and self.markup else 1
-        self._display.opacity   = 1 if self.markup else 0
+        self._show_display(self.markup)
+
+    def _show_display(self, shown:bool):
+        """Shows or hides the label displaying the formatted text.
+
+        The text input has to stay touchable while it is transparent,
+        so that it can acquire focus. The label is never touched, so it
+        is detached from rendering instead of being made transparent.
+
+        Args:
+            shown: True, if the label shall be drawn. False, otherwise.
+        """
+        if shown:
+            _Render.attach(self._display, 'markup')
+        else:
+            _Render.detach(self._display, 'markup')
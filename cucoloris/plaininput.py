@@ -1,13 +1,16 @@
 """Defines a text input that fixes some bugs in Kivy."""
 
 from os.path import dirname as _dirname
+from os.path import join as _join
 
 from kivy.lang.builder import Builder as _Builder
 from kivy.uix.textinput import TextInput as _TextInput
 
-_Builder.load_file(_dirname(__file__) + '\\plaininput.kv')
+from ._visibility import Visibility as _Visibility
 
-class PlainInput(_TextInput):
+_Builder.load_file(_join(_dirname(__file__), 'plaininput.kv'))
+
+class PlainInput(_Visibility, _TextInput):
     """Class that provides a plain text input area.
 
     Although there is already a text input provided in Kivy, there seems
@@ -0,0 +1,59 @@
+"""Shared fixtures of the tests.
+
+The tests need a window, since widgets and kv rules are created, and
+advance Kivy's clock frame by frame instead of running an app.
+"""
+
+import asyncio
+import os
+
+# Keeps Kivy from parsing the arguments of pytest.
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+import pytest
+from kivy.base import EventLoop
+EventLoop.ensure_window()
+
+
+@pytest.fixture
+def frames():
+    """Returns a function that advances the clock by a number of frames."""
+    def advance(count:int = 1):
+        for _ in range(count):
+            EventLoop.idle()
+    return advance
+
+
+@pytest.fixture
+def touch():
+    """Returns a function that creates a touch at a window position.
+
+    The touch is dispatched through the event loop by its touch_down(),
+    touch_move() and touch_up() methods, including grabbed touches.
+    """
+    from kivy.tests.common import UnitTestTouch
+    return UnitTestTouch
+
+
+@pytest.fixture
+def run_async():
+    """Returns a function that runs a coroutine while advancing frames.
+
+    Kivy's clock is advanced by one frame whenever the coroutine yields,
+    similar to an app started by async_runTouchApp.
+    """
+    async def drive(coroutine, timeout:float):
+        task    = asyncio.ensure_future(coroutine)
+        loop    = asyncio.get_running_loop()
+        end     = loop.time() + timeout
+        while not task.done():
+            if loop.time() > end:
+                task.cancel()
+                raise TimeoutError('The coroutine did not finish in time.')
+            EventLoop.idle()
+            await asyncio.sleep(0)
+        return task.result()
+
+    def run(coroutine, timeout:float = 5.0):
+        return asyncio.run(drive(coroutine, timeout))
+    return run
@@ -0,0 +1,52 @@
+"""Tests of holding back the layout of Box layers."""
+
+from kivy.uix.widget import Widget
+
+from cucoloris import Box
+
+
+def counter(widget:Widget, name:str) -> list:
+    """Returns a list that grows by one on every change of a property."""
+    changes = []
+    widget.fbind(name, lambda *_: changes.append(1))
+    return changes
+
+
+def test_layout_is_done_once_on_exit(frames):
+    box     = Box(shadow_width = 4, border_width = 1)
+    frames()
+    moves   = counter(box.border, 'pos')
+    sizes   = counter(box.fill, 'size')
+    with box.batch_update():
+        box.pos             = (10, 20)
+        box.size            = (120, 40)
+        box.shadow_width    = 2
+        box.border_width    = 3
+        assert tuple(box.border.pos) != (12, 22)
+    assert tuple(box.border.pos) == (12, 22)
+    assert tuple(box.fill.size) == (110, 30)
+    assert len(moves) == 1
+    assert len(sizes) == 1
+    frames()
+    assert len(moves) == 1
+
+
+def test_nested_contexts_lay_out_on_the_outermost_exit():
+    box = Box(shadow_width = 0, border_width = 0)
+    with box.batch_update():
+        with box.batch_update():
+            box.pos = (5, 5)
+        assert tuple(box.border.pos) != (5, 5)
+    assert tuple(box.border.pos) == (5, 5)
+
+
+def test_tree_variant_covers_all_boxes():
+    root    = Widget()
+    boxes   = [Box(shadow_width = 0, border_width = 0) for _ in range(3)]
+    for box in boxes:
+        root.add_widget(box)
+    with Box.batch_update_tree(root):
+        for index, box in enumerate(boxes):
+            box.pos = (index, index)
+        assert all(box._batch_depth == 1 for box in boxes)
+    assert [tuple(box.border.pos) for box in boxes] == [(0, 0), (1, 1), (2, 2)]
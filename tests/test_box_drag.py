@@ -0,0 +1,78 @@
+"""Tests of the drag modes of Box."""
+
+from types import SimpleNamespace
+
+import pytest
+from kivy.core.window import Window
+
+from cucoloris import Box, DragInfo
+
+
+def fake_touch(x:float, y:float, time:float) -> SimpleNamespace:
+    """Returns an object with the attributes of a touch DragInfo reads."""
+    return SimpleNamespace(x = x, y = y, pos = (x, y), time_update = time, time_end = -1)
+
+
+def make_box(frames, mode:str) -> tuple:
+    """Adds a box in the given drag mode and records its drag events.
+
+    DragInfo instances are reused, so their position and delta are
+    recorded when the event is dispatched.
+    """
+    box     = Box(size_hint = (None, None), size = (200, 200), drag_mode = mode)
+    events  = []
+    def on_drag(widget, info):
+        if isinstance(info, DragInfo):
+            info = SimpleNamespace(pos = info.pos, delta = info.delta)
+        events.append(info)
+    box.bind(on_drag = on_drag,
+             on_release = lambda widget, touch: events.append('release'))
+    Window.add_widget(box)
+    frames()
+    return box, events
+
+
+def test_raw_mode_reports_every_movement(frames, touch):
+    box, events = make_box(frames, 'raw')
+    tap = touch(50, 50)
+    tap.touch_down()
+    for x in range(55, 80, 5):
+        tap.touch_move(x, 50)
+    tap.touch_up()
+    assert len(events) == 6
+    assert events[-1] == 'release'
+    Window.remove_widget(box)
+
+
+def test_frame_mode_reports_once_per_frame(frames, touch):
+    box, events = make_box(frames, 'frame')
+    tap = touch(50, 50)
+    tap.touch_down()
+    for x in range(55, 80, 5):
+        tap.touch_move(x, 60)
+    assert events == []
+    frames()
+    assert len(events) == 1
+    drag = events[0]
+    assert drag.pos == pytest.approx((75, 60), abs = 1)
+    assert drag.delta == pytest.approx((25, 10), abs = 1)
+
+    frames()
+    assert len(events) == 1
+    tap.touch_move(90, 60)
+    tap.touch_up()
+    assert len(events) == 3
+    assert events[1].delta == pytest.approx((15, 0), abs = 1)
+    assert events[2] == 'release'
+    Window.remove_widget(box)
+
+
+def test_velocity_is_smoothed():
+    drag = DragInfo(fake_touch(0, 0, 0.0))
+    for step in range(1, 11):
+        drag.add(fake_touch(step * 10, 0, step * 0.01), Box.DRAG_SMOOTHING)
+    assert drag.delta == (100, 0)
+    assert drag.moves == 10
+    # Steady movement of 1000 pixels per second.
+    assert 800 < drag.velocity[0] < 1000
+    assert drag.velocity[1] == 0
@@ -0,0 +1,56 @@
+"""Tests of the events dispatched by Box."""
+
+import pytest
+from kivy.core.window import Window
+
+from cucoloris import Box
+
+
+def test_any_number_of_listeners_is_called(frames, touch):
+    box     = Box(size_hint = (None, None), size = (100, 100))
+    Window.add_widget(box)
+    frames()
+    calls   = []
+    box.bind(on_press = lambda widget, touch: calls.append(('first', widget)))
+    box.bind(on_press = lambda widget, touch: calls.append(('second', widget)))
+    tap = touch(50, 50)
+    tap.touch_down()
+    tap.touch_up()
+    assert calls == [('second', box), ('first', box)]
+    Window.remove_widget(box)
+
+
+def test_unknown_event_is_rejected():
+    with pytest.raises(Exception):
+        Box().bind(on_click = lambda *_: None)
+
+
+def test_callbacks_of_the_old_signature_are_deprecated(frames, touch):
+    box     = Box(size_hint = (None, None), size = (100, 100))
+    Window.add_widget(box)
+    frames()
+    calls   = []
+    def on_release(touch):
+        calls.append(touch)
+    with pytest.deprecated_call():
+        box.bind(on_release = on_release)
+
+    tap = touch(50, 50)
+    tap.touch_down()
+    tap.touch_up()
+    assert calls == [tap]
+
+    box.unbind(on_release = on_release)
+    tap = touch(50, 50)
+    tap.touch_down()
+    tap.touch_up()
+    assert len(calls) == 1
+    Window.remove_widget(box)
+
+
+def test_property_binds_keep_working():
+    box     = Box()
+    changes = []
+    box.bind(radius = lambda widget, value: changes.append(list(value)))
+    box.radius = [2, 2, 2, 2]
+    assert changes == [[2, 2, 2, 2]]
@@ -0,0 +1,43 @@
+"""Tests of the layout of the layers of Box."""
+
+from cucoloris import Box
+
+
+def test_layers_are_laid_out_once_per_frame(frames):
+    box     = Box(radius = [6, 6, 6, 6], shadow_width = 4, border_width = 2)
+    frames()
+    moves   = []
+    box.fill.fbind('pos', lambda *_: moves.append(1))
+    box.pos     = (10, 10)
+    box.size    = (100, 50)
+    box.radius  = [8, 8, 8, 8]
+    assert not moves
+    frames()
+    assert len(moves) == 1
+    assert tuple(box.border.pos) == (14, 14)
+    assert tuple(box.border.size) == (92, 42)
+    assert tuple(box.fill.pos) == (16, 16)
+    assert tuple(box.fill.size) == (88, 38)
+    assert list(box.fill.radius) == [6, 6, 6, 6]
+
+
+def test_pending_layout_is_flushed_before_reading(frames):
+    box     = Box(shadow_width = 4, border_width = 0)
+    frames()
+    box.size = (60, 30)
+    box._flush_layout()
+    assert tuple(box.border.size) == (52, 22)
+    assert not box._trigger_layout.is_triggered
+
+
+def test_shadow_follows_the_layout(run_async):
+    async def check():
+        box = Box(shadow_width = 4, transition = 0.01)
+        await box.show_shadow()
+        box.pos     = (20, 20)
+        box.size    = (80, 40)
+        await box.hide_shadow()
+        return box
+    box = run_async(check())
+    assert tuple(box.shadow.pos) == tuple(box.border.pos)
+    assert tuple(box.shadow.size) == tuple(box.border.size)
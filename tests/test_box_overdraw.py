@@ -0,0 +1,77 @@
+"""Tests of the layers that Box skips while they cannot be seen."""
+
+import asyncio
+
+from kivy.core.window import Window
+from kivy.factory import Factory
+
+from cucoloris import Box
+from cucoloris._render import Render
+
+
+def test_fill_of_the_border_color_is_skipped(frames):
+    box = Box(fill_color = [0, 0, 1, 1], border_color = [0, 0, 1, 1])
+    Window.add_widget(box)
+    frames(2)
+    assert Render.is_detached(box.fill, 'overdraw')
+    assert not Render.is_detached(box.border)
+
+    box.border_color = [1, 0, 0, 1]
+    frames(2)
+    assert not Render.is_detached(box.fill)
+    Window.remove_widget(box)
+
+
+def test_border_without_width_is_skipped(frames):
+    box = Box(border_width = 0, fill_color = [0, 0, 1, 1])
+    Window.add_widget(box)
+    frames(2)
+    assert Render.is_detached(box.border, 'overdraw')
+
+    box.fill_color = [0, 0, 1, 0.5]
+    frames(2)
+    assert not Render.is_detached(box.border)
+    Window.remove_widget(box)
+
+
+def test_layers_follow_color_transitions(frames):
+    box = Box(fill_color = [0, 0, 1, 1], border_color = [0, 0, 1, 1], transition = 0.05)
+    Window.add_widget(box)
+    frames(2)
+    assert Render.is_detached(box.fill, 'overdraw')
+
+    box.fill.modify([0, 0, -0.5])
+    frames(2)
+    assert not Render.is_detached(box.fill)
+
+    box.fill.modify([0, 0, 0])
+    for _ in range(100):
+        frames()
+        if Render.is_detached(box.fill):
+            break
+    assert Render.is_detached(box.fill, 'overdraw')
+    Window.remove_widget(box)
+
+
+def test_hidden_shadow_is_skipped(run_async):
+    async def check():
+        box = Box(transition = 0.05)
+        Window.add_widget(box)
+        await box.show_shadow()
+        assert not Render.is_detached(box.shadow)
+        await box.hide_shadow()
+        await asyncio.sleep(0)
+        Window.remove_widget(box)
+        return box
+    box = run_async(check())
+    assert Render.is_detached(box.shadow, 'overdraw')
+
+
+def test_primary_button_draws_a_single_layer(frames):
+    button = Factory.BtnPrimary()
+    Window.add_widget(button)
+    frames(2)
+    assert Render.is_detached(button.border, 'overdraw')
+    assert not Render.is_detached(button.fill)
+    assert button.shadow is None
+    Window.remove_widget(button)
@@ -0,0 +1,40 @@
+"""Tests of the shadow layer that Box creates on first use."""
+
+from kivy.core.window import Window
+
+from cucoloris import Box
+from cucoloris._render import Render
+
+
+def drawn(box:Box) -> list:
+    """Returns the layers of the box in drawing order, if attached."""
+    layers = {box.shadow.canvas: 'shadow', box.border.canvas: 'border',
+              box.fill.canvas: 'fill'}
+    return [layers[child] for child in box.canvas.children if child in layers]
+
+
+def test_shadow_is_created_on_first_use(frames):
+    box = Box()
+    assert box.shadow is None
+    box.hide_shadow()
+    assert box.shadow is None
+    box.show_shadow()
+    assert box.shadow is not None
+    assert box.children[-1] is box.shadow
+    assert drawn(box) == ['shadow', 'border', 'fill']
+
+
+def test_shadow_is_drawn_below_a_detached_border(frames):
+    box = Box(border_width = 0, fill_color = [1, 0, 0, 1])
+    Window.add_widget(box)
+    frames(2)
+    assert Render.is_detached(box.border, 'overdraw')
+
+    box.show_shadow()
+    assert drawn(box) == ['shadow', 'fill']
+
+    box.border_width = 2
+    frames(2)
+    assert not Render.is_detached(box.border)
+    assert drawn(box) == ['shadow', 'border', 'fill']
+    Window.remove_widget(box)
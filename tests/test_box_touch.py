@@ -0,0 +1,94 @@
+"""Tests of the touch policies of Box."""
+
+from kivy.core.window import Window
+from kivy.factory import Factory
+
+from cucoloris import Box
+
+
+def record(widget:Box, name:str, events:list):
+    """Appends the name to the list on every press and release."""
+    widget.bind(on_press = lambda *_: events.append(name + ' press'),
+                on_release = lambda *_: events.append(name + ' release'))
+
+
+def test_consuming_child_keeps_the_parent_unpressed(frames, touch):
+    parent  = Box(size_hint = (None, None), size = (300, 300))
+    button  = Factory.BtnPrimary(pos = (10, 10))
+    parent.add_widget(button)
+    Window.add_widget(parent)
+    frames()
+    events  = []
+    record(parent, 'parent', events)
+    record(button, 'button', events)
+
+    tap = touch(button.center_x, button.center_y)
+    tap.touch_down()
+    tap.touch_up()
+    assert events == ['button press', 'button release']
+
+    events.clear()
+    tap = touch(250, 250)
+    tap.touch_down()
+    tap.touch_up()
+    assert events == ['parent press', 'parent release']
+    Window.remove_widget(parent)
+
+
+def test_propagating_boxes_are_all_pressed(frames, touch):
+    parent  = Box(size_hint = (None, None), size = (300, 300))
+    child   = Box(size_hint = (None, None), size = (100, 100))
+    parent.add_widget(child)
+    Window.add_widget(parent)
+    frames()
+    events  = []
+    record(parent, 'parent', events)
+    record(child, 'child', events)
+
+    tap = touch(50, 50)
+    tap.touch_down()
+    tap.touch_up()
+    assert events[:2] == ['child press', 'parent press']
+    assert sorted(events[2:]) == ['child release', 'parent release']
+    Window.remove_widget(parent)
+
+
+def test_consuming_box_ignores_touches_outside(frames, touch):
+    box     = Box(size_hint = (None, None), size = (100, 100), touch_policy = 'consume')
+    inner   = Box(size_hint = (None, None), pos = (150, 150), size = (50, 50))
+    box.add_widget(inner)
+    Window.add_widget(box)
+    frames()
+    events  = []
+    record(box, 'box', events)
+    record(inner, 'inner', events)
+
+    tap = touch(170, 170)
+    tap.touch_down()
+    tap.touch_up()
+    assert events == []
+
+    tap = touch(50, 50)
+    tap.touch_down()
+    tap.touch_up()
+    assert events == ['box press', 'box release']
+    Window.remove_widget(box)
+
+
+def test_release_reaches_only_the_pressed_box(frames, touch):
+    first   = Box(size_hint = (None, None), size = (100, 100))
+    second  = Box(size_hint = (None, None), pos = (200, 0), size = (100, 100))
+    Window.add_widget(first)
+    Window.add_widget(second)
+    frames()
+    events  = []
+    record(first, 'first', events)
+    record(second, 'second', events)
+
+    tap = touch(50, 50)
+    tap.touch_down()
+    tap.touch_move(250, 50)
+    tap.touch_up()
+    assert events == ['first press', 'first release']
+    Window.remove_widget(first)
+    Window.remove_widget(second)
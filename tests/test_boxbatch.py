@@ -0,0 +1,68 @@
+"""Tests of the BoxBatch container."""
+
+from kivy.core.window import Window
+from kivy.uix.gridlayout import GridLayout
+
+from cucoloris import Box, BoxBatch
+from cucoloris._render import Render
+
+
+def make_batch(count:int, chunk_size:int = 4) -> BoxBatch:
+    """Returns a batch holding a grid of the given number of boxes."""
+    batch   = BoxBatch(chunk_size = chunk_size, size_hint = (None, None), size = (400, 400))
+    grid    = GridLayout(cols = 4, size = (400, 400))
+    for _ in range(count):
+        grid.add_widget(Box(fill_color = [1, 0, 0, 1]))
+    batch.add_widget(grid)
+    return batch
+
+
+def meshes(batch:BoxBatch) -> list:
+    """Returns the meshes of the batch."""
+    return [mesh for mesh, _ in batch._chunks]
+
+
+def test_layers_are_drawn_by_the_batch(frames):
+    batch = make_batch(4)
+    Window.add_widget(batch)
+    frames(2)
+    boxes = batch.children[0].children
+    assert len(batch._areas) == 8
+    assert all(Render.is_detached(box.fill, 'batch') for box in boxes)
+    assert len(meshes(batch)) == 2
+
+    box = boxes[0]
+    batch.children[0].remove_widget(box)
+    frames(2)
+    assert len(batch._areas) == 6
+    assert not Render.is_detached(box.fill, 'batch')
+    Window.remove_widget(batch)
+
+
+def test_adding_a_box_keeps_the_meshes_before(frames):
+    batch = make_batch(6)
+    Window.add_widget(batch)
+    frames(2)
+    before  = meshes(batch)
+    palette = batch._palette
+    batch.children[0].add_widget(Box())
+    frames(2)
+    after   = meshes(batch)
+    assert len(batch._areas) == 14
+    assert after[:3] == before[:3]
+    assert len(after) == 4
+    assert batch._palette is palette
+    Window.remove_widget(batch)
+
+
+def test_changed_color_rewrites_the_palette_pixel(frames):
+    batch = make_batch(2)
+    Window.add_widget(batch)
+    frames(2)
+    box         = batch.children[0].children[0]
+    box.border_width = 0
+    box.fill_color = [0, 0, 1, 1]
+    frames(2)
+    slot        = batch._slots[box.fill.__self__]
+    assert bytes(batch._pixels[slot * 4:slot * 4 + 4]) == bytes([0, 0, 255, 255])
+    Window.remove_widget(batch)
@@ -0,0 +1,104 @@
+"""Tests of running the action of a button in the background."""
+
+import asyncio
+import threading
+from concurrent import futures
+
+from kivy.core.window import Window
+from kivy.factory import Factory
+
+# Registers the kv classes of the buttons.
+import cucoloris
+
+
+def make_button(action) -> tuple:
+    """Returns a button with the given action and the outcomes it reports."""
+    button      = Factory.BtnPrimary(action = action)
+    outcomes    = []
+    button.bind(on_action_done = lambda widget, result: outcomes.append(('done', result)),
+                on_action_error = lambda widget, error: outcomes.append(('error', error)))
+    return button, outcomes
+
+
+def wait(frames, future):
+    """Waits for a concurrent future and runs the frame reporting it."""
+    futures.wait([future], timeout = 5)
+    frames(2)
+
+
+def test_sync_action_runs_in_a_thread(frames):
+    threads = []
+    release = threading.Event()
+    def action():
+        threads.append(threading.current_thread())
+        release.wait(5)
+        return 42
+    button, outcomes = make_button(action)
+    future = button.run_action()
+    assert button.busy
+    assert button.visual_state == 'busy'
+    assert button.run_action() is None
+
+    release.set()
+    wait(frames, future)
+    assert threads[0] is not threading.main_thread()
+    assert outcomes == [('done', 42)]
+    assert not button.busy
+    assert button.visual_state == 'normal'
+
+
+def test_errors_are_reported(frames):
+    def action():
+        raise ValueError('failed')
+    button, outcomes = make_button(action)
+    wait(frames, button.run_action())
+    assert outcomes[0][0] == 'error'
+    assert isinstance(outcomes[0][1], ValueError)
+    assert not button.busy
+
+
+def test_async_action_runs_on_the_event_loop(run_async):
+    async def action():
+        await asyncio.sleep(0.01)
+        return 'async'
+    button, outcomes = make_button(action)
+    async def check():
+        button.run_action()
+        while button.busy:
+            await asyncio.sleep(0)
+    run_async(check())
+    assert outcomes == [('done', 'async')]
+
+
+def test_async_action_without_event_loop_fails(frames):
+    async def action():
+        return None
+    button, outcomes = make_button(action)
+    assert button.run_action() is None
+    assert isinstance(outcomes[0][1], RuntimeError)
+    assert not button.busy
+
+
+def test_outcome_after_reset_is_ignored(frames):
+    release = threading.Event()
+    button, outcomes = make_button(lambda: release.wait(5))
+    future = button.run_action()
+    button.reset()
+    assert not button.busy
+    release.set()
+    wait(frames, future)
+    assert outcomes == []
+
+
+def test_release_on_the_button_starts_the_action(frames, touch):
+    button, outcomes = make_button(lambda: 'released')
+    button.pos = (0, 0)
+    Window.add_widget(button)
+    frames()
+    tap = touch(*button.center)
+    tap.touch_down()
+    tap.touch_up()
+    assert button.busy
+    wait(frames, button._action)
+    assert outcomes == [('done', 'released')]
+    Window.remove_widget(button)
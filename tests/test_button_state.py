@@ -0,0 +1,82 @@
+"""Tests of the visual states of the buttons."""
+
+from kivy.core.window import Window
+from kivy.factory import Factory
+
+# Registers the kv classes of the buttons.
+import cucoloris
+
+
+def add(frames, name:str):
+    """Adds a button of the given kv class to the window."""
+    button = getattr(Factory, name)(pos = (0, 0))
+    Window.add_widget(button)
+    frames(2)
+    return button
+
+
+def hover(pos:tuple):
+    """Moves the cursor to the given position."""
+    Window.mouse_pos = pos
+
+
+def test_redundant_transitions_are_skipped(frames):
+    button  = add(frames, 'BtnPrimary')
+    hover(button.center)
+    assert button.visual_state == 'hover'
+    skipped = button.transitions_skipped
+
+    # A focused button looks like a hovered one.
+    button.focus = True
+    assert button.visual_state == 'hover'
+    assert button.transitions_skipped == skipped + 1
+    hover((700, 500))
+    assert button.visual_state == 'focus'
+    assert button.transitions_skipped == skipped + 2
+
+    button.focus = False
+    assert button.visual_state == 'normal'
+    assert button.transitions_skipped == skipped + 2
+    Window.remove_widget(button)
+
+
+def test_press_and_release_while_hovering(frames, touch):
+    button  = add(frames, 'BtnPrimary')
+    hover(button.center)
+    tap = touch(*button.center)
+    tap.touch_down()
+    assert button.visual_state == 'pressed'
+    tap.touch_up()
+    assert button.visual_state in ('hover', 'focus')
+    hover((700, 500))
+    button.focus = False
+    assert button.visual_state == 'normal'
+    Window.remove_widget(button)
+
+
+def test_focused_link_shows_the_normal_colors(frames):
+    button  = add(frames, 'BtnLink')
+    skipped = button.transitions_skipped
+    button.focus = True
+    assert button.visual_state == 'normal'
+    assert button.transitions_skipped == skipped + 1
+    frames(20)
+    assert list(button.fill.canvas_color.rgba) == list(button.fill.color)
+
+    hover(button.center)
+    assert button.visual_state == 'hover'
+    hover((700, 500))
+    assert button.visual_state == 'normal'
+    button.focus = False
+    Window.remove_widget(button)
+
+
+def test_disabled_button_ignores_hover(frames):
+    button  = add(frames, 'BtnOutlinePrimary')
+    button.disabled = True
+    hover(button.center)
+    assert button.visual_state == 'disabled'
+    hover((700, 500))
+    button.disabled = False
+    assert button.visual_state == 'normal'
+    Window.remove_widget(button)
@@ -0,0 +1,89 @@
+"""Tests of the FileViewer class and its line index."""
+
+import gc
+import random
+
+import pytest
+from kivy.uix.widget import Widget
+
+from cucoloris import FileViewer
+from cucoloris.fileviewer import _LineIndex
+
+
+def offsets(data:bytes) -> list:
+    """Returns the offsets of the lines of the data."""
+    lines = data.split(b'\n')
+    if data.endswith(b'\n'):
+        lines.pop()
+    result, pos = [], 0
+    for line in lines if data else []:
+        result.append(pos)
+        pos += len(line) + 1
+    return result
+
+
+@pytest.mark.parametrize('data', [b'', b'a', b'\n', b'a\nb', b'a\r\nb\r\n', b'\n' * 40000,
+                                  b'x' * 50000 + b'\n' + b'y' * 40000,
+                                  bytes(random.Random(1).choice(b'ab\n') for _ in range(100000))])
+def test_index_finds_every_line(tmp_path, data):
+    path = tmp_path / 'data.txt'
+    path.write_bytes(data)
+    index = _LineIndex(str(path))
+    while not index.complete:
+        index.scan(10000)
+    expected = offsets(data)
+    assert index.line_count == len(expected)
+    for line in random.Random(2).sample(range(len(expected)), min(len(expected), 500)):
+        assert index.offset(line) == expected[line]
+    index.close()
+
+
+def lines_file(tmp_path, count:int = 1000) -> str:
+    """Writes a file of numbered lines and returns its path."""
+    path = tmp_path / 'lines.txt'
+    path.write_text(''.join('line ' + str(line) + '\n' for line in range(count)))
+    return str(path)
+
+
+def test_viewer_renders_the_visible_lines(tmp_path, frames):
+    viewer = FileViewer(source = lines_file(tmp_path))
+    frames(3)
+    assert viewer.line_count == 1000
+    assert viewer._display.text.split('\n')[:3] == ['line 0', 'line 1', 'line 2']
+
+    viewer._scroll.scroll_y = 0
+    frames(3)
+    assert viewer._display.text.split('\n')[-1] == 'line 999'
+
+
+def test_missing_file_leaves_the_viewer_empty(tmp_path, frames):
+    viewer = FileViewer(source = lines_file(tmp_path))
+    viewer.source = str(tmp_path / 'missing.txt')
+    frames()
+    assert viewer._index is None
+    assert viewer.line_count == 0
+
+
+def test_file_is_closed_while_the_viewer_has_no_parent(tmp_path, frames):
+    parent  = Widget()
+    viewer  = FileViewer(source = lines_file(tmp_path))
+    parent.add_widget(viewer)
+    frames()
+    index = viewer._index
+    parent.remove_widget(viewer)
+    assert index.closed
+
+    parent.add_widget(viewer)
+    frames(2)
+    assert viewer._index is index and not index.closed
+    assert viewer._display.text.startswith('line 0\n')
+
+
+def test_file_is_closed_when_the_viewer_is_dropped(tmp_path, frames):
+    viewer  = FileViewer(source = lines_file(tmp_path))
+    frames()
+    file    = viewer._index._file
+    del viewer
+    frames()
+    gc.collect()
+    assert file.closed
@@ -0,0 +1,93 @@
+"""Tests of tracking the cursor over boxes."""
+
+import gc
+import tracemalloc
+
+from kivy.core.window import Window
+from kivy.uix.widget import Widget
+
+from cucoloris import Box
+from cucoloris._hover import Hover
+
+
+def test_only_boxes_with_listeners_are_tracked():
+    root    = Widget()
+    Window.add_widget(root)
+    box     = Box()
+    root.add_widget(box)
+    assert not Hover.is_tracked(box)
+    callback = lambda *_: None
+    box.bind(on_enter = callback)
+    assert Hover.is_tracked(box)
+    box.unbind(on_enter = callback)
+    assert not Hover.is_tracked(box)
+    assert not Hover.is_dormant(box)
+    Window.remove_widget(root)
+
+
+def test_removed_ancestor_sets_the_box_dormant_right_away(frames):
+    root        = Widget()
+    container   = Widget()
+    box         = Box(size_hint = (None, None), size = (100, 100))
+    events      = []
+    box.bind(on_enter = lambda *_: events.append('enter'),
+             on_leave = lambda *_: events.append('leave'))
+    container.add_widget(box)
+    root.add_widget(container)
+    Window.add_widget(root)
+    Window.mouse_pos = (50, 50)
+    assert Hover.is_tracked(box)
+    assert events == ['enter']
+
+    root.remove_widget(container)
+    assert Hover.is_dormant(box)
+    assert events == ['enter', 'leave']
+
+    root.add_widget(container)
+    assert Hover.is_tracked(box)
+    Window.mouse_pos = (60, 60)
+    assert events == ['enter', 'leave', 'enter']
+
+    Window.remove_widget(root)
+    assert Hover.is_dormant(box)
+    assert events == ['enter', 'leave', 'enter', 'leave']
+    box.parent.remove_widget(box)
+    assert not Hover.is_dormant(box)
+    Window.mouse_pos = (700, 500)
+
+
+def test_churn_keeps_memory_flat(frames):
+    root = Widget()
+    Window.add_widget(root)
+    kept = []
+
+    def cycle(index:int):
+        container   = Widget()
+        box         = Box(size_hint = (None, None), size = (50, 50))
+        box.bind(on_enter = lambda *_: None)
+        container.add_widget(box)
+        root.add_widget(container)
+        Window.mouse_pos = (index % 50, 25)
+        root.remove_widget(container)
+        kept.append(container)
+        del kept[:-20]
+
+    def run(count:int) -> int:
+        for index in range(count):
+            cycle(index)
+            if index % 100 == 0:
+                frames()
+        frames()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.start()
+    run(600)
+    before  = run(300)
+    after   = run(300)
+    tracemalloc.stop()
+    Window.remove_widget(root)
+
+    assert not Hover._widgets
+    assert len(Hover._dormant) <= 20
+    assert after - before < 64 * 1024
@@ -0,0 +1,98 @@
+"""Tests of the ProgressiveBuilder class."""
+
+from kivy.core.window import Window
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.label import Label
+
+from cucoloris import ProgressiveBuilder
+
+ROWS        = 60
+ROW_HEIGHT  = 40
+
+
+class Row(Label):
+    """Label recording the order of creation."""
+
+    created = []
+
+    def __init__(self, **kwargs):
+        super(Row, self).__init__(**kwargs)
+        Row.created.append(int(self.text))
+
+
+def build(spec, frames, above:int = 0, budget:float = 0.001) -> GridLayout:
+    """Builds the rows into a column reaching below the window.
+
+    The given number of rows lies above the window.
+    """
+    Row.created = []
+    layout      = GridLayout(cols = 1, size_hint = (None, None),
+                             size = (100, ROWS * ROW_HEIGHT))
+    layout.top  = Window.height + above * ROW_HEIGHT
+    Window.add_widget(layout)
+    done        = []
+    builder     = ProgressiveBuilder(layout, spec, callback = done.append, budget = budget)
+    builder.start()
+    for _ in range(1000):
+        if done:
+            break
+        frames()
+    Window.remove_widget(layout)
+    assert done == [builder]
+    assert builder.done
+    return layout
+
+
+def spec(rows:int = ROWS) -> list:
+    """Returns the specification of the rows."""
+    return [{'cls': Row, 'text': str(row), 'size_hint_y': None, 'height': ROW_HEIGHT}
+            for row in range(rows)]
+
+
+def texts(layout:GridLayout) -> list:
+    """Returns the texts of the children from top to bottom."""
+    return [child.text for child in reversed(layout.children)]
+
+
+def test_children_keep_the_order_of_the_specification(frames):
+    layout = build(spec(), frames)
+    assert texts(layout) == [str(row) for row in range(ROWS)]
+    assert sorted(Row.created) == list(range(ROWS))
+
+
+def test_visible_rows_are_created_first(frames):
+    layout  = build(spec(), frames, above = 20)
+    visible = range(20, 20 + Window.height // ROW_HEIGHT)
+    # A partly visible row at the bottom may come first as well.
+    assert set(Row.created[:len(visible) + 1]) >= set(visible)
+    assert texts(layout) == [str(row) for row in range(ROWS)]
+
+
+def test_generator_is_created_in_order(frames):
+    layout = build((entry for entry in spec()), frames)
+    assert Row.created == list(range(ROWS))
+    assert texts(layout) == [str(row) for row in range(ROWS)]
+
+
+def test_children_added_meanwhile_do_not_disturb_the_order(frames):
+    Row.created = []
+    layout      = GridLayout(cols = 1)
+    builder     = ProgressiveBuilder(layout, spec(), budget = 0.001)
+    builder.start()
+    frames()
+    layout.add_widget(Label(text = 'extra'), index = len(layout.children))
+    for _ in range(1000):
+        if builder.done:
+            break
+        frames()
+    assert texts(layout) == ['extra'] + [str(row) for row in range(ROWS)]
+
+
+def test_cancel_removes_the_placeholders(frames):
+    layout  = GridLayout(cols = 1)
+    builder = ProgressiveBuilder(layout, spec(), budget = 0.001)
+    builder.start()
+    frames()
+    builder.cancel()
+    assert all(isinstance(child, Row) for child in layout.children)
+    assert builder.done
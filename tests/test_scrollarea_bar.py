@@ -0,0 +1,50 @@
+"""Tests of the scroll bar that the ScrollArea creates on demand."""
+
+from kivy.core.window import Window
+from kivy.uix.widget import Widget
+
+from cucoloris import FormControl, ScrollArea, ScrollBar
+
+
+def test_bar_exists_only_while_content_overflows(frames):
+    area        = ScrollArea(size_hint = (None, None))
+    area.size   = (200, 100)
+    content     = Widget(size_hint = (None, None), size = (180, 50))
+    area.add_widget(content)
+    Window.add_widget(area)
+    frames(2)
+    assert area._bar is None
+    assert not any(isinstance(child, ScrollBar) for child in area.children)
+
+    content.height = 400
+    frames(2)
+    assert area._bar is not None
+    assert area._bar.parent is area
+    assert area._bar.bar_length == 100 * 100 / 400
+
+    content.height = 80
+    frames(2)
+    assert area._bar is None
+    Window.remove_widget(area)
+
+
+def test_released_bar_is_reused():
+    ScrollArea._bar_pool.clear()
+    first   = ScrollArea()
+    bar     = first._acquire_bar()
+    first._release_bar()
+    assert ScrollArea._bar_pool == [bar]
+
+    second  = ScrollArea(bar_fill_color = [1, 0, 0, 1])
+    assert second._acquire_bar() is bar
+    assert list(bar.fill_color) == [1, 0, 0, 1]
+    second._release_bar()
+    ScrollArea._bar_pool.clear()
+
+
+def test_single_line_form_control_has_no_bar(frames):
+    control = FormControl(text = 'Text')
+    Window.add_widget(control)
+    frames(2)
+    assert control._scroll._bar is None
+    Window.remove_widget(control)
@@ -0,0 +1,72 @@
+"""Tests of the recycling data mode of the ScrollArea class."""
+
+import pytest
+from kivy.core.window import Window
+from kivy.factory import Factory
+from kivy.uix.label import Label
+
+from cucoloris import ScrollArea
+
+
+class CountingRow(Label):
+    """Label counting how often its text is set."""
+
+    def __init__(self, **kwargs):
+        self.assigned = 0
+        super(CountingRow, self).__init__(**kwargs)
+
+    def on_text(self, *_):
+        self.assigned += 1
+
+
+Factory.register('CountingRow', cls = CountingRow)
+
+
+@pytest.fixture
+def area(frames):
+    """Returns a ScrollArea of 1000 rows of which ten fit the viewport."""
+    area            = ScrollArea(size_hint = (None, None), row_height = 30)
+    # The kv rule binds the size to the scroll view, so it is set after.
+    area.size       = (300, 300)
+    area.viewclass  = 'CountingRow'
+    area.data       = [{'text': str(row)} for row in range(1000)]
+    Window.add_widget(area)
+    frames(3)
+    yield area
+    Window.remove_widget(area)
+
+
+def shown(area:ScrollArea) -> dict:
+    """Returns the texts of the row widgets by row."""
+    return {row: view.text for row, view in area._pool._active.items()}
+
+
+def test_only_visible_rows_have_widgets(area, frames):
+    first, last = area._pool.visible_range
+    assert (first, last) == (0, 10)
+    assert shown(area) == {row: str(row) for row in range(10)}
+
+    area.scroll_y = 0.5
+    frames(3)
+    first, last = area._pool.visible_range
+    assert last - first <= 11
+    assert shown(area) == {row: str(row) for row in range(first, last)}
+    assert len(area._pool.children) == last - first
+
+
+def test_changed_rows_are_set_again(area, frames):
+    for view in area._pool._active.values():
+        view.assigned = 0
+    data        = list(area.data)
+    data[3]     = {'text': 'changed', 'bold': True}
+    area.data   = data
+    frames()
+    assigned    = {row: view.assigned for row, view in area._pool._active.items()}
+    assert assigned == {row: int(row == 3) for row in range(10)}
+
+    # Keys missing in the new dictionary get their former value.
+    data        = list(area.data)
+    data[3]     = {'text': 'plain'}
+    area.data   = data
+    frames()
+    assert area._pool._active[3].bold is False
@@ -0,0 +1,65 @@
+"""Tests of pulling ScrollArea rows from a data source."""
+
+import threading
+import time
+
+import pytest
+from kivy.core.window import Window
+
+from cucoloris import ScrollArea
+
+
+def pages(total:int, gate:threading.Event = None):
+    """Returns a page callback for the given number of rows."""
+    def source(start:int, count:int) -> list:
+        if gate is not None:
+            gate.wait(5)
+        return [{'text': str(row)} for row in range(start, min(start + count, total))]
+    return source
+
+
+def wait_for(condition, frames, timeout:float = 5.0):
+    """Advances frames until the condition is met."""
+    end = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < end, 'Timed out.'
+        frames()
+
+
+@pytest.fixture
+def area():
+    """Returns a ScrollArea of label rows inside the window."""
+    area            = ScrollArea(size_hint = (None, None), row_height = 30, page_size = 50,
+                                 prefetch_rows = 10)
+    area.size       = (300, 300)
+    area.viewclass  = 'Label'
+    Window.add_widget(area)
+    yield area
+    Window.remove_widget(area)
+
+
+def test_pages_are_pulled_while_scrolling(area, frames):
+    area.data_source = pages(120)
+    wait_for(lambda: len(area.data) == 50, frames)
+    assert [row['text'] for row in area.data[:3]] == ['0', '1', '2']
+
+    area.scroll_y = 0
+    wait_for(lambda: len(area.data) == 100, frames)
+    area.scroll_y = 0
+    wait_for(lambda: len(area.data) == 120, frames)
+    frames(3)
+    assert area._exhausted
+    assert [row['text'] for row in area.data] == [str(row) for row in range(120)]
+
+
+def test_page_arriving_without_data_mode_is_discarded(area, frames):
+    gate                = threading.Event()
+    area.data_source    = pages(120, gate)
+    frames()
+    area.viewclass      = None
+    gate.set()
+    frames(10)
+    assert area.data == []
+
+    area.viewclass      = 'Label'
+    wait_for(lambda: len(area.data) == 50, frames)
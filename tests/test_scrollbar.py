@@ -0,0 +1,32 @@
+"""Tests of the scroll bar length and the layers it draws."""
+
+from cucoloris import ScrollBar
+from cucoloris._render import Render
+
+
+def test_bar_length_is_raised_to_the_rounded_corners(frames):
+    bar = ScrollBar(bar_orientation = 'vertical', radius = [4, 4, 4, 4])
+    bar.bar_length = 3
+    assert bar.bar_length == 8
+    frames()
+    assert bar.height == 8
+
+    bar.bar_length = 50
+    assert bar.bar_length == 50
+    bar.radius = [30, 30, 30, 30]
+    assert bar.bar_length == 60
+
+
+def test_bar_length_follows_the_orientation():
+    bar = ScrollBar(bar_orientation = 'horizontal', radius = [10, 2, 2, 10])
+    bar.bar_length = 0
+    assert bar.bar_length == 12
+    bar.bar_orientation = 'vertical'
+    assert bar.bar_length == 20
+
+
+def test_thumb_draws_a_single_layer(frames):
+    bar = ScrollBar(bar_orientation = 'vertical')
+    frames()
+    assert Render.is_detached(bar.border, 'overdraw')
+    assert not Render.is_detached(bar.fill)
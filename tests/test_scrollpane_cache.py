@@ -0,0 +1,51 @@
+"""Tests of caching the content of a ScrollPane in a texture."""
+
+from kivy.core.window import Window
+
+from cucoloris import Box, ScrollArea
+
+
+def build(frames) -> tuple:
+    """Returns a caching ScrollArea and its Box content."""
+    area        = ScrollArea(size_hint = (None, None), cache_content = True)
+    area.size   = (200, 300)
+    content     = Box(size_hint = (None, None), size = (200, 1000))
+    area.add_widget(content)
+    Window.add_widget(area)
+    frames(2)
+    return area, content
+
+
+def test_content_is_drawn_into_the_texture(frames):
+    area, content   = build(frames)
+    scroll          = area._scroll
+    assert content.canvas in scroll._cache_fbo.children
+    assert content.canvas not in scroll.canvas_viewport.children
+
+    area.cache_content = False
+    frames()
+    assert content.canvas in scroll.canvas_viewport.children
+    assert scroll._cache_fbo is None
+    Window.remove_widget(area)
+
+
+def test_hidden_content_is_not_drawn(frames):
+    area, content   = build(frames)
+    scroll          = area._scroll
+    group           = scroll._cache_group
+    content.visible = False
+    frames()
+    assert group.children == []
+
+    content.visible = True
+    frames()
+    assert scroll._cache_draw in group.children
+
+    # Hidden content stays hidden when the cache is dropped.
+    content.visible     = False
+    area.cache_content  = False
+    frames()
+    assert content.canvas not in scroll.canvas_viewport.children
+    content.visible     = True
+    assert content.canvas in scroll.canvas_viewport.children
+    Window.remove_widget(area)
@@ -0,0 +1,57 @@
+"""Tests of the clipping modes of the ScrollPane class."""
+
+from kivy.core.window import Window
+from kivy.graphics import ScissorPush, StencilPush
+from kivy.uix.widget import Widget
+
+from cucoloris import ScrollArea
+
+
+def instructions(area:ScrollArea) -> set:
+    """Returns the types of the clipping instructions of the area."""
+    return {type(instruction) for instruction in area._scroll._clip_before.children}
+
+
+def test_scissor_mode_clips_in_window_coordinates(frames):
+    area        = ScrollArea(size_hint = (None, None), clip_mode = 'scissor')
+    area.size   = (200, 100)
+    area.pos    = (30, 40)
+    area.add_widget(Widget(size_hint = (None, None), size = (200, 400)))
+    Window.add_widget(area)
+    frames(2)
+    assert ScissorPush in instructions(area)
+    assert StencilPush not in instructions(area)
+    scissor = area._scroll._clip_scissor
+    assert (scissor.x, scissor.y, scissor.width, scissor.height) == (30, 40, 200, 100)
+    Window.remove_widget(area)
+
+
+def test_auto_mode_uses_the_stencil_for_rounded_corners(frames):
+    area        = ScrollArea(size_hint = (None, None), clip_mode = 'auto')
+    area.size   = (200, 100)
+    Window.add_widget(area)
+    frames(2)
+    assert ScissorPush in instructions(area)
+
+    area.clip_radius = [6, 6, 6, 6]
+    frames(2)
+    assert StencilPush in instructions(area)
+    Window.remove_widget(area)
+
+
+def test_nested_scissor_follows_the_outer_scroll_position(frames):
+    outer           = ScrollArea(size_hint = (None, None))
+    outer.size      = (200, 100)
+    content         = Widget(size_hint = (None, None), size = (200, 400))
+    inner           = ScrollArea(size_hint = (None, None), clip_mode = 'scissor')
+    inner.size      = (200, 50)
+    content.add_widget(inner)
+    outer.add_widget(content)
+    Window.add_widget(outer)
+    outer.scroll_y  = 0
+    frames(3)
+    bottom          = inner._scroll._clip_scissor.y
+    outer.scroll_y  = 0.5
+    frames(3)
+    assert inner._scroll._clip_scissor.y == bottom - 150
+    Window.remove_widget(outer)
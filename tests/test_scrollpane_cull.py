@@ -0,0 +1,72 @@
+"""Tests of culling children outside the viewport of a ScrollPane."""
+
+import random
+
+from kivy.core.window import Window
+from kivy.uix.widget import Widget
+
+from cucoloris import ScrollArea
+from cucoloris._render import Render
+
+
+def drawn(area:ScrollArea, content:Widget) -> set:
+    """Returns the children drawn according to the geometry."""
+    scroll          = area._scroll
+    bottom          = scroll.y - scroll.g_translate.y
+    top             = bottom + scroll.height
+    return {child for child in content.children if child.top >= bottom and child.y <= top}
+
+
+def build(frames, **kwargs) -> tuple:
+    """Returns a culling ScrollArea and its content of 100 rows."""
+    area        = ScrollArea(size_hint = (None, None), cull_content = True, **kwargs)
+    area.size   = (200, 300)
+    content     = Widget(size_hint = (None, None), size = (200, 3000))
+    for row in range(100):
+        content.add_widget(Widget(size_hint = (None, None), size = (200, 30), y = row * 30))
+    area.add_widget(content)
+    Window.add_widget(area)
+    frames(3)
+    return area, content
+
+
+def not_detached(content:Widget) -> set:
+    """Returns the children that are not excluded from rendering."""
+    return {child for child in content.children if not Render.is_detached(child, 'cull')}
+
+
+def test_only_children_in_view_are_drawn(frames):
+    area, content = build(frames)
+    assert len(not_detached(content)) < 15
+    assert not_detached(content) == drawn(area, content)
+
+    for scroll_y in (0.5, 0.0, 0.73):
+        area.scroll_y = scroll_y
+        frames(2)
+        assert not_detached(content) == drawn(area, content)
+    Window.remove_widget(area)
+
+
+def test_moved_and_removed_children_are_updated(frames):
+    area, content   = build(frames)
+    shuffle         = random.Random(3)
+    for _ in range(20):
+        child   = shuffle.choice(content.children)
+        child.y = shuffle.randrange(0, 2970)
+        frames()
+        assert not_detached(content) == drawn(area, content)
+
+    child = next(iter(not_detached(content) ^ set(content.children)))
+    content.remove_widget(child)
+    assert not Render.is_detached(child)
+    Window.remove_widget(area)
+
+
+def test_culling_is_opt_in(frames):
+    assert ScrollArea().cull_content is False
+
+    area, content        = build(frames)
+    area.cull_content    = False
+    frames(2)
+    assert not_detached(content) == set(content.children)
+    Window.remove_widget(area)
@@ -0,0 +1,52 @@
+"""Tests of the Template class."""
+
+from kivy.factory import Factory
+
+from cucoloris import Template
+
+
+def test_prepare_builds_widgets_in_slices(frames):
+    template = Template('BtnPrimary', budget = 0, size_hint = (None, None))
+    template.prepare(3)
+    assert template.prepared == 0
+    while not template.prepared:
+        frames()
+    assert template.prepared == 1
+    frames()
+    assert template.prepared == 2
+    frames(5)
+    assert template.prepared == 3
+    assert template._event is None
+
+
+def test_create_hands_out_prepared_widgets(frames):
+    calls       = []
+    template    = Template(Factory.BtnPrimary, text = 'Default',
+                           on_release = lambda *_: calls.append('default'))
+    template.prepare(2)
+    frames(3)
+    prepared    = list(template._prepared)
+
+    widget = template.create(text = 'Row', on_press = lambda *_: calls.append('row'))
+    assert widget is prepared[-1]
+    assert widget.text == 'Row'
+    assert isinstance(widget, Factory.BtnPrimary)
+    assert template.prepared == 1
+    widget.dispatch('on_press', None)
+    widget.dispatch('on_release', None)
+    assert calls == ['row', 'default']
+
+    assert template.create().text == 'Default'
+    fresh = template.create()
+    assert fresh not in prepared
+    assert fresh.text == 'Default'
+
+
+def test_cancel_stops_preparing(frames):
+    template = Template('BtnPrimary', budget = 0)
+    template.prepare(10)
+    while not template.prepared:
+        frames()
+    template.cancel()
+    frames(3)
+    assert template.prepared == 1
@@ -0,0 +1,131 @@
+"""Tests of the Transition class."""
+
+from asyncio import CancelledError, ensure_future, gather, sleep
+
+import pytest
+from kivy.animation import Animation
+from kivy.uix.widget import Widget
+
+from cucoloris import Transition
+
+
+def start(widget:Widget, duration:float = 0.1, **values) -> Transition:
+    """Starts an animation on the widget and returns its transition."""
+    animation = Animation(duration = duration, **values)
+    animation.start(widget)
+    return Transition([(animation, widget)])
+
+
+async def wait(transition:Transition):
+    """Awaits the transition."""
+    await transition
+
+
+async def both(first, second):
+    """Runs two coroutines concurrently and returns the first's result."""
+    return (await gather(first, second))[0]
+
+
+def test_await_completes_with_the_animation(run_async):
+    widget      = Widget(x = 0)
+    transition  = start(widget, x = 100)
+
+    run_async(wait(transition))
+    assert widget.x == 100
+    assert transition.done
+    assert not transition.cancelled
+
+
+def test_transition_without_animations_is_complete(run_async):
+    transition = Transition()
+    assert transition.done
+    run_async(wait(transition))
+
+
+def test_cancel_stops_the_animation_and_raises(run_async):
+    widget      = Widget(x = 0)
+    transition  = start(widget, duration = 10, x = 100)
+
+    async def cancel_later():
+        await sleep(0)
+        transition.cancel()
+
+    with pytest.raises(CancelledError):
+        run_async(both(wait(transition), cancel_later()))
+    assert transition.cancelled
+    reached = widget.x
+    run_async(sleep(0.05))
+    assert widget.x == reached < 100
+
+    with pytest.raises(CancelledError):
+        run_async(wait(transition))
+
+
+def test_cancelling_the_awaiting_task_cancels_the_transition(run_async):
+    widget      = Widget(x = 0)
+    transition  = start(widget, duration = 10, x = 100)
+
+    async def cancel_waiter():
+        waiter = ensure_future(wait(transition))
+        await sleep(0)
+        waiter.cancel()
+        with pytest.raises(CancelledError):
+            await waiter
+
+    run_async(cancel_waiter())
+    assert transition.cancelled
+    reached = widget.x
+    run_async(sleep(0.05))
+    assert widget.x == reached < 100
+
+
+def test_gather_waits_for_all_and_cancels_all(run_async):
+    first, second   = Widget(x = 0), Widget(y = 0)
+    short, long     = start(first, x = 100), start(second, duration = 0.3, y = 100)
+    run_async(wait(Transition.gather(short, long)))
+    assert first.x == 100 and second.y == 100
+
+    short, long     = start(first, duration = 10, x = 0), start(second, duration = 10, y = 0)
+    gathered        = Transition.gather(short, long)
+    gathered.cancel()
+    assert short.cancelled and long.cancelled
+    with pytest.raises(CancelledError):
+        run_async(wait(short))
+
+
+def test_animation_cancelled_from_outside_cancels_the_transition(run_async):
+    widget      = Widget(x = 0)
+    transition  = start(widget, duration = 10, x = 100)
+
+    async def cancel_animations():
+        await sleep(0)
+        Animation.cancel_all(widget)
+
+    with pytest.raises(CancelledError):
+        run_async(both(wait(transition), cancel_animations()))
+    assert transition.cancelled
+
+
+def test_transition_follows_its_animations_only_once_awaited(run_async):
+    widget      = Widget(x = 0)
+    animation   = Animation(duration = 0.05, x = 100)
+    animation.start(widget)
+    transition  = Transition([(animation, widget)])
+    assert not animation.get_property_observers('on_complete')
+    assert transition not in Transition._watched
+    assert not transition.done
+
+    run_async(wait(transition))
+    assert transition.done
+    assert not animation.get_property_observers('on_complete')
+
+
+def test_fire_and_forget_transition_completes(run_async):
+    widget      = Widget(x = 0)
+    transition  = start(widget, duration = 0.05, x = 100)
+    run_async(sleep(0.2))
+    assert widget.x == 100
+    assert transition.done
+    assert not transition.cancelled
+    transition.cancel()
+    assert not transition.cancelled
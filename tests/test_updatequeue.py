@@ -0,0 +1,94 @@
+"""Tests of the UpdateQueue class."""
+
+import threading
+
+import pytest
+from kivy.event import EventDispatcher
+from kivy.properties import NumericProperty
+
+from cucoloris import UpdateQueue
+
+
+class Gauge(EventDispatcher):
+    """Event dispatcher recording the order properties are set in."""
+
+    a = NumericProperty(0)
+    b = NumericProperty(0)
+    c = NumericProperty(0)
+
+    def __init__(self, **kwargs):
+        super(Gauge, self).__init__(**kwargs)
+        self.applied = []
+        for name in ('a', 'b', 'c'):
+            self.fbind(name, lambda _, value, name = name: self.applied.append((name, value)))
+
+
+@pytest.fixture(autouse = True)
+def empty_queue(frames):
+    """Makes sure no update is left over from another test."""
+    frames(2)
+    assert UpdateQueue.pending() == 0
+    yield
+    frames(2)
+
+
+def test_merges_posts_of_the_same_property(frames):
+    gauge = Gauge()
+    UpdateQueue.post(gauge, 'a', 1)
+    UpdateQueue.post(gauge, 'b', 2)
+    UpdateQueue.post(gauge, 'a', 3)
+    assert UpdateQueue.pending() == 2
+    assert gauge.applied == []
+
+    frames()
+    assert gauge.applied == [('a', 3), ('b', 2)]
+    assert UpdateQueue.pending() == 0
+
+
+def test_merges_posts_from_threads(frames):
+    gauges  = [Gauge() for _ in range(4)]
+    threads = [threading.Thread(target = lambda gauge = gauge: [UpdateQueue.post(gauge, 'a', value)
+                                                                for value in range(1, 1001)])
+               for gauge in gauges]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert UpdateQueue.pending() == 4
+
+    frames()
+    for gauge in gauges:
+        assert gauge.a == 1000
+        assert len(gauge.applied) == 1
+
+
+def test_carries_over_updates_beyond_the_budget(frames, monkeypatch):
+    # Applies a single update per frame.
+    monkeypatch.setattr(UpdateQueue, 'BUDGET', -1)
+    gauge = Gauge()
+    UpdateQueue.post(gauge, 'a', 1)
+    UpdateQueue.post(gauge, 'b', 1)
+    UpdateQueue.post(gauge, 'c', 1)
+
+    frames()
+    assert gauge.applied == [('a', 1)]
+    assert UpdateQueue.pending() == 2
+
+    # Newer values replace carried-over ones but keep their place.
+    UpdateQueue.post(gauge, 'c', 2)
+    UpdateQueue.post(gauge, 'a', 2)
+    frames()
+    assert gauge.applied == [('a', 1), ('b', 1)]
+
+    frames(2)
+    assert gauge.applied == [('a', 1), ('b', 1), ('c', 2), ('a', 2)]
+    assert UpdateQueue.pending() == 0
+
+
+def test_failing_update_does_not_block_the_queue(frames):
+    gauge = Gauge()
+    UpdateQueue.post(gauge, 'a', 'not a number')
+    UpdateQueue.post(gauge, 'b', 5)
+    frames()
+    assert gauge.applied == [('b', 5)]
+    assert UpdateQueue.pending() == 0
@@ -0,0 +1,80 @@
+"""Tests of hiding widgets with the visible attribute."""
+
+from kivy.core.window import Window
+
+from cucoloris import Box, ColorLabel
+from cucoloris._render import Render
+
+
+def test_hidden_box_is_not_drawn(frames):
+    box = Box()
+    Window.add_widget(box)
+    frames()
+    assert box.canvas in Window.canvas.children
+
+    box.visible = False
+    assert box.canvas not in Window.canvas.children
+    assert Render.is_detached(box, 'hidden')
+
+    box.visible = True
+    assert box.canvas in Window.canvas.children
+    Window.remove_widget(box)
+
+
+def test_hidden_subtree_receives_no_touches(frames, touch):
+    outer   = Box(touch_policy = 'propagate', size = (200, 200))
+    inner   = Box(size = (100, 100))
+    outer.add_widget(inner)
+    Window.add_widget(outer)
+    frames()
+    presses = []
+    inner.bind(on_press = lambda *_: presses.append('inner'))
+    outer.bind(on_press = lambda *_: presses.append('outer'))
+
+    outer.visible = False
+    assert not inner.isshown()
+    tap = touch(50, 50)
+    tap.touch_down()
+    tap.touch_up()
+    assert presses == []
+
+    outer.visible = True
+    assert inner.isshown()
+    tap = touch(50, 50)
+    tap.touch_down()
+    tap.touch_up()
+    assert sorted(presses) == ['inner', 'outer']
+    Window.remove_widget(outer)
+
+
+def test_hiding_ends_hover_and_press(frames, touch):
+    box     = Box(size = (100, 100))
+    Window.add_widget(box)
+    events  = []
+    box.bind(on_enter = lambda *_: events.append('enter'),
+             on_leave = lambda *_: events.append('leave'))
+    frames()
+    Window.mouse_pos = (50, 50)
+    frames()
+    assert events == ['enter']
+    tap = touch(50, 50)
+    tap.touch_down()
+    assert box.ispressed()
+
+    box.visible = False
+    assert events == ['enter', 'leave']
+    assert not box.ispressed()
+    tap.touch_up()
+    Window.remove_widget(box)
+    Window.mouse_pos = (700, 500)
+
+
+def test_hidden_label_is_not_drawn(frames):
+    label = ColorLabel(text = 'Label')
+    Window.add_widget(label)
+    frames()
+    label.visible = False
+    assert label.canvas not in Window.canvas.children
+    label.visible = True
+    assert label.canvas in Window.canvas.children
+    Window.remove_widget(label)